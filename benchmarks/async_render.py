@@ -0,0 +1,137 @@
+"""
+Compare ways of rendering a formset with model choice fields from an async
+view, through Django's ASGI handler.
+
+Each round sends concurrent requests for the formset with a request to a
+view which counts rows with the async ORM, and reports the time taken for
+all of them and for the ORM request alone. Rendering with
+``sync_to_async(render_crispy_form)`` runs every render in the one thread
+used for the ORM, so the ORM request waits for the renders ahead of it.
+``FormHelper.arender`` fetches the choices with the async ORM and renders
+in other threads.
+"""
+
+import asyncio
+import os
+import tempfile
+import time
+
+from tests.utils import configure_django
+
+DATABASE = tempfile.NamedTemporaryFile(suffix=".sqlite3", delete=False).name
+
+configure_django(
+    ALLOWED_HOSTS=["testserver"],
+    ROOT_URLCONF=__name__,
+    DATABASES={
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": DATABASE,
+        }
+    },
+)
+
+from django import forms  # noqa: E402
+from django.db import connection  # noqa: E402
+from django.http import HttpResponse  # noqa: E402
+from django.test import AsyncClient  # noqa: E402
+from django.urls import path  # noqa: E402
+
+from asgiref.sync import sync_to_async  # noqa: E402
+from crispy_forms.utils import render_crispy_form  # noqa: E402
+
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+from tbxforms.helper import FormHelper  # noqa: E402
+from tests.models import Authority  # noqa: E402
+
+ROWS = 10
+CHOICES = 20
+REQUESTS = 8
+ROUNDS = 5
+
+BenchmarkForm = type(
+    "BenchmarkForm",
+    (TbxFormsMixin, forms.Form),
+    {
+        "name": forms.CharField(help_text="Help text"),
+        "home": forms.ModelChoiceField(
+            Authority.objects.all(), widget=forms.RadioSelect
+        ),
+        "work": forms.ModelChoiceField(Authority.objects.all()),
+    },
+)
+
+BenchmarkFormSet = forms.formset_factory(BenchmarkForm, extra=ROWS)
+
+helper = FormHelper()
+
+
+async def render_sync(request):
+    html = await sync_to_async(render_crispy_form)(
+        BenchmarkFormSet(), helper=helper
+    )
+    return HttpResponse(html)
+
+
+async def render_async(request):
+    return HttpResponse(await helper.arender(BenchmarkFormSet()))
+
+
+async def count(request):
+    return HttpResponse(str(await Authority.objects.acount()))
+
+
+urlpatterns = [
+    path("sync/", render_sync),
+    path("async/", render_async),
+    path("count/", count),
+]
+
+
+async def timed(coroutine):
+    start = time.perf_counter()
+    await coroutine
+    return time.perf_counter() - start
+
+
+async def run(url):
+    client = AsyncClient()
+    totals = []
+    latencies = []
+    for index in range(ROUNDS):
+        start = time.perf_counter()
+        results = await asyncio.gather(
+            *[client.get(url) for index in range(REQUESTS)],
+            timed(client.get("/count/")),
+        )
+        totals.append(time.perf_counter() - start)
+        latencies.append(results[-1])
+    return min(totals), min(latencies)
+
+
+def setup():
+    with connection.schema_editor() as editor:
+        editor.create_model(Authority)
+    Authority.objects.bulk_create(
+        [Authority(name="Authority %d" % index) for index in range(CHOICES)]
+    )
+
+
+def main():
+    setup()
+    try:
+        for name, url in (
+            ("sync_to_async(render_crispy_form)", "/sync/"),
+            ("FormHelper.arender", "/async/"),
+        ):
+            total, latency = asyncio.run(run(url))
+            print(
+                "%s: %.1fms for %d requests, ORM request %.1fms"
+                % (name, total * 1000, REQUESTS, latency * 1000)
+            )
+    finally:
+        os.unlink(DATABASE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Measure the memory allocated for 10,000 choices, and for each instance of a
+form with a 10,000 choice field.
+"""
+
+import tracemalloc
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+
+from tbxforms.choices import (  # noqa: E402
+    Choice,
+    ChoiceList,
+)
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+
+CHOICES = 10000
+
+VALUES = [
+    ("value-%d" % index, "Label %d" % index, "Hint %d" % index)
+    for index in range(CHOICES)
+]
+
+
+def build_choices():
+    return [
+        Choice(value, label, hint=hint) if index % 2 else Choice(value, label)
+        for index, (value, label, hint) in enumerate(VALUES)
+    ]
+
+
+BenchmarkForm = type(
+    "BenchmarkForm",
+    (TbxFormsMixin, forms.Form),
+    {
+        "option": forms.ChoiceField(
+            choices=ChoiceList(build_choices()), widget=forms.RadioSelect
+        )
+    },
+)
+
+
+def allocated(factory):
+    """
+    Return the number of bytes still allocated by the object returned by
+    the factory. The labels and values are not included.
+    """
+    factory()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instance = factory()  # noqa: F841
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return sum(stat.size_diff for stat in stats)
+
+
+def main():
+    print("%d choices: %d bytes" % (CHOICES, allocated(build_choices)))
+    print("form instance: %d bytes" % allocated(BenchmarkForm))
+
+
+if __name__ == "__main__":
+    main()
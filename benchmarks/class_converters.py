@@ -0,0 +1,93 @@
+"""
+Compare looking up the CSS classes for a widget with the precomputed table
+against rebuilding the converters on every field, on a 100-field form.
+"""
+
+import timeit
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+from django.conf import settings  # noqa: E402
+
+from crispy_forms.utils import render_crispy_form  # noqa: E402
+
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+from tbxforms.templatetags.tbxforms import (  # noqa: E402
+    CLASS_CONVERTERS,
+    get_widget_classes,
+)
+
+FIELDS = 100
+NUMBER = 200
+
+WIDGETS = (
+    forms.TextInput,
+    forms.EmailInput,
+    forms.NumberInput,
+    forms.Textarea,
+    forms.Select,
+)
+
+
+def build_form():
+    fields = {}
+    for index in range(FIELDS):
+        widget = WIDGETS[index % len(WIDGETS)]
+        fields["field_%d" % index] = forms.CharField(widget=widget)
+    return type("BenchmarkForm", (TbxFormsMixin, forms.Form), fields)
+
+
+def rebuilt_widget_classes(widget_class):
+    """
+    The lookup as it was done before the table was precomputed.
+    """
+    converters = dict(CLASS_CONVERTERS)
+    converters.update(getattr(settings, "CRISPY_CLASS_CONVERTERS", {}))
+    class_name = widget_class.__name__.lower()
+    class_name = converters.get(class_name, class_name)
+    return class_name.split() if class_name else []
+
+
+def lookup(function, widget_classes):
+    def run():
+        for widget_class in widget_classes:
+            function(widget_class)
+
+    return run
+
+
+def report(name, seconds, per):
+    print("%-12s %10.2f µs per %s" % (name, seconds * 1e6 / NUMBER, per))
+
+
+def main():
+    form_class = build_form()
+    widget_classes = [
+        field.widget.__class__ for field in form_class.base_fields.values()
+    ]
+
+    rebuilt = timeit.timeit(
+        lookup(rebuilt_widget_classes, widget_classes), number=NUMBER
+    )
+    precomputed = timeit.timeit(
+        lookup(get_widget_classes, widget_classes), number=NUMBER
+    )
+    render = timeit.timeit(
+        lambda: render_crispy_form(form_class()), number=NUMBER // 10
+    )
+
+    print("Lookups for a %d-field form:" % FIELDS)
+    report("rebuilt", rebuilt, "form")
+    report("precomputed", precomputed, "form")
+    print(
+        "Saving: %.3f µs per field"
+        % ((rebuilt - precomputed) * 1e6 / NUMBER / FIELDS)
+    )
+    print("Full render: %.2f ms per form" % (render * 1e3 / (NUMBER // 10)))
+
+
+if __name__ == "__main__":
+    main()
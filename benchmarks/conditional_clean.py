@@ -0,0 +1,110 @@
+"""
+Clean a form with one trigger and BRANCHES conditional branches of FIELDS
+fields each, where only one branch is shown, with every field submitted as
+a browser without JavaScript would.
+
+The fields of the hidden branches are inactive so they are not cleaned. The
+same form with its inactive fields cleaned is timed for comparison.
+"""
+
+import time
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+
+from tbxforms.fields import DateInputField  # noqa: E402
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+from tbxforms.layout import (  # noqa: E402
+    Div,
+    Field,
+    Layout,
+)
+
+BRANCHES = 10
+FIELDS = 5
+NUMBER = 500
+
+CHOICES = [("branch_%d" % index, "Branch") for index in range(BRANCHES)]
+
+
+def build_form_class():
+    attrs = {
+        "branch": forms.ChoiceField(choices=CHOICES, widget=forms.RadioSelect)
+    }
+    branches = []
+    for branch, label in CHOICES:
+        names = []
+        for index in range(FIELDS):
+            attrs["%s_email_%d" % (branch, index)] = forms.EmailField(
+                required=False
+            )
+            attrs["%s_date_%d" % (branch, index)] = DateInputField(
+                required=False
+            )
+            names.extend(
+                [
+                    "%s_email_%d" % (branch, index),
+                    "%s_date_%d" % (branch, index),
+                ]
+            )
+        branches.append(
+            Div(
+                *[Field(name) for name in names],
+                data_conditional={"field_name": "branch", "values": [branch]},
+            )
+        )
+    attrs["build_layout"] = classmethod(
+        lambda cls: Layout(Field.radios("branch"), *branches)
+    )
+    return type("BranchForm", (TbxFormsMixin, forms.Form), attrs)
+
+
+def build_data(form_class):
+    data = {"branch": "branch_0"}
+    for name, field in form_class.base_fields.items():
+        if isinstance(field, DateInputField):
+            data.update(
+                {name + "_0": "1", name + "_1": "2", name + "_2": "2000"}
+            )
+        elif name != "branch":
+            data[name] = "homer@example.com"
+    return data
+
+
+def time_clean(form_class, data):
+    """
+    Return the time taken to clean NUMBER instances of the form, built
+    beforehand so only the cleaning is timed.
+    """
+    instances = [form_class(data=data) for index in range(NUMBER)]
+    start = time.perf_counter()
+    for form in instances:
+        form.is_valid()
+    return time.perf_counter() - start
+
+
+def main():
+    form_class = build_form_class()
+    data = build_data(form_class)
+
+    class CleanAllForm(form_class):
+        def get_inactive_fields(self):
+            return frozenset()
+
+    form = form_class(data=data)
+    assert form.is_valid(), form.errors
+    assert len(form.inactive_fields) == (BRANCHES - 1) * FIELDS * 2
+
+    clean_all = time_clean(CleanAllForm, data)
+    skip = time_clean(form_class, data)
+
+    print("%d branches of %d fields, 1 shown" % (BRANCHES, FIELDS * 2))
+    print("Clean every field: %.3fms" % (clean_all / NUMBER * 1000))
+    print("Skip inactive fields: %.3fms" % (skip / NUMBER * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compare validating 50,000 day/month/year triples, as read from an imported
+file, with DateInputField.clean_many() and with a loop calling clean() for
+each row.
+"""
+
+import random
+import timeit
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django.core.exceptions import ValidationError  # noqa: E402
+
+from tbxforms.fields import DateInputField  # noqa: E402
+
+ROWS = 50000
+INVALID = 0.05
+NUMBER = 3
+
+
+def build_rows():
+    generator = random.Random(0)
+    rows = []
+    for index in range(ROWS):
+        if generator.random() < INVALID:
+            rows.append(("31", "2", str(generator.randint(1900, 2020))))
+        else:
+            rows.append(
+                (
+                    str(generator.randint(1, 28)),
+                    str(generator.randint(1, 12)),
+                    str(generator.randint(1900, 2020)),
+                )
+            )
+    return rows
+
+
+def loop(field, rows):
+    dates = []
+    errors = []
+    for row in rows:
+        try:
+            dates.append(field.clean(list(row)))
+            errors.append([])
+        except ValidationError as e:
+            dates.append(None)
+            errors.append(e.messages)
+    return dates, errors
+
+
+class FullDateInputField(DateInputField):
+    """
+    A DateInputField which always runs the full validation, as clean() did
+    before the fast path was added.
+    """
+
+    def parse_date(self, value):
+        return None
+
+
+def main():
+    rows = build_rows()
+    field = DateInputField()
+
+    assert field.clean_many(rows) == loop(FullDateInputField(), rows)
+
+    full = timeit.timeit(
+        lambda: loop(FullDateInputField(), rows), number=NUMBER
+    )
+    looped = timeit.timeit(lambda: loop(field, rows), number=NUMBER)
+    bulk = timeit.timeit(lambda: field.clean_many(rows), number=NUMBER)
+
+    print("%d rows, %d%% invalid" % (ROWS, INVALID * 100))
+    print("clean() loop, full validation: %.3fs" % (full / NUMBER))
+    print("clean() loop: %.3fs" % (looped / NUMBER))
+    print("clean_many(): %.3fs" % (bulk / NUMBER))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measure the memory allocated, and the time taken, to create DateInputFields
+and DateInputWidgets, and to instantiate a form with 20 date fields.
+"""
+
+import timeit
+import tracemalloc
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+
+from tbxforms.fields import DateInputField  # noqa: E402
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+from tbxforms.widgets import DateInputWidget  # noqa: E402
+
+INSTANCES = 1000
+NUMBER = 1000
+
+
+BenchmarkForm = type(
+    "BenchmarkForm",
+    (TbxFormsMixin, forms.Form),
+    {"date_%d" % index: DateInputField() for index in range(20)},
+)
+
+
+def allocated(factory):
+    """
+    Return the number of bytes still allocated per instance after creating
+    INSTANCES objects.
+    """
+    factory()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    instances = [factory() for index in range(INSTANCES)]  # noqa: F841
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    return sum(stat.size_diff for stat in stats) / INSTANCES
+
+
+def main():
+    for name, factory in (
+        ("DateInputField", DateInputField),
+        ("DateInputWidget", DateInputWidget),
+        ("BenchmarkForm", BenchmarkForm),
+    ):
+        size = allocated(factory)
+        duration = timeit.timeit(factory, number=NUMBER) / NUMBER
+        print(
+            "%s: %.0f bytes, %.1fus per instance"
+            % (name, size, duration * 1000000)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Compare rendering a formset with its forms rendered one after another and
+in parallel with 1 to 8 threads.
+
+The forms are rendered twice: as they are, which is bound by the CPU, and
+with a widget which waits for 2ms, standing in for a lookup over the
+network. With the GIL only the second can be made faster by more threads.
+"""
+
+import sys
+import time
+import timeit
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+
+from tbxforms.fields import DateInputField  # noqa: E402
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+from tbxforms.helper import FormHelper  # noqa: E402
+
+ROWS = 50
+NUMBER = 5
+THREADS = (None, 1, 2, 4, 8)
+
+CHOICES = (("email", "Email"), ("phone", "Phone"), ("text", "Text"))
+
+
+class SlowTextInput(forms.TextInput):
+    def get_context(self, name, value, attrs):
+        time.sleep(0.002)
+        return super().get_context(name, value, attrs)
+
+
+def get_formset_class(widget):
+    form_class = type(
+        "BenchmarkForm",
+        (TbxFormsMixin, forms.Form),
+        {
+            "name": forms.CharField(help_text="Help text", widget=widget),
+            "contact": forms.ChoiceField(
+                choices=CHOICES, widget=forms.RadioSelect
+            ),
+            "date": DateInputField(),
+        },
+    )
+    return forms.formset_factory(form_class, extra=ROWS)
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("GIL %s" % ("enabled" if gil else "disabled"))
+
+    for name, widget in (
+        ("CPU bound", forms.TextInput),
+        ("with 2ms wait", SlowTextInput),
+    ):
+        formset_class = get_formset_class(widget)
+        expected = None
+        for threads in THREADS:
+            helper = FormHelper()
+            helper.render_threads = threads
+            html = helper.render_formset(formset_class())
+            assert expected is None or html == expected
+            expected = html
+
+            duration = timeit.timeit(
+                lambda: helper.render_formset(formset_class()), number=NUMBER
+            )
+            print(
+                "%s, %s: %.1fms per formset"
+                % (
+                    name,
+                    "%d threads" % threads if threads else "sequential",
+                    duration / NUMBER * 1000,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Compare checking which choices are selected in a 10,000 option checkbox
+group by searching the field value against a set of the selected values.
+"""
+
+import timeit
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+from django.template.defaultfilters import stringformat  # noqa: E402
+
+from crispy_forms.utils import render_crispy_form  # noqa: E402
+
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+from tbxforms.templatetags.tbxforms import selected_values  # noqa: E402
+
+OPTIONS = 10000
+SELECTED = 1000
+NUMBER = 5
+
+CHOICES = [
+    ("option-%d" % index, "Option %d" % index) for index in range(OPTIONS)
+]
+
+
+class BenchmarkForm(TbxFormsMixin, forms.Form):
+    options = forms.MultipleChoiceField(
+        choices=CHOICES, widget=forms.CheckboxSelectMultiple
+    )
+
+
+def build_form():
+    selected = [value for value, label in CHOICES[:: OPTIONS // SELECTED]]
+    return BenchmarkForm(initial={"options": selected})
+
+
+def search(field):
+    """
+    The check as it was done in the template before the values were
+    normalised: a search of the value for each choice.
+    """
+    value = field.value()
+    for choice in field.field.choices:
+        choice[0] in value or stringformat(choice[0], "s") in value
+
+
+def lookup(field):
+    selected = selected_values(field)
+    for choice in field.field.choices:
+        stringformat(choice[0], "s") in selected
+
+
+def main():
+    form = build_form()
+    field = form["options"]
+
+    searched = timeit.timeit(lambda: search(field), number=NUMBER)
+    looked_up = timeit.timeit(lambda: lookup(field), number=NUMBER)
+    render = timeit.timeit(
+        lambda: render_crispy_form(build_form()), number=NUMBER
+    )
+
+    print("%d options, %d selected:" % (OPTIONS, SELECTED))
+    print("search  %10.2f ms per group" % (searched * 1e3 / NUMBER))
+    print("lookup  %10.2f ms per group" % (looked_up * 1e3 / NUMBER))
+    print("render  %10.2f ms per form" % (render * 1e3 / NUMBER))
+
+
+if __name__ == "__main__":
+    main()
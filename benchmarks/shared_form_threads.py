@@ -0,0 +1,97 @@
+"""
+Render one form instance from 1 to 32 threads at once with the
+``{% crispy_tbx %}`` tag, and check every thread gets the same HTML.
+
+The render path keeps no state on the form, its widgets, the layout or the
+template node, so no locks are needed. With the GIL the renders per second
+stay about the same as threads are added. On a free-threaded build of Python
+they should scale with the number of cores.
+"""
+
+import sys
+import threading
+import time
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+from django.template import (  # noqa: E402
+    Context,
+    Template,
+)
+
+from tbxforms.fields import DateInputField  # noqa: E402
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+
+FIELDS = 5
+RENDERS = 320
+THREADS = (1, 2, 4, 8, 16, 32)
+
+CHOICES = (("email", "Email"), ("phone", "Phone"), ("text", "Text"))
+
+BenchmarkForm = type(
+    "BenchmarkForm",
+    (TbxFormsMixin, forms.Form),
+    {
+        **{
+            "text_%d" % index: forms.CharField(help_text="Help text")
+            for index in range(FIELDS)
+        },
+        **{
+            "radios_%d"
+            % index: forms.ChoiceField(
+                choices=CHOICES, widget=forms.RadioSelect
+            )
+            for index in range(FIELDS)
+        },
+        **{"date_%d" % index: DateInputField() for index in range(FIELDS)},
+    },
+)
+
+TEMPLATE = Template("{% load tbxforms %}{% crispy_tbx form %}")
+
+
+def run(form, threads):
+    """
+    Render the form RENDERS times, split between the threads, and return
+    the time taken and the set of distinct outputs.
+    """
+    barrier = threading.Barrier(threads + 1)
+    outputs = set()
+
+    def render():
+        barrier.wait()
+        for index in range(RENDERS // threads):
+            outputs.add(TEMPLATE.render(Context({"form": form})))
+
+    workers = [threading.Thread(target=render) for index in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start, outputs
+
+
+def main():
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print("GIL %s" % ("enabled" if gil else "disabled"))
+
+    form = BenchmarkForm(data={})
+    form.is_valid()
+    expected = TEMPLATE.render(Context({"form": form}))
+
+    for threads in THREADS:
+        duration, outputs = run(form, threads)
+        assert outputs == {expected}
+        print(
+            "%2d threads: %.0f renders per second"
+            % (threads, RENDERS / duration)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare rendering a 30 field form with the tbxforms template pack and with
+the flattened tbxforms_flat template pack.
+"""
+
+import timeit
+
+from tests.utils import configure_django
+
+configure_django()
+
+from django import forms  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+from crispy_forms.utils import render_crispy_form  # noqa: E402
+
+from tbxforms.fields import DateInputField  # noqa: E402
+from tbxforms.forms import TbxFormsMixin  # noqa: E402
+
+FIELDS = 10
+NUMBER = 100
+
+CHOICES = (("email", "Email"), ("phone", "Phone"), ("text", "Text"))
+
+BenchmarkForm = type(
+    "BenchmarkForm",
+    (TbxFormsMixin, forms.Form),
+    {
+        **{
+            "text_%d" % index: forms.CharField(help_text="Help text")
+            for index in range(FIELDS)
+        },
+        **{
+            "radios_%d"
+            % index: forms.ChoiceField(
+                choices=CHOICES, widget=forms.RadioSelect
+            )
+            for index in range(FIELDS)
+        },
+        **{"date_%d" % index: DateInputField() for index in range(FIELDS)},
+    },
+)
+
+
+def render(template_pack, data):
+    with override_settings(CRISPY_TEMPLATE_PACK=template_pack):
+        return render_crispy_form(BenchmarkForm(data=data))
+
+
+def main():
+    for data in (None, {}):
+        assert render("tbxforms", data) == render("tbxforms_flat", data)
+        for template_pack in ("tbxforms", "tbxforms_flat"):
+            duration = timeit.timeit(
+                lambda: render(template_pack, data), number=NUMBER
+            )
+            print(
+                "%s, %s: %.2fms per render"
+                % (
+                    template_pack,
+                    "unbound" if data is None else "with errors",
+                    duration / NUMBER * 1000,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Compare rendering a 40 field Wagtail form page when the form class is built
+for every request (cold) and when it is taken from the form class cache
+(warm).
+
+Requires Wagtail to be installed.
+"""
+
+import importlib.util
+import sys
+import timeit
+
+from types import SimpleNamespace
+
+from tests import settings
+from tests.utils import configure_django
+
+if importlib.util.find_spec("wagtail") is None:
+    sys.exit("Wagtail is not installed, so this benchmark cannot be run.")
+
+configure_django(
+    INSTALLED_APPS=settings.INSTALLED_APPS
+    + (
+        "django.contrib.auth",
+        "django.contrib.contenttypes",
+        "taggit",
+        "modelcluster",
+        "wagtail",
+        "wagtail.admin",
+        "wagtail.contrib.forms",
+    )
+)
+
+from crispy_forms.utils import render_crispy_form  # noqa: E402
+from wagtail.contrib.forms.forms import (  # noqa: E402
+    BaseForm as WagtailBaseForm,
+)
+
+from tbxforms.forms import (  # noqa: E402
+    BaseWagtailFormBuilder,
+    TbxFormsMixin,
+    clear_form_class_cache,
+)
+
+FIELDS = 40
+NUMBER = 100
+
+FIELD_TYPES = (
+    ("singleline", ""),
+    ("email", ""),
+    ("date", ""),
+    ("checkboxes", "Red, Green, Blue"),
+    ("multiselect", "One, Two, Three, Four"),
+)
+
+
+class BenchmarkForm(TbxFormsMixin, WagtailBaseForm):
+    pass
+
+
+class BenchmarkFormBuilder(BaseWagtailFormBuilder):
+    def create_form_class(self):
+        return type(str("WagtailForm"), (BenchmarkForm,), self.formfields)
+
+
+def build_fields():
+    fields = []
+    for index in range(FIELDS):
+        field_type, choices = FIELD_TYPES[index % len(FIELD_TYPES)]
+        fields.append(
+            SimpleNamespace(
+                clean_name="field_%d" % index,
+                field_type=field_type,
+                label="Field %d" % index,
+                help_text="",
+                required=index % 2 == 0,
+                choices=choices,
+                default_value="",
+            )
+        )
+    return fields
+
+
+def render(fields):
+    form_class = BenchmarkFormBuilder(fields).get_form_class()
+    return render_crispy_form(form_class())
+
+
+def cold(fields):
+    clear_form_class_cache()
+    render(fields)
+
+
+def main():
+    fields = build_fields()
+
+    built = timeit.timeit(lambda: cold(fields), number=NUMBER)
+    render(fields)
+    cached = timeit.timeit(lambda: render(fields), number=NUMBER)
+
+    print("%d fields, %d renders" % (FIELDS, NUMBER))
+    print("cold: %.2fms per render" % (built / NUMBER * 1000))
+    print("warm: %.2fms per render" % (cached / NUMBER * 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+# The names of the template packs provided by tbxforms. tbxforms_flat is
+# generated from the tbxforms templates, see tbxforms.flatten.
+TEMPLATE_PACKS = ("tbxforms", "tbxforms_flat")
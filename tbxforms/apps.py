@@ -3,3 +3,8 @@ from django.apps import AppConfig
 
 class TbxFormsConfig(AppConfig):
     name = "tbxforms"
+
+    def ready(self):
+        from tbxforms.warmup import warm_up
+
+        warm_up()
@@ -0,0 +1,252 @@
+"""
+Caching for the choices of ModelChoiceField and ModelMultipleChoiceField.
+
+The choices of a model choice field are generated by running the field's
+queryset each time they are iterated over. When a form is rendered the
+checkbox and radio templates iterate over the choices (and count them) and a
+select widget iterates over them again, so a form with several fields using
+the same queryset runs the same query many times.
+
+While a form is rendered the results of the querysets are cached, by their
+SQL, so each distinct query is run once. The choices for each field are then
+generated from the cached model instances. The cache can be extended to cover
+a whole request by adding the middleware: ::
+
+    MIDDLEWARE = [
+        ...
+        "tbxforms.middleware.ChoiceCacheMiddleware",
+    ]
+
+or to any block of code with the ``choice_cache()`` context manager.
+
+Choices can also be cached for the lifetime of the process by setting
+``TBXFORMS_CACHE_CHOICES = True``. To control when the cached choices are
+refreshed set ``TBXFORMS_CHOICES_VERSION`` to the dotted path of a function
+that takes the queryset and returns a version, for example the time the
+table was last updated. The choices are fetched again whenever the version
+changes. ``clear_choice_cache()`` removes everything from the process cache.
+"""
+
+import contextvars
+import threading
+
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.forms.models import (
+    ModelChoiceField,
+    ModelChoiceIterator,
+)
+from django.utils.module_loading import import_string
+
+from asgiref.sync import sync_to_async
+
+_scope = contextvars.ContextVar("tbxforms_choice_cache", default=None)
+
+_process_cache = {}
+_process_lock = threading.Lock()
+
+
+@contextmanager
+def choice_cache():
+    """
+    Cache the choices of model choice fields until the block exits.
+
+    If a cache is already active, for example the request is wrapped by the
+    middleware, it is used instead of starting a new one.
+    """
+    if _scope.get() is not None:
+        yield
+        return
+
+    token = _scope.set({})
+    try:
+        yield
+    finally:
+        _scope.reset(token)
+
+
+def clear_choice_cache():
+    """
+    Remove all the choices cached for the lifetime of the process.
+    """
+    with _process_lock:
+        _process_cache.clear()
+
+
+@receiver(setting_changed)
+def clear_choice_cache_on_setting_changed(*, setting, **kwargs):
+    if setting in ("TBXFORMS_CACHE_CHOICES", "TBXFORMS_CHOICES_VERSION"):
+        clear_choice_cache()
+
+
+def get_cache_key(queryset):
+    """
+    Return the key used to cache the results of a queryset.
+
+    Args:
+        queryset (QuerySet): the queryset of a model choice field.
+
+    Returns:
+        tuple: the database alias and SQL for the queryset, or None if the
+            results cannot be cached.
+
+    """
+    try:
+        return (queryset.db, str(queryset.query))
+    except EmptyResultSet:
+        return None
+
+
+def get_choices_version(queryset):
+    """
+    Return the version of the choices for a queryset, from the function set
+    in TBXFORMS_CHOICES_VERSION.
+    """
+    path = getattr(settings, "TBXFORMS_CHOICES_VERSION", None)
+    if path is None:
+        return None
+    return import_string(path)(queryset)
+
+
+def get_instances(queryset, cache, process):
+    """
+    Return the results of a queryset from the caches, running the query if
+    they have not been cached yet.
+    """
+    key = get_cache_key(queryset)
+    if key is None:
+        return tuple(queryset)
+
+    if cache is not None and key in cache:
+        return cache[key]
+
+    if process:
+        version = get_choices_version(queryset)
+        with _process_lock:
+            cached = _process_cache.get(key)
+        if cached is not None and cached[0] == version:
+            instances = cached[1]
+        else:
+            instances = tuple(queryset)
+            with _process_lock:
+                _process_cache[key] = (version, instances)
+    else:
+        instances = tuple(queryset)
+
+    if cache is not None:
+        cache[key] = instances
+
+    return instances
+
+
+async def afetch_instances(queryset, cache):
+    """
+    Fetch the results of a queryset into the cache with the async ORM.
+    """
+    key = get_cache_key(queryset)
+    if key is None or key in cache:
+        return
+
+    if getattr(settings, "TBXFORMS_CACHE_CHOICES", False):
+        # The process cache, and the version function, are synchronous.
+        await sync_to_async(get_instances)(queryset, cache, True)
+    elif hasattr(queryset, "__aiter__"):
+        cache[key] = tuple([instance async for instance in queryset])
+    else:
+        cache[key] = await sync_to_async(tuple)(queryset)
+
+
+def prefetch_choices(forms):
+    """
+    Fetch the choices of the model choice fields in the forms into the
+    active cache so the forms can be rendered without running any queries,
+    e.g. from other threads.
+
+    This must be called inside a ``choice_cache()`` block, otherwise it does
+    nothing.
+    """
+    cache = _scope.get()
+    if cache is None:
+        return
+
+    process = getattr(settings, "TBXFORMS_CACHE_CHOICES", False)
+    for form in forms:
+        for field in form.fields.values():
+            if isinstance(field, ModelChoiceField):
+                get_instances(field.queryset, cache, process)
+
+
+async def aprefetch_choices(forms):
+    """
+    Fetch the choices of the model choice fields in the forms, with the
+    async ORM, into the active cache so the forms can be rendered without
+    running any queries.
+
+    This must be called inside a ``choice_cache()`` block, otherwise it does
+    nothing.
+    """
+    cache = _scope.get()
+    if cache is None:
+        return
+
+    for form in forms:
+        for field in form.fields.values():
+            if isinstance(field, ModelChoiceField):
+                await afetch_instances(field.queryset, cache)
+
+
+def get_choices(field):
+    """
+    Return the choices for a form field.
+
+    The choices of model choice fields are generated from the cached results
+    of the queryset, if a cache is active, otherwise they are generated as
+    usual. The choices of all other fields are returned unchanged.
+
+    Args:
+        field (Field): the form field.
+
+    Returns:
+        the field's choices.
+
+    """
+    choices = field.choices
+    if not isinstance(choices, ModelChoiceIterator):
+        return choices
+
+    cache = _scope.get()
+    process = getattr(settings, "TBXFORMS_CACHE_CHOICES", False)
+    if cache is None and not process:
+        return choices
+
+    instances = get_instances(field.queryset, cache, process)
+
+    result = []
+    if field.empty_label is not None:
+        result.append(("", field.empty_label))
+    result.extend(choices.choice(instance) for instance in instances)
+    return result
+
+
+@contextmanager
+def widget_choices(field, widget=None):
+    """
+    Give a field's widget, or a copy of it, the cached choices while it is
+    rendered.
+    """
+    if widget is None:
+        widget = field.widget
+    choices = getattr(widget, "choices", None)
+    if not isinstance(choices, ModelChoiceIterator):
+        yield
+        return
+
+    widget.choices = get_choices(field)
+    try:
+        yield
+    finally:
+        widget.choices = choices
@@ -1,4 +1,5 @@
 from django import VERSION as DJANGO_VERSION
+from django.utils.functional import cached_property
 
 """
 Choice is used for the items in the choices attribute of a form field.
@@ -30,12 +31,17 @@ Args:
     **kwargs: additional attributes to display for the checkbox / radio button.
         Two attributes are supported: a `hint` that is displayed below the
         label and a 'divider' that is displayed after the radio button.
+
+Choices are shared rather than copied when a form is instantiated, so
+define them once, e.g. as a module or class attribute, and do not change
+them afterwards. Large lists of choices can be wrapped in a ``ChoiceList``
+to look choices up by value.
 """
 
 if DJANGO_VERSION < (5, 0):
 
     class BaseChoice:
-        pass
+        __slots__ = ()
 
 else:
 
@@ -50,14 +56,100 @@ else:
 
 
 class Choice(BaseChoice):
-    def __init__(self, value, label, **kwargs):
+    # The standard attributes are stored in slots. Any other attributes are
+    # stored in a __dict__, which is only created when one is set. Promise,
+    # the base class on Django 5+, already gives instances a __dict__.
+    __slots__ = ("value", "label", "hint", "divider") + (
+        () if BaseChoice.__dictoffset__ else ("__dict__",)
+    )
+
+    def __init__(self, value, label, hint=None, divider=None, **kwargs):
         self.value = value
         self.label = label
+        self.hint = hint
+        self.divider = divider
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # Form fields deep copy their choices for every form instance.
+        # Choices are not changed once they are defined, so they are shared.
+        return self
+
     def __iter__(self):
         return iter((self.value, self.label))
 
     def __getitem__(self, index):
         return (self.value, self.label)[index]
+
+
+class ChoiceList(tuple):
+    """
+    An immutable sequence of choices which can be looked up by value.
+
+    A ChoiceList can be used anywhere a tuple of choices can. On Django 5.0+
+    it is not copied when a form is instantiated, so it is shared by every
+    instance of the field. Earlier versions of Django convert the choices of
+    a field to a list, which is copied for each form instance, although the
+    choices in it are still shared. Look choices up on the ChoiceList itself
+    rather than on ``field.choices``. The index of the values is built the
+    first time a choice is looked up.
+
+    Examples: ::
+
+        COUNTRIES = ChoiceList(
+            Choice(country.code, country.name) for country in countries
+        )
+
+        country = forms.ChoiceField(choices=COUNTRIES)
+
+        COUNTRIES.get("GB").label
+
+    Args:
+        choices (iterable): the choices, either Choice objects or (value,
+            label) tuples. Grouped choices, (group name, choices), are also
+            supported.
+    """
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    @cached_property
+    def positions(self):
+        """
+        A dict of the position of each choice, indexed by its value. Values
+        are compared as strings, as they are when a form is submitted. The
+        position of a choice in a group is a (group, choice) pair.
+        """
+        positions = {}
+        for index, (value, label) in enumerate(self):
+            if isinstance(label, (list, tuple)):
+                for nested_index, nested in enumerate(label):
+                    positions.setdefault(str(nested[0]), (index, nested_index))
+            else:
+                positions.setdefault(str(value), index)
+        return positions
+
+    def get(self, value, default=None):
+        """
+        Return the choice for a value, or the default if there is no choice
+        with that value.
+        """
+        position = self.positions.get(str(value))
+        if position is None:
+            return default
+        if isinstance(position, tuple):
+            return self[position[0]][1][position[1]]
+        return self[position]
+
+    def has_value(self, value):
+        """
+        Return True if there is a choice with the given value.
+        """
+        return str(value) in self.positions
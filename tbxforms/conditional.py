@@ -0,0 +1,328 @@
+"""
+Evaluate the conditional fields and containers of a form on the server.
+
+A field or container declared with ``data_conditional`` is only shown when
+another field, the trigger, has one of the given values: ::
+
+    Field.text(
+        "email",
+        data_conditional={"field_name": "contact", "values": ["email"]},
+    )
+
+When the form is rendered each rule is evaluated against the form's data,
+or its initial values if it is not bound. Hidden fields and containers are
+rendered with the ``hidden`` attribute, and each trigger with
+``aria-expanded``, so the page is correct before any JavaScript runs.
+``tbxforms.js`` only updates them when a trigger changes.
+
+When the form is cleaned the fields which are hidden for the submitted data
+are inactive: they are not cleaned and their values are dropped, see
+``ConditionalRules``.
+"""
+
+import json
+import math
+import re
+import weakref
+
+from functools import lru_cache
+
+from django import forms
+
+from tbxforms.choice_cache import get_choices
+
+NAME_ATTR = "data-conditional-field-name"
+VALUES_ATTR = "data-conditional-field-values"
+
+_rule_sets = weakref.WeakKeyDictionary()
+
+
+@lru_cache(maxsize=256)
+def _parse_values(values):
+    return tuple(json.loads(values))
+
+
+class ConditionalRule:
+    """
+    A field or container is shown when the field named ``field_name`` has
+    one of ``values``.
+    """
+
+    __slots__ = ("field_name", "values")
+
+    def __init__(self, field_name, values):
+        self.field_name = field_name
+        self.values = tuple(values)
+
+    def __repr__(self):
+        return "<ConditionalRule %s in %r>" % (self.field_name, self.values)
+
+    @classmethod
+    def from_attrs(cls, attrs):
+        """
+        Return the rule from the attributes added by
+        ``setup_conditional_attrs()``, or None if there isn't one.
+        """
+        if not isinstance(attrs, dict) or NAME_ATTR not in attrs:
+            return None
+        return cls(attrs[NAME_ATTR], _parse_values(attrs[VALUES_ATTR]))
+
+    def get_trigger(self, form):
+        """
+        Return the bound field the rule depends on, or None if the form does
+        not have it. The name may include the form's prefix.
+        """
+        name = self.field_name
+        prefix = "%s-" % form.prefix if form.prefix else None
+        if prefix and name.startswith(prefix) and name not in form.fields:
+            name = name.replace(prefix, "", 1)
+        if name not in form.fields:
+            return None
+        return form[name]
+
+    def is_met(self, form):
+        """
+        Return whether the trigger has one of the values, or None if the
+        form does not have the trigger.
+        """
+        trigger = self.get_trigger(form)
+        if trigger is None:
+            return None
+        values, multiple = get_values(trigger)
+        return any(
+            matches(value, expected, multiple)
+            for value in values
+            for expected in self.values
+        )
+
+
+def matches(value, expected, multiple=False):
+    """
+    Compare the value of a trigger with one of the values of a rule, exactly
+    as ``tbxforms.js`` does.
+
+    When the trigger is rendered as several inputs, e.g. radio buttons, the
+    value of each checked input must be the same string. Otherwise the value
+    of the input - a string, or whether it is checked for a checkbox - must
+    be the same, or the rule's value must be a number equal to the input's
+    value converted with JavaScript's ``Number()``.
+    """
+    if multiple:
+        return isinstance(expected, str) and value == expected
+    if isinstance(value, bool) or isinstance(expected, bool):
+        if value is expected:
+            return True
+    elif isinstance(value, str) and value == expected:
+        return True
+    if isinstance(expected, bool) or not isinstance(expected, (int, float)):
+        return False
+    number = to_number(value)
+    return number is not None and number == expected
+
+
+_NUMBER = re.compile(r"[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?")
+_INTEGER = re.compile(r"0[xX][0-9a-fA-F]+|0[oO][0-7]+|0[bB][01]+")
+_INFINITY = {
+    "Infinity": math.inf,
+    "+Infinity": math.inf,
+    "-Infinity": -math.inf,
+}
+
+
+def to_number(value):
+    """
+    Convert the value of an input to a number as JavaScript's ``Number()``
+    does, or return None for ``NaN``.
+    """
+    if isinstance(value, bool):
+        return int(value)
+    value = value.strip()
+    if not value:
+        return 0
+    if _NUMBER.fullmatch(value):
+        return float(value)
+    if _INTEGER.fullmatch(value):
+        return int(value, 0)
+    return _INFINITY.get(value)
+
+
+def get_values(bound_field):
+    """
+    Return the values of a trigger as ``tbxforms.js`` reads them from the
+    rendered inputs, and whether there are several inputs.
+
+    Radio buttons and checkboxes with more than one choice give the values
+    of the checked inputs. A single checkbox gives whether it is checked. A
+    select gives the value of its first selected option, or its first
+    option if none is selected and it only allows one. Any other input
+    gives its value as a string.
+    """
+    field = bound_field.field
+    widget = field.widget
+    value = bound_field.value()
+
+    # CheckboxSelectMultiple only subclasses RadioSelect from Django 4.0.
+    choice_inputs = (forms.RadioSelect, forms.CheckboxSelectMultiple)
+    if isinstance(widget, (forms.Select,) + choice_inputs):
+        if value is None:
+            selected = set()
+        elif isinstance(value, (list, tuple)):
+            selected = {str(item) for item in value}
+        else:
+            selected = {str(value)}
+        options = [
+            str(option) for option, label in _flatten(get_choices(field))
+        ]
+
+        if isinstance(widget, choice_inputs):
+            if len(options) > 1:
+                return [
+                    option for option in options if option in selected
+                ], True
+            if widget.input_type == "checkbox":
+                return [option in selected for option in options], False
+            return options, False
+
+        for option in options:
+            if option in selected:
+                return [option], False
+        if options and not widget.allow_multiple_selected:
+            return [options[0]], False
+        return [""], False
+
+    if isinstance(widget, forms.CheckboxInput):
+        return [widget.check_test(value)], False
+
+    if isinstance(value, (list, tuple)):
+        return ["" if item is None else str(item) for item in value], False
+
+    if isinstance(widget, (forms.widgets.Input, forms.Textarea)):
+        value = widget.format_value(value)
+    return ["" if value is None else str(value)], False
+
+
+def _flatten(choices):
+    for value, label in choices:
+        if isinstance(label, (list, tuple)):
+            yield from _flatten(label)
+        else:
+            yield value, label
+
+
+def get_rule(layout_object):
+    """
+    Return the rule for a layout object, or None if it is not conditional.
+    """
+    return getattr(layout_object, "conditional", None)
+
+
+def iter_rules(layout):
+    """
+    Yield the rule of every conditional layout object in a layout.
+    """
+    for layout_object in getattr(layout, "fields", ()):
+        rule = get_rule(layout_object)
+        if rule is not None:
+            yield rule
+        yield from iter_rules(layout_object)
+
+
+def get_expanded(form, layout):
+    """
+    Return whether each trigger in a layout shows anything, indexed by the
+    name of the field. A trigger is expanded if any of the rules which
+    depend on it is met.
+    """
+    expanded = {}
+    for rule in iter_rules(layout):
+        trigger = rule.get_trigger(form)
+        if trigger is not None:
+            expanded[trigger.name] = expanded.get(trigger.name, False) or bool(
+                rule.is_met(form)
+            )
+    return expanded
+
+
+def get_conditional_context(form, rule):
+    """
+    Return the template variables for rendering a conditional field or
+    container: ``conditional`` and ``conditional_hidden``.
+    """
+    if rule is None:
+        return {}
+    return {
+        "conditional": True,
+        "conditional_hidden": rule.is_met(form) is False,
+    }
+
+
+class ConditionalRules:
+    """
+    The rules which apply to each field in a layout: the rule of the field
+    itself and the rules of the containers it is in.
+    """
+
+    def __init__(self, layout_objects):
+        rules = {}
+        for name, field_rules in _iter_field_rules(layout_objects, ()):
+            rules[name] = rules.get(name, ()) + field_rules
+        self.rules = {name: rules[name] for name in rules if rules[name]}
+
+    def get_inactive_fields(self, form):
+        """
+        Return the names of the fields which are hidden for the form's data.
+
+        A field is inactive if one of its rules is not met, or if the trigger
+        of one of its rules is itself inactive, as its value is dropped. Each
+        trigger is evaluated before the fields which depend on it, and each
+        field only once. In a cycle of rules, the field which comes first in
+        the layout is treated as active while the others are evaluated.
+        """
+        active = {}
+
+        def is_active(name):
+            if name not in active:
+                active[name] = True
+                active[name] = all(
+                    is_rule_met(rule) for rule in self.rules.get(name, ())
+                )
+            return active[name]
+
+        def is_rule_met(rule):
+            trigger = rule.get_trigger(form)
+            if trigger is None:
+                return True
+            return is_active(trigger.name) and rule.is_met(form)
+
+        return frozenset(
+            name
+            for name in self.rules
+            if name in form.fields and not is_active(name)
+        )
+
+
+def _iter_field_rules(layout_objects, rules):
+    for layout_object in layout_objects:
+        if isinstance(layout_object, str):
+            yield layout_object, rules
+            continue
+        rule = get_rule(layout_object)
+        yield from _iter_field_rules(
+            getattr(layout_object, "fields", ()),
+            rules + (rule,) if rule is not None else rules,
+        )
+
+
+def get_conditional_rules(form, layout):
+    """
+    Return the cached ``ConditionalRules`` for a form class and layout.
+    """
+    # Instances share the layout objects but may have their own copy of the
+    # Layout, so the rules are matched on the contents rather than the Layout.
+    key = tuple(layout.fields)
+    cached = _rule_sets.get(form.__class__)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    rules = ConditionalRules(key)
+    _rule_sets[form.__class__] = (key, rules)
+    return rules
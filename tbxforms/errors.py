@@ -0,0 +1,115 @@
+"""
+An index of the validation errors for a form.
+
+The error summary, the error messages for each field and the
+aria-describedby attributes of the widgets all need the same information:
+which fields have errors, the messages and the ids of the elements that
+display them. The ErrorIndex is built in a single pass over the form's errors
+the first time it is needed after the form is cleaned, and is then shared by
+everything that renders the errors.
+"""
+
+
+class FieldErrors:
+    """
+    The validation errors for a single field.
+
+    Attributes:
+        name (str): the name of the field.
+
+        anchor (str): the id of the element the error summary links to.
+
+        label (str): the field's label.
+
+        is_hidden (bool): whether the field is rendered as a hidden input.
+
+        messages (ErrorList): the error messages.
+
+        error_ids (tuple): the ids of the elements displaying each message.
+
+    """
+
+    __slots__ = (
+        "name",
+        "anchor",
+        "label",
+        "is_hidden",
+        "messages",
+        "error_ids",
+    )
+
+    def __init__(self, bound_field):
+        self.name = bound_field.name
+        self.anchor = "div_id_%s" % bound_field.html_name
+        self.label = bound_field.label
+        self.is_hidden = bound_field.is_hidden
+        self.messages = bound_field.errors
+        auto_id = bound_field.auto_id
+        self.error_ids = tuple(
+            "%s_%d_error" % (auto_id, counter)
+            for counter in range(1, len(self.messages) + 1)
+        )
+
+
+class ErrorIndex:
+    """
+    The validation errors for every field in a form, in the order the fields
+    are displayed.
+
+    Attributes:
+        fields (dict): the FieldErrors for each field with errors, indexed by
+            the field name.
+
+        summary (list): (FieldErrors, message) pairs for every error
+            displayed in the error summary, i.e. errors for fields which are
+            not hidden.
+
+    """
+
+    def __init__(self, form):
+        self.fields = {}
+        self.summary = []
+
+        errors = form.errors
+        if not errors:
+            return
+
+        for name in form.fields:
+            if name not in errors:
+                continue
+            field_errors = FieldErrors(form[name])
+            self.fields[name] = field_errors
+            if not field_errors.is_hidden:
+                for message in field_errors.messages:
+                    self.summary.append((field_errors, message))
+
+    def get(self, name):
+        """
+        Return the FieldErrors for a field, or None if it has no errors.
+        """
+        return self.fields.get(name)
+
+
+def get_error_index(form):
+    """
+    Return the ErrorIndex for a form.
+
+    Forms using TbxFormsMixin keep the index until the form is cleaned again
+    or an error is added. For other forms a new index is built each time.
+    """
+    index = getattr(form, "error_index", None)
+    if isinstance(index, ErrorIndex):
+        return index
+    return ErrorIndex(form)
+
+
+def get_field_errors(bound_field):
+    """
+    Return the FieldErrors for a bound field, or None if it has no errors.
+    """
+    index = getattr(bound_field.form, "error_index", None)
+    if isinstance(index, ErrorIndex):
+        return index.get(bound_field.name)
+    if bound_field.errors:
+        return FieldErrors(bound_field)
+    return None
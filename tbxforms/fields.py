@@ -1,4 +1,5 @@
 import calendar
+import copy
 import datetime
 
 from django import forms
@@ -15,6 +16,79 @@ from tbxforms.validators import (
 )
 from tbxforms.widgets import DateInputWidget
 
+# Define one message for all fields.
+DATE_ERROR_MESSAGES = {
+    "required": _("Enter the day, month, and year."),
+    "incomplete": _("Enter the day, month, and year."),
+}
+
+DAY_VALIDATORS = (
+    RegexValidator(r"^[0-9]+$", _("Enter a valid date.")),
+    StringMinValueValidator(1, _("Day must be 1 or more.")),
+    MaxLengthValidator(2, _("Day must be 2 digits or less.")),
+)
+
+MONTH_VALIDATORS = (
+    RegexValidator(r"^[0-9]+$", _("Enter a valid month.")),
+    StringMinValueValidator(1, _("Month must be 1 or more.")),
+    StringMaxValueValidator(12, _("Month must be 12 or less.")),
+)
+
+YEAR_VALIDATORS = (
+    RegexValidator(r"^[0-9]+$", _("Enter a valid year.")),
+    StringMinValueValidator(
+        datetime.MINYEAR,
+        _(
+            "Year must be %(min_year)d or more."
+            % {"min_year": datetime.MINYEAR}
+        ),
+    ),
+    StringMaxValueValidator(
+        datetime.MAXYEAR,
+        _(
+            "Year must be %(max_year)d or less."
+            % {"max_year": datetime.MAXYEAR}
+        ),
+    ),
+)
+
+# Or define a different message for each field. These are the prototypes
+# copied for each DateInputField, they are never cleaned or rendered.
+DATE_SUBFIELDS = (
+    forms.CharField(
+        label=_("Day"),
+        error_messages={"incomplete": _("Enter the day of the month.")},
+        validators=DAY_VALIDATORS,
+    ),
+    forms.CharField(
+        label=_("Month"),
+        error_messages={"incomplete": _("Enter the month.")},
+        validators=MONTH_VALIDATORS,
+    ),
+    forms.CharField(
+        label=_("Year"),
+        error_messages={"incomplete": _("Enter the year.")},
+        validators=YEAR_VALIDATORS,
+    ),
+)
+
+
+def parse_date_parts(day, month, year):
+    """
+    Return the ``date`` for a day, month and year if they are made of ASCII
+    digits, the day is at most two digits and they make a valid date,
+    otherwise None.
+    """
+    for part in (day, month, year):
+        if not (isinstance(part, str) and part.isascii() and part.isdigit()):
+            return None
+    if len(day) > 2:
+        return None
+    try:
+        return datetime.date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
 
 class DateInputField(forms.MultiValueField):
     """
@@ -49,66 +123,19 @@ class DateInputField(forms.MultiValueField):
     widget = DateInputWidget
 
     def __init__(self, **kwargs):
-        # Define one message for all fields.
-        error_messages = {
-            "required": _("Enter the day, month, and year."),
-            "incomplete": _("Enter the day, month, and year."),
-        }
-        # Or define a different message for each field.
-        fields = (
-            forms.CharField(
-                label=_("Day"),
-                error_messages={
-                    "incomplete": _("Enter the day of the month.")
-                },
-                validators=[
-                    RegexValidator(r"^[0-9]+$", _("Enter a valid date.")),
-                    StringMinValueValidator(1, _("Day must be 1 or more.")),
-                    MaxLengthValidator(2, _("Day must be 2 digits or less.")),
-                ],
-            ),
-            forms.CharField(
-                label=_("Month"),
-                error_messages={"incomplete": _("Enter the month.")},
-                validators=[
-                    RegexValidator(r"^[0-9]+$", _("Enter a valid month.")),
-                    StringMinValueValidator(1, _("Month must be 1 or more.")),
-                    StringMaxValueValidator(
-                        12, _("Month must be 12 or less.")
-                    ),
-                ],
-            ),
-            forms.CharField(
-                label=_("Year"),
-                error_messages={"incomplete": _("Enter the year.")},
-                validators=[
-                    RegexValidator(r"^[0-9]+$", _("Enter a valid year.")),
-                    StringMinValueValidator(
-                        datetime.MINYEAR,
-                        _(
-                            "Year must be %(min_year)d or more."
-                            % {"min_year": datetime.MINYEAR}
-                        ),
-                    ),
-                    StringMaxValueValidator(
-                        datetime.MAXYEAR,
-                        _(
-                            "Year must be %(max_year)d or less."
-                            % {"max_year": datetime.MAXYEAR}
-                        ),
-                    ),
-                ],
-            ),
-        )
+        # The sub-fields are copied from shared prototypes rather than built
+        # from scratch. Each copy has its own widget, error messages and list
+        # of validators, but the validators themselves are shared.
+        fields = tuple(copy.deepcopy(field) for field in DATE_SUBFIELDS)
 
         if "help_text" not in kwargs:
             kwargs["help_text"] = "For example, 24 12 2020"
 
         super().__init__(
-            error_messages=error_messages, fields=fields, **kwargs
+            error_messages=DATE_ERROR_MESSAGES, fields=fields, **kwargs
         )
 
-    def clean(self, value):
+    def clean(self, value):  # noqa: C901
         """
         Validate the values entered into the day, month and year fields.
 
@@ -137,6 +164,14 @@ class DateInputField(forms.MultiValueField):
              the value converted to a ``date``.
 
         """
+        out = self.parse_date(value)
+        if out is not None:
+            for field in self.fields:
+                field.widget.errors = []
+            self.validate(out)
+            self.run_validators(out)
+            return out
+
         clean_data = []
         errors = []
         if self.disabled and not isinstance(value, list):
@@ -217,6 +252,98 @@ class DateInputField(forms.MultiValueField):
         self.run_validators(out)
         return out
 
+    def has_default_validation(self):
+        """
+        Return True if the sub-fields, their validators, ``compress()``,
+        ``clean()`` and ``validate()`` are the ones defined by
+        DateInputField, so the fast path gives the same result as the full
+        validation.
+        """
+        cls = type(self)
+        if (
+            cls.compress is not DateInputField.compress
+            or cls.clean is not DateInputField.clean
+            or cls.validate is not DateInputField.validate
+        ):
+            return False
+
+        for field, prototype in zip(self.fields, DATE_SUBFIELDS):
+            if type(field) is not forms.CharField:
+                return False
+            if len(field.validators) != len(prototype.validators) or not all(
+                a is b for a, b in zip(field.validators, prototype.validators)
+            ):
+                return False
+
+        return True
+
+    def parse_date(self, value):
+        """
+        Convert the values entered into the day, month and year fields to a
+        ``date`` if they are obviously valid.
+
+        This is a fast path for ``clean()``. It only accepts a day of one or
+        two digits and a month and year of digits which make a valid date,
+        and only when the sub-fields and ``compress()`` have not been
+        customised. Anything else is left to the full validation, which
+        reports the errors.
+
+        Args:
+            value (list, tuple): the values entered into each field.
+
+        Returns:
+            the ``date``, or None if the values must be fully validated.
+
+        """
+        if not isinstance(value, (list, tuple)) or len(value) != 3:
+            return None
+        if not self.has_default_validation():
+            return None
+        return parse_date_parts(*value)
+
+    def clean_many(self, rows):
+        """
+        Validate many dates at once, e.g. the rows of an imported file, with
+        the same rules and error messages as ``clean()``.
+
+        Whether the fast path can be used is decided once for the whole
+        batch. Rows which are obviously valid are converted directly and
+        passed to ``validate()`` and the field's validators, the rest are
+        passed to ``clean()`` to collect their errors.
+
+        Examples::
+
+            dates, errors = field.clean_many(zip(days, months, years))
+
+        Args:
+            rows (iterable): the (day, month, year) values for each date.
+
+        Returns:
+            tuple: a list of the ``date`` for each row, None if the row is
+                blank or invalid, and a list of the error messages for each
+                row, empty if the row is valid.
+
+        """
+        fast = self.has_default_validation()
+
+        dates = []
+        errors = []
+        for row in rows:
+            date = parse_date_parts(*row) if fast and len(row) == 3 else None
+            try:
+                if date is not None:
+                    self.validate(date)
+                    self.run_validators(date)
+                else:
+                    date = self.clean(list(row))
+                dates.append(date)
+                errors.append([])
+            except ValidationError as e:
+                dates.append(None)
+                errors.append(e.messages)
+
+        return dates, errors
+
     def compress(self, data_list):
         """
         Convert the values entered into the fields as a ``date``.
@@ -0,0 +1,124 @@
+"""
+Build the ``tbxforms_flat`` template pack from the ``tbxforms`` templates.
+
+Rendering a form with the ``tbxforms`` pack goes through several levels of
+``{% include %}``: ``whole_uni_form.html`` includes ``display_form.html``,
+which includes ``uni_form.html``, which includes ``field.html`` for each
+field, which includes the templates for checkboxes, radios, help text and
+errors. Every include looks up a template and pushes a new context.
+
+The ``tbxforms_flat`` pack contains the same templates with every include of
+another template in the pack replaced by the contents of that template, so
+each one is rendered without any includes. The ``{% load %}`` tags of the
+included templates are moved to the start of the template. The output is the
+same as the ``tbxforms`` pack.
+
+The pack is generated and committed with the package. After changing any of
+the ``tbxforms`` templates, rebuild it with: ::
+
+    python -m tbxforms.flatten
+"""
+
+import os
+import re
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+SOURCE_PACK = "tbxforms"
+TARGET_PACK = "tbxforms_flat"
+
+# Django widget templates are rendered by the form renderer, not through the
+# template pack, so they are not copied.
+EXCLUDED_DIRS = ("widgets",)
+
+INCLUDE_RE = re.compile(r'{%\s*include\s+"' + SOURCE_PACK + r'/([^"]+)"\s*%}')
+LOAD_RE = re.compile(r"{%\s*load\s+([^%]+?)\s*%}")
+
+
+def get_template_names():
+    """
+    Return the names of the templates in the source pack, relative to the
+    pack directory.
+    """
+    source_dir = os.path.join(TEMPLATES_DIR, SOURCE_PACK)
+    names = []
+    for root, dirs, files in os.walk(source_dir):
+        dirs[:] = sorted(
+            name
+            for name in dirs
+            if name not in EXCLUDED_DIRS and name != "__pycache__"
+        )
+        for filename in sorted(files):
+            if filename.endswith(".html"):
+                path = os.path.join(root, filename)
+                names.append(os.path.relpath(path, source_dir))
+    return names
+
+
+def read_template(name):
+    path = os.path.join(TEMPLATES_DIR, SOURCE_PACK, name)
+    with open(path, encoding="utf-8") as fp:
+        return fp.read()
+
+
+def inline_includes(name, libraries, parents=()):
+    """
+    Return the source of a template with the includes of other templates in
+    the pack replaced by their source, recursively, and the load tags
+    removed. The libraries loaded are added to ``libraries``.
+    """
+    if name in parents:
+        raise ValueError(
+            "%s includes itself: %s" % (name, " -> ".join(parents + (name,)))
+        )
+
+    source = read_template(name)
+
+    def load(match):
+        for library in match.group(1).split():
+            if library not in libraries:
+                libraries.append(library)
+        return ""
+
+    def include(match):
+        return inline_includes(match.group(1), libraries, parents + (name,))
+
+    source = LOAD_RE.sub(load, source)
+    return INCLUDE_RE.sub(include, source)
+
+
+def flatten_template(name):
+    """
+    Return the source of the flattened version of a template.
+
+    The load tags are combined into one, which replaces the first line of
+    the template if that is where they were, so the rendered output is not
+    changed.
+    """
+    libraries = []
+    source = inline_includes(name, libraries)
+    if not libraries:
+        return source
+    return "{%% load %s %%}%s" % (" ".join(libraries), source)
+
+
+def build(target_dir=None):
+    """
+    Write the flattened templates, returning a dict of the source of each
+    template indexed by name.
+    """
+    if target_dir is None:
+        target_dir = os.path.join(TEMPLATES_DIR, TARGET_PACK)
+
+    templates = {name: flatten_template(name) for name in get_template_names()}
+    for name, source in templates.items():
+        path = os.path.join(target_dir, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as fp:
+            fp.write(source)
+    return templates
+
+
+if __name__ == "__main__":
+    for name in build():
+        print(os.path.join(TARGET_PACK, name))
@@ -1,15 +1,56 @@
+import hashlib
+import inspect
+import threading
+
+from collections import OrderedDict
+
 from django import forms as django_forms
 from django.apps import apps
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.core.signals import setting_changed
+from django.dispatch import receiver
 
+from tbxforms.conditional import get_conditional_rules
+from tbxforms.errors import ErrorIndex
 from tbxforms.fields import DateInputField
 from tbxforms.helper import FormHelper
 from tbxforms.layout import Size
+from tbxforms.registry import register
 
 if apps.is_installed("wagtail.contrib.forms"):
     from wagtail.contrib.forms.forms import FormBuilder
 
 
 class TbxFormsMixin:
+    """
+    Mixin for Django forms which adds a ``FormHelper`` configured for the
+    tbxforms template pack.
+
+    The helper, and the layout returned by ``build_layout()``, are created
+    once per form class. Each form instance gets a copy of the helper so its
+    attributes, and the list of objects in the layout, can be changed
+    without affecting other instances.
+
+    Every form class using the mixin is recorded in ``tbxforms.registry``.
+    """
+
+    _helper_prototype = None
+    _conditional_fields = None
+    _error_index = None
+    _fields_shown_as_required = None
+
+    # The names of the fields hidden by their conditional rules for the
+    # submitted data, set when the form is cleaned.
+    inactive_fields = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._helper_prototype = None
+        cls._conditional_fields = None
+        if issubclass(cls, django_forms.BaseForm):
+            register(cls)
+
     @staticmethod
     def conditional_fields_to_show_as_required() -> []:
         """
@@ -20,14 +61,257 @@ class TbxFormsMixin:
         """
         return []
 
+    def get_conditional_fields_to_show_as_required(self) -> frozenset:
+        """
+        Return the names from ``conditional_fields_to_show_as_required()`` as
+        a frozenset.
+
+        If the method is a staticmethod the names are the same for every
+        instance so they are cached on the form class, otherwise the method
+        is called for each instance.
+        """
+        cls = type(self)
+        method = inspect.getattr_static(
+            cls, "conditional_fields_to_show_as_required"
+        )
+        if not isinstance(method, staticmethod):
+            return frozenset(self.conditional_fields_to_show_as_required())
+        if cls._conditional_fields is None:
+            cls._conditional_fields = frozenset(
+                cls.conditional_fields_to_show_as_required()
+            )
+        return cls._conditional_fields
+
+    @property
+    def fields_shown_as_required(self) -> frozenset:
+        """
+        The names of the fields displayed as required: required fields and
+        the conditionally required fields. This is worked out the first time
+        the form is rendered.
+        """
+        if self._fields_shown_as_required is None:
+            conditional = self.get_conditional_fields_to_show_as_required()
+            self._fields_shown_as_required = frozenset(
+                name
+                for name, field in self.fields.items()
+                if field.required or name in conditional
+            )
+        return self._fields_shown_as_required
+
+    @classmethod
+    def build_layout(cls):
+        """
+        Return the Layout shared by every instance of the form.
+
+        This is called once, the first time the form is instantiated. If None
+        is returned, the default, a layout is generated for each instance from
+        the form's fields.
+        """
+        return None
+
+    @classmethod
+    def get_helper_prototype(cls) -> FormHelper:
+        """
+        Return the helper that is copied for each instance of the form.
+        """
+        if cls._helper_prototype is None:
+            helper = FormHelper()
+            helper.form_class = "tbxforms"  # "form.tbxforms" is used by our JS to add conditional field logic.  # noqa: E501
+            helper.html5_required = True
+            helper.label_size = Size.MEDIUM
+            helper.legend_size = Size.MEDIUM
+            helper.layout = cls.build_layout()
+            cls._helper_prototype = helper
+        return cls._helper_prototype
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self.helper = FormHelper(self)
-        self.helper.form_class = "tbxforms"  # "form.tbxforms" is used by our JS to add conditional field logic.  # noqa: E501
-        self.helper.html5_required = True
-        self.helper.label_size = Size.MEDIUM
-        self.helper.legend_size = Size.MEDIUM
+        self.helper = self.get_helper_prototype().copy(form=self)
+        if self.helper.layout is None:
+            self.helper.layout = self.helper.build_default_layout(self)
+
+    @property
+    def error_index(self) -> ErrorIndex:
+        """
+        The index of the form's validation errors, used to render the error
+        summary and the errors for each field.
+        """
+        if self._error_index is None:
+            self._error_index = ErrorIndex(self)
+        return self._error_index
+
+    def get_inactive_fields(self) -> frozenset:
+        """
+        Return the names of the fields which are hidden, for the form's data,
+        by the ``data_conditional`` rules in the helper's layout.
+        """
+        layout = getattr(getattr(self, "helper", None), "layout", None)
+        if layout is None:
+            return frozenset()
+        return get_conditional_rules(self, layout).get_inactive_fields(self)
+
+    def full_clean(self):
+        self._error_index = None
+        if self.is_bound:
+            self.inactive_fields = self.get_inactive_fields()
+            if self.inactive_fields:
+                self.drop_inactive_data()
+        super().full_clean()
+
+    def drop_inactive_data(self):
+        """
+        Remove the submitted values of the inactive fields, as if they had
+        been cleared before the form was submitted.
+        """
+        data = self.data.copy()
+        files = self.files.copy()
+        for name in self.inactive_fields:
+            bound_field = self[name]
+            widget = bound_field.field.widget
+            html_name = bound_field.html_name
+            suffixes = getattr(widget, "widgets_names", None) or ("",)
+            for suffix in suffixes:
+                data.pop(html_name + suffix, None)
+                files.pop(html_name + suffix, None)
+        self.data = data
+        self.files = files
+
+    def _clean_fields(self):
+        """
+        Clean the active fields, and set the inactive fields to their empty
+        values without running their validation.
+        """
+        if not self.inactive_fields:
+            return super()._clean_fields()
+
+        fields = self.fields
+        self.fields = {
+            name: field
+            for name, field in fields.items()
+            if name not in self.inactive_fields
+        }
+        try:
+            super()._clean_fields()
+        finally:
+            self.fields = fields
+
+        for name in self.inactive_fields:
+            try:
+                self.cleaned_data[name] = fields[name].to_python(None)
+            except ValidationError:
+                self.cleaned_data[name] = None
+
+    def add_error(self, field, error):
+        self._error_index = None
+        super().add_error(field, error)
+
+
+_form_classes = OrderedDict()
+_form_classes_lock = threading.Lock()
+
+
+def clear_form_class_cache():
+    """
+    Remove all the form classes cached by ``BaseWagtailFormBuilder``.
+    """
+    with _form_classes_lock:
+        _form_classes.clear()
+
+
+@receiver(setting_changed)
+def clear_form_class_cache_on_setting_changed(*, setting, **kwargs):
+    if setting == "TBXFORMS_FORM_CLASS_CACHE_SIZE":
+        clear_form_class_cache()
+
+
+# The model fields of a field definition that are not part of the form
+# field, besides the primary key.
+FIELD_DEFINITION_EXCLUDE = ("page", "sort_order")
+
+
+def get_field_definition(field, attributes):
+    """
+    Return the values of a field definition that its form field is built from.
+
+    For a model instance, e.g. a subclass of Wagtail's ``AbstractFormField``,
+    that is every concrete model field other than the primary key and the
+    ``FIELD_DEFINITION_EXCLUDE`` fields, so columns added by subclasses are
+    included. For any other object it is the given ``attributes``.
+
+    Args:
+        field: the field definition.
+
+        attributes (tuple): the attributes of a field definition that is not
+            a model instance that the form field is built from.
+
+    Returns:
+        tuple: the values of the field definition.
+
+    """
+    meta = getattr(field, "_meta", None)
+    if meta is None:
+        return tuple(getattr(field, name, None) for name in attributes)
+
+    return tuple(
+        (model_field.attname, model_field.value_from_object(field))
+        for model_field in meta.concrete_fields
+        if not model_field.primary_key
+        and model_field.name not in FIELD_DEFINITION_EXCLUDE
+    )
+
+
+def get_form_class_cache_key(builder_class, fields, attributes):
+    """
+    Return the key used to cache the form class built from a list of field
+    definitions.
+
+    Args:
+        builder_class (type): the class of the form builder.
+
+        fields (list): the field definitions.
+
+        attributes (tuple): the attributes of each field definition that the
+            form class is built from, when it is not a model instance.
+
+    Returns:
+        str: the cache key.
+
+    """
+    definitions = repr(
+        [get_field_definition(field, attributes) for field in fields]
+    )
+    digest = hashlib.sha256(definitions.encode())
+    return "%s.%s:%s" % (
+        builder_class.__module__,
+        builder_class.__qualname__,
+        digest.hexdigest(),
+    )
+
+
+def get_cached_form_class(key, create_form_class):
+    """
+    Return the form class cached for a key, calling ``create_form_class()``
+    to build it if it is not cached.
+
+    The cache holds the ``TBXFORMS_FORM_CLASS_CACHE_SIZE`` (128 by default)
+    most recently used form classes.
+    """
+    with _form_classes_lock:
+        form_class = _form_classes.get(key)
+        if form_class is not None:
+            _form_classes.move_to_end(key)
+            return form_class
+
+    form_class = create_form_class()
+
+    size = getattr(settings, "TBXFORMS_FORM_CLASS_CACHE_SIZE", 128)
+    with _form_classes_lock:
+        _form_classes[key] = form_class
+        while len(_form_classes) > size:
+            _form_classes.popitem(last=False)
+
+    return form_class
 
 
 if "FormBuilder" in locals():
@@ -35,8 +319,58 @@ if "FormBuilder" in locals():
     class BaseWagtailFormBuilder(FormBuilder):
         """
         Override some fields to use tbxforms functionality/variants.
+
+        The form class built for a set of field definitions is cached, so
+        the fields are only created again when the definitions change, e.g.
+        when a new revision of the page is published. Subclasses should
+        override ``create_form_class()`` rather than ``get_form_class()``
+        to keep the caching.
         """
 
+        cache_form_class = True
+
+        # The attributes of each field definition that the form class is
+        # built from, when the definitions are not model instances.
+        field_definition_attributes = (
+            "clean_name",
+            "field_type",
+            "label",
+            "help_text",
+            "required",
+            "choices",
+            "default_value",
+        )
+
+        def get_form_class_cache_key(self):
+            """
+            Return the key used to cache the form class, or None if it
+            should not be cached.
+
+            The key is made from the builder class and the values of every
+            model field of each field definition, other than its primary
+            key, page and sort order, so a form class is shared by every page
+            with the same field definitions. Override this method if the form
+            class also depends on something else.
+            """
+            if not self.cache_form_class:
+                return None
+
+            return get_form_class_cache_key(
+                self.__class__, self.fields, self.field_definition_attributes
+            )
+
+        def create_form_class(self):
+            """
+            Build the form class from the field definitions.
+            """
+            return super().get_form_class()
+
+        def get_form_class(self):
+            key = self.get_form_class_cache_key()
+            if key is None:
+                return self.create_form_class()
+            return get_cached_form_class(key, self.create_form_class)
+
         def create_date_field(self, field, options) -> DateInputField:
             return DateInputField(**options)
 
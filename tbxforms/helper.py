@@ -1,9 +1,82 @@
+import asyncio
+import contextvars
+import copy
+import hashlib
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
+from django.db import connections
+from django.forms.formsets import BaseFormSet
+from django.template import Context
+from django.template.loader import get_template
+from django.utils.translation import get_language
 
+from asgiref.sync import sync_to_async
 from crispy_forms import helper as crispy_forms_helper
+from crispy_forms.templatetags.crispy_forms_tags import (
+    BasicNode,
+    ForLoopSimulator,
+)
 from crispy_forms.utils import TEMPLATE_PACK
 
+from tbxforms import TEMPLATE_PACKS
+from tbxforms.choice_cache import (
+    aprefetch_choices,
+    choice_cache,
+    prefetch_choices,
+)
+from tbxforms.conditional import get_expanded
 from tbxforms.layout import Size
+from tbxforms.renderer import (
+    RenderForm,
+    get_render_plan,
+)
+
+_executors = {}
+_executors_lock = threading.Lock()
+_worker = threading.local()
+
+
+def _init_worker():
+    _worker.active = True
+
+
+def _close_connections_after(function, *args):
+    """
+    Call a function in a worker thread, then close any database connections
+    it opened, as the thread is not part of a request so they are never
+    closed otherwise.
+    """
+    try:
+        return function(*args)
+    finally:
+        connections.close_all()
+
+
+def _run_in_worker(context, function, *args):
+    """
+    Run a function in a pool thread with a copy of the calling thread's
+    context variables, then close any database connections it opened.
+    """
+    return context.run(_close_connections_after, function, *args)
+
+
+def get_executor(max_workers):
+    """
+    Return the thread pool, shared by every helper, used for rendering the
+    forms of formsets with ``max_workers`` threads.
+    """
+    with _executors_lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = _executors[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="tbxforms",
+                initializer=_init_worker,
+            )
+        return executor
 
 
 class FormHelper(crispy_forms_helper.FormHelper):
@@ -16,6 +89,16 @@ class FormHelper(crispy_forms_helper.FormHelper):
     adding the following attributes to control how the form is rendered.
 
     Attributes:
+        cache_unbound (:obj:`bool`, optional): cache the HTML for unbound
+            forms rendered with the ``{% crispy_tbx %}`` tag. Only use this
+            for forms where every instance is rendered the same way. The
+            default is False.
+
+        compiled_layout (:obj:`bool`, optional): render the layout with the
+            compiled renderer in ``tbxforms.renderer`` instead of the
+            templates. The markup is the same but rendering is faster. The
+            default is False.
+
         highlight_required_fields (:obj:`bool`, optional): whether to highlight
             required fields or optional fields. If not set on the form, the
             `TBXFORMS_HIGHLIGHT_REQUIRED_FIELDS` setting will be used, falling
@@ -33,6 +116,11 @@ class FormHelper(crispy_forms_helper.FormHelper):
             as body text. To change the font size and weight use one of the
             pre-defined Design System sizes: 's', 'm', 'l' or 'xl'.
 
+        render_threads (:obj:`int`, optional): render the forms of a formset
+            in parallel, with this many threads, when it is rendered with
+            the ``{% crispy_tbx %}`` tag or ``render_formset()``. The default
+            of None renders them one after another.
+
     These attributes are added as template variables. They can be overridden
     on each field, as required.
 
@@ -60,11 +148,133 @@ class FormHelper(crispy_forms_helper.FormHelper):
 
     """
 
+    cache_unbound = False
+    compiled_layout = False
     highlight_required_fields = None
     label_size = ""
     legend_size = ""
+    render_threads = None
     show_error_summary = True
 
+    # The layout of a copy, while its layout objects are shared with the
+    # helper it was copied from.
+    _shared_layout = None
+
+    def copy(self, form=None):
+        """
+        Return a copy of the helper which can be changed without affecting
+        the original.
+
+        The attributes, inputs and the list of objects in the layout are
+        copied. The layout objects themselves are shared until they are
+        changed through the helper, e.g. ``helper["name"].wrap(Div)`` or
+        ``helper.filter(Field).update_attributes(...)``, when the copy gets
+        its own, see ``own_layout()``.
+
+        Args:
+            form (Form, optional): the form the copy will be used with.
+
+        Returns:
+            FormHelper: the new helper.
+
+        """
+        helper = copy.copy(self)
+        helper.attrs = self.attrs.copy()
+        helper.inputs = list(self.inputs)
+
+        if self.layout is not None:
+            helper.layout = copy.copy(self.layout)
+            helper.layout.fields = list(self.layout.fields)
+            helper._shared_layout = helper.layout
+
+        if form is not None:
+            helper.form = form
+
+        return helper
+
+    def own_layout(self):
+        """
+        Deep copy the layout objects shared with the helper this one was
+        copied from, so they can be changed in place.
+
+        This is done the first time the layout is changed through the
+        helper's methods. Call it before changing a layout object reached
+        through ``helper.layout``, e.g. ``helper.layout[0].fields.append()``.
+        """
+        if self.layout is not None and self.layout is self._shared_layout:
+            self.layout.fields = copy.deepcopy(self.layout.fields)
+        self._shared_layout = None
+
+    def all(self):
+        self.own_layout()
+        return super().all()
+
+    def filter(self, *args, **kwargs):
+        self.own_layout()
+        return super().filter(*args, **kwargs)
+
+    def filter_by_widget(self, widget_type):
+        self.own_layout()
+        return super().filter_by_widget(widget_type)
+
+    def exclude_by_widget(self, widget_type):
+        self.own_layout()
+        return super().exclude_by_widget(widget_type)
+
+    def __getitem__(self, key):
+        # Templates look up the helper's attributes with helper[name].
+        if not (isinstance(key, str) and hasattr(self, key)):
+            self.own_layout()
+        return super().__getitem__(key)
+
+    def get_cache_key(self, form, template_pack=TEMPLATE_PACK):
+        """
+        Return the key used to cache the HTML for a form, or None if the form
+        should not be cached.
+
+        Only unbound forms with no per-instance initial values are cached.
+        The key is made from the form class, the active language, the
+        template pack, the form's ``prefix``, ``auto_id`` and
+        ``label_suffix``, and the helper's attributes. The layout and inputs
+        are assumed to be the same for every instance of the form class.
+        Override this method if the HTML also depends on something else.
+
+        Args:
+            form (Form): the form being rendered.
+
+            template_pack (str, optional): the template pack being rendered.
+
+        Returns:
+            str: the cache key.
+
+        """
+        if not self.cache_unbound or form.is_bound or form.initial:
+            return None
+
+        attributes = self.get_attributes(template_pack=template_pack)
+        config = repr(
+            (
+                form.prefix,
+                form.auto_id,
+                form.label_suffix,
+                sorted(
+                    (name, value)
+                    for name, value in attributes.items()
+                    if isinstance(
+                        value, (str, int, float, bool, dict, type(None))
+                    )
+                ),
+            )
+        )
+        digest = hashlib.sha256(config.encode())
+        return "tbxforms:form:%s.%s:%s:%s:%s" % (
+            form.__class__.__module__,
+            form.__class__.__qualname__,
+            get_language(),
+            template_pack,
+            digest.hexdigest(),
+        )
+
     def render_layout(self, form, context, template_pack=TEMPLATE_PACK):
         """
         Returns safe html of the rendering of the layout.
@@ -75,7 +285,8 @@ class FormHelper(crispy_forms_helper.FormHelper):
         # required by the form. The browser validation interferes with the way
         # validation errors are reported so adding required attributes is
         # disabled at the form level.
-        form.use_required_attribute = False
+        if form.use_required_attribute:
+            form.use_required_attribute = False
 
         if self.label_size:
             context["label_size"] = Size.for_label(self.label_size)
@@ -91,6 +302,327 @@ class FormHelper(crispy_forms_helper.FormHelper):
                 settings, "TBXFORMS_HIGHLIGHT_REQUIRED_FIELDS", False
             )
 
-        return super().render_layout(
-            form, context, template_pack=template_pack
+        # The choices of model choice fields are cached while the form is
+        # rendered so each queryset is only evaluated once.
+        with choice_cache():
+            context["conditional_expanded"] = get_expanded(form, self.layout)
+            if (
+                self.compiled_layout
+                and template_pack in TEMPLATE_PACKS
+                and not self.field_template
+            ):
+                plan = get_render_plan(form, self.layout)
+                return plan.render(
+                    self, RenderForm(form), context, template_pack
+                )
+
+            return super().render_layout(
+                RenderForm(form), context, template_pack=template_pack
+            )
+
+    def render_form(self, form, context=None, template_pack=TEMPLATE_PACK):
+        """
+        Render a form, producing the same HTML as the ``{% crispy %}`` tag.
+
+        The ``{% crispy %}`` tag stores the helper and template pack on the
+        template node, and the HTML of the layout on the form, while it is
+        rendered. Here they are held in local variables, and the fields
+        rendered are recorded by ``RenderForm``, so the same form can be
+        rendered from several threads at once. This is used by the
+        ``{% crispy_tbx %}`` tag.
+
+        Args:
+            form (BaseForm): the form to render.
+
+            context (dict, optional): the template context. It should contain
+                the ``csrf_token`` if the form is submitted with POST.
+
+            template_pack (str, optional): the template pack to use.
+
+        Returns:
+            str: the HTML for the form.
+
+        """
+        template_pack = getattr(self, "template_pack", None) or template_pack
+        if context is None:
+            context = Context()
+        elif not isinstance(context, Context):
+            context = Context(context)
+
+        node = BasicNode(form, None, template_pack=template_pack)
+        response_dict = node.get_response_dict(self, context, False)
+        node_context = context.__copy__()
+        node_context.update({"is_bound": form.is_bound})
+        node_context.update(response_dict)
+        final_context = node_context.__copy__()
+
+        form_html = None
+        if self.layout:
+            form_html = self.render_layout(
+                form, node_context, template_pack=template_pack
+            )
+        final_context.update({"form": form, "form_html": form_html})
+
+        template = get_template(
+            self.template or "%s/whole_uni_form.html" % template_pack
+        )
+        return template.render(final_context.flatten())
+
+    def get_formset_context(self, formset, context, template_pack):
+        """
+        Return the context for rendering a formset one piece at a time, as
+        a Context used for rendering the layout of each form and a dict used
+        for rendering the templates.
+        """
+        if context is None:
+            context = Context()
+        elif not isinstance(context, Context):
+            context = Context(context)
+
+        node = BasicNode(formset, None, template_pack=template_pack)
+        response_dict = node.get_response_dict(self, context, True)
+        node_context = context.__copy__()
+        node_context.update({"is_bound": formset.is_bound})
+        node_context.update(response_dict)
+        values = node_context.flatten()
+        values["formset"] = formset
+        if not self.render_hidden_fields:
+            self.render_hidden_fields = True
+        return node_context, values
+
+    def render_formset_form(
+        self, form, forloop, node_context, values, template_pack
+    ):
+        """
+        Render one form of a formset, as ``display_form.html`` does when the
+        whole formset is rendered.
+        """
+        form_html = None
+        if self.layout:
+            with node_context.push(forloop=forloop, formset_form=form):
+                form_html = self.render_layout(
+                    form, node_context, template_pack=template_pack
+                )
+        display_form = get_template("%s/display_form.html" % template_pack)
+        return display_form.render(
+            dict(values, form=form, form_html=form_html)
+        )
+
+    def get_formset_rows(self, formset, node_context):
+        """
+        Return the arguments for rendering each form of a formset with
+        ``render_formset_form()``: the form and its own copies of the forloop
+        and context, so the forms can be rendered in any order.
+        """
+        rows = []
+        forloop = ForLoopSimulator(formset)
+        for form in formset:
+            rows.append((form, copy.copy(forloop), node_context.__copy__()))
+            forloop.iterate()
+        return rows
+
+    def render_formset_forms(
+        self, formset, node_context, values, template_pack
+    ):
+        """
+        Render the forms of a formset, in parallel when ``render_threads``
+        is set, and return the HTML for each one in order.
+
+        The forms are rendered in threads from a shared pool. Each one is
+        rendered with a copy of the context variables of the calling thread,
+        so the choice cache and active language are shared. The choices of
+        model choice fields are fetched into the cache by the calling thread
+        first, so they are read on its database connection, inside any
+        transaction it has open. Database connections opened by the pool
+        threads, e.g. by templates following relations, are closed after
+        each form. A formset rendered from inside a form of another formset
+        is rendered in the calling thread, so the pool cannot run out of
+        threads waiting for itself.
+        """
+        rows = self.get_formset_rows(formset, node_context)
+        if not self.render_threads or getattr(_worker, "active", False):
+            return [
+                self.render_formset_form(
+                    form, forloop, row_context, values, template_pack
+                )
+                for form, forloop, row_context in rows
+            ]
+
+        prefetch_choices([form for form, forloop, row_context in rows])
+        executor = get_executor(self.render_threads)
+        futures = [
+            executor.submit(
+                _run_in_worker,
+                contextvars.copy_context(),
+                self.render_formset_form,
+                form,
+                forloop,
+                row_context,
+                values,
+                template_pack,
+            )
+            for form, forloop, row_context in rows
+        ]
+        return [future.result() for future in futures]
+
+    def render_formset(
+        self, formset, context=None, template_pack=TEMPLATE_PACK
+    ):
+        """
+        Render a formset, producing the same HTML as the ``{% crispy %}``
+        tag. The forms are rendered in parallel when ``render_threads`` is
+        set.
+
+        Args:
+            formset (BaseFormSet): the formset to render.
+
+            context (dict, optional): the template context. It should contain
+                the ``csrf_token`` if the formset is submitted with POST.
+
+            template_pack (str, optional): the template pack to use.
+
+        Returns:
+            str: the HTML for the formset.
+
+        """
+        template_pack = getattr(self, "template_pack", None) or template_pack
+        node_context, values = self.get_formset_context(
+            formset, context, template_pack
+        )
+        with choice_cache():
+            forms = self.render_formset_forms(
+                formset, node_context, values, template_pack
+            )
+        return "".join(
+            [
+                get_template("%s/formset_open.html" % template_pack).render(
+                    values
+                ),
+                *forms,
+                get_template("%s/formset_close.html" % template_pack).render(
+                    values
+                ),
+            ]
+        )
+
+    def render_iter(self, formset, context=None, template_pack=TEMPLATE_PACK):
+        """
+        Render a formset one piece at a time.
+
+        This produces the same HTML as the ``{% crispy %}`` tag but yields the
+        opening <form> tag and management form, then each form, then the
+        inputs and closing tag, so only one form is held in memory at a time.
+        It is intended for very large formsets, e.g.: ::
+
+            context = {"csrf_token": get_token(request)}
+            return StreamingHttpResponse(
+                formset.helper.render_iter(formset, context)
+            )
+
+        Args:
+            formset (BaseFormSet): the formset to render.
+
+            context (dict, optional): the template context. It should contain
+                the ``csrf_token`` if the formset is submitted with POST.
+
+            template_pack (str, optional): the template pack to use.
+
+        Yields:
+            str: the HTML for each part of the formset.
+
+        """
+        template_pack = getattr(self, "template_pack", None) or template_pack
+        node_context, values = self.get_formset_context(
+            formset, context, template_pack
+        )
+
+        yield get_template("%s/formset_open.html" % template_pack).render(
+            values
+        )
+
+        forloop = ForLoopSimulator(formset)
+        with choice_cache():
+            for form in formset:
+                yield self.render_formset_form(
+                    form, forloop, node_context, values, template_pack
+                )
+                forloop.iterate()
+
+        yield get_template("%s/formset_close.html" % template_pack).render(
+            values
+        )
+
+    async def arender(self, form, context=None, template_pack=TEMPLATE_PACK):
+        """
+        Render a form or formset from an async view.
+
+        Django templates are rendered synchronously, so each render runs in
+        a thread from the executor used by ``sync_to_async`` for code that
+        is not thread sensitive, rather than the single thread shared by the
+        ORM, and any database connections it opens are closed afterwards.
+        The choices of model choice fields are fetched first, with the async
+        ORM, and cached while the form is rendered. The forms of a formset
+        are rendered concurrently and joined in order. e.g.: ::
+
+            async def view(request):
+                form = ExampleForm()
+                context = {"csrf_token": get_token(request)}
+                html = await form.helper.arender(form, context)
+                return render(request, "page.html", {"form_html": html})
+
+        Args:
+            form (BaseForm, BaseFormSet): the form or formset to render.
+
+            context (dict, optional): the template context. It should contain
+                the ``csrf_token`` if the form is submitted with POST.
+
+            template_pack (str, optional): the template pack to use.
+
+        Returns:
+            str: the HTML, the same as the ``{% crispy %}`` tag renders.
+
+        """
+        with choice_cache():
+            if not isinstance(form, BaseFormSet):
+                await aprefetch_choices([form])
+                return await sync_to_async(
+                    _close_connections_after, thread_sensitive=False
+                )(self.render_form, form, context, template_pack)
+
+            await aprefetch_choices(form.forms)
+            template_pack = (
+                getattr(self, "template_pack", None) or template_pack
+            )
+            node_context, values = self.get_formset_context(
+                form, context, template_pack
+            )
+
+            render_form = sync_to_async(
+                _close_connections_after, thread_sensitive=False
+            )
+            rows = [
+                render_form(
+                    self.render_formset_form,
+                    formset_form,
+                    forloop,
+                    row_context,
+                    values,
+                    template_pack,
+                )
+                for formset_form, forloop, row_context in (
+                    self.get_formset_rows(form, node_context)
+                )
+            ]
+            html = await asyncio.gather(*rows)
+
+        return "".join(
+            [
+                get_template("%s/formset_open.html" % template_pack).render(
+                    values
+                ),
+                *html,
+                get_template("%s/formset_close.html" % template_pack).render(
+                    values
+                ),
+            ]
         )
@@ -6,6 +6,10 @@ from crispy_forms.utils import (
     flatatt,
 )
 
+from tbxforms.conditional import (
+    ConditionalRule,
+    get_conditional_context,
+)
 from tbxforms.layout import (
     Size,
     setup_conditional_attrs,
@@ -50,8 +54,23 @@ class Div(crispy_forms_layout.Div):
     def __init__(self, *fields, **kwargs):
         # Setup conditional attributes.
         kwargs = setup_conditional_attrs(attrs=kwargs)
+        self.conditional = ConditionalRule.from_attrs(kwargs)
         super().__init__(*fields, **kwargs)
 
+    def render(self, form, context, template_pack=TEMPLATE_PACK, **kwargs):
+        fields = self.get_rendered_fields(
+            form, context, template_pack, **kwargs
+        )
+        template = self.get_template_name(template_pack)
+        return render_to_string(
+            template,
+            {
+                "div": self,
+                "fields": fields,
+                **get_conditional_context(form, self.conditional),
+            },
+        )
+
 
 class Fieldset(crispy_forms_layout.LayoutObject):
     """
@@ -125,6 +144,7 @@ class Fieldset(crispy_forms_layout.LayoutObject):
 
         # Setup conditional attributes.
         kwargs = setup_conditional_attrs(attrs=kwargs)
+        self.conditional = ConditionalRule.from_attrs(kwargs)
 
         self.css_id = kwargs.pop("css_id", None)
         self.template = kwargs.pop("template", self.template)
@@ -137,6 +157,7 @@ class Fieldset(crispy_forms_layout.LayoutObject):
         context = {
             "fieldset": self,
             "fields": fields,
+            **get_conditional_context(form, self.conditional),
         }
         context.update(self.context)
         template = self.get_template_name(template_pack)
@@ -1,15 +1,23 @@
+import copy
+
 from crispy_forms import layout as crispy_forms_layout
 from crispy_forms.utils import (
     TEMPLATE_PACK,
     flatatt,
 )
 
+from tbxforms import TEMPLATE_PACKS
+from tbxforms.conditional import (
+    ConditionalRule,
+    get_conditional_context,
+)
 from tbxforms.layout import (
     Fixed,
     Fluid,
     Size,
     setup_conditional_attrs,
 )
+from tbxforms.templatetags.tbxforms import copy_widget
 
 
 class Field(crispy_forms_layout.LayoutObject):
@@ -430,6 +438,7 @@ class Field(crispy_forms_layout.LayoutObject):
 
         self.attrs.update(kwargs)
         self.flat_attrs = flatatt(self.attrs)
+        self.conditional = ConditionalRule.from_attrs(self.attrs)
 
     def render(
         self,
@@ -439,16 +448,72 @@ class Field(crispy_forms_layout.LayoutObject):
         **kwargs,
     ):
         template = self.get_template_name(template_pack)
+        attrs = self.attrs
+        extra_context = {
+            **get_conditional_context(form, self.conditional),
+            **self.context,
+        }
+        # django-crispy-forms adds the attributes to the form's widgets. The
+        # template pack's field template gets them from the context instead,
+        # so the form is not changed. Other templates render the widget with
+        # {{ field }} or {% crispy_field %}, so they are given copies of the
+        # bound fields with the attributes added to copies of their widgets.
+        # Fields changed to a hidden input are left to django-crispy-forms.
+        if attrs.get("type") != "hidden":
+            extra_context = {
+                "flat_attrs": flatatt(attrs),
+                "widget_attrs": attrs,
+                **extra_context,
+            }
+            if not self.uses_pack_template(template, template_pack):
+                form = WidgetAttrsForm(form, attrs)
+            attrs = None
         return self.get_rendered_fields(
             form,
             context,
             template_pack,
             template=template,
-            attrs=self.attrs,
-            extra_context=self.context,
+            attrs=attrs,
+            extra_context=extra_context,
             **kwargs,
         )
 
+    @staticmethod
+    def uses_pack_template(template, template_pack):
+        """
+        Return whether the field is rendered with the field template of one
+        of the tbxforms template packs, which adds the attributes of the
+        layout ``Field`` to the widget itself.
+        """
+        return (
+            template_pack in TEMPLATE_PACKS
+            and template == "%s/field.html" % template_pack
+        )
+
+
+class WidgetAttrsForm:
+    """
+    A proxy for a form which returns copies of its bound fields, with the
+    attributes of a layout ``Field`` added to copies of their widgets, so
+    the form itself is not changed.
+    """
+
+    __slots__ = ("form", "attrs")
+
+    def __init__(self, form, attrs):
+        self.form = form
+        self.attrs = attrs
+
+    def __getattr__(self, name):
+        return getattr(self.form, name)
+
+    def __getitem__(self, name):
+        field = copy.copy(self.form[name].field)
+        field.widget, widgets = copy_widget(field.widget)
+        for widget in widgets:
+            widget.attrs = {**widget.attrs, **self.attrs}
+        return field.get_bound_field(self.form, name)
+
 
 class Hidden(crispy_forms_layout.Hidden):
     """
@@ -0,0 +1,239 @@
+import inspect
+import json
+import time
+
+from contextlib import (
+    ExitStack,
+    contextmanager,
+)
+
+from django.core.management.base import (
+    BaseCommand,
+    CommandError,
+)
+from django.db import connections
+from django.forms.models import BaseModelForm
+from django.template import Template
+from django.test.utils import CaptureQueriesContext
+
+from crispy_forms.utils import render_crispy_form
+
+from tbxforms.registry import (
+    autodiscover,
+    get_form_classes,
+    get_form_path,
+)
+
+# The states each form is rendered in, and the data it is bound to.
+STATES = (
+    ("unbound", None),
+    ("errors", {}),
+)
+
+
+@contextmanager
+def count_templates():
+    """
+    Record the name of every template rendered in the block.
+    """
+    names = []
+    render = Template._render
+
+    def instrumented_render(self, context):
+        names.append(self.name)
+        return render(self, context)
+
+    Template._render = instrumented_render
+    try:
+        yield names
+    finally:
+        Template._render = render
+
+
+@contextmanager
+def capture_queries():
+    """
+    Record the queries run, on every database, in the block.
+    """
+    with ExitStack() as stack:
+        contexts = [
+            stack.enter_context(CaptureQueriesContext(connection))
+            for connection in connections.all()
+        ]
+        yield contexts
+
+
+def get_skip_reason(form_class):
+    """
+    Return why a form class cannot be profiled, or None if it can. Abstract
+    model forms and forms which need more arguments than ``data`` cannot be
+    instantiated by the command.
+    """
+    if (
+        issubclass(form_class, BaseModelForm)
+        and form_class._meta.model is None
+    ):
+        return "it is a model form without a model"
+    try:
+        inspect.signature(form_class).bind(data=None)
+    except TypeError:
+        return "it needs arguments other than data"
+    except ValueError:
+        # The signature cannot be inspected, so try to render it.
+        pass
+    return None
+
+
+def profile_form(form_class, data, number):
+    """
+    Render a form and return the time taken, the size of the output and
+    the number of templates rendered and queries run.
+
+    The form is rendered ``number`` times. The time is the fastest render,
+    the other figures are for the last render.
+    """
+    timings = []
+    for index in range(number):
+        form = form_class(data=data)
+        with count_templates() as templates, capture_queries() as queries:
+            start = time.perf_counter()
+            html = render_crispy_form(form)
+            timings.append(time.perf_counter() - start)
+
+    return {
+        "time": min(timings) * 1000,
+        "bytes": len(html.encode()),
+        "templates": len(templates),
+        "queries": sum(len(context) for context in queries),
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Render every registered tbxforms form, unbound and bound with "
+        "errors, and report the render time, output size and number of "
+        "templates and database queries."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "prefixes",
+            nargs="*",
+            metavar="prefix",
+            help="Only profile forms whose dotted path starts with prefix.",
+        )
+        parser.add_argument(
+            "--exclude",
+            action="append",
+            default=[],
+            metavar="prefix",
+            help=(
+                "Skip forms whose dotted path starts with prefix. Can be "
+                "used more than once."
+            ),
+        )
+        parser.add_argument(
+            "--number",
+            type=int,
+            default=5,
+            help="The number of times each form is rendered (default: 5).",
+        )
+        parser.add_argument(
+            "--max-time",
+            type=float,
+            help="Fail if a render takes longer than this, in milliseconds.",
+        )
+        parser.add_argument(
+            "--max-queries",
+            type=int,
+            help="Fail if a render runs more database queries than this.",
+        )
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Output the results as JSON.",
+        )
+
+    def handle(self, *args, **options):
+        autodiscover()
+
+        form_classes = get_form_classes(options["prefixes"])
+        if options["exclude"]:
+            exclude = tuple(options["exclude"])
+            form_classes = [
+                form_class
+                for form_class in form_classes
+                if not get_form_path(form_class).startswith(exclude)
+            ]
+        if not form_classes:
+            raise CommandError("No forms found.")
+
+        results = []
+        failures = []
+        skipped = []
+        for form_class in form_classes:
+            path = get_form_path(form_class)
+            reason = get_skip_reason(form_class)
+            if reason is not None:
+                skipped.append("Skipped %s: %s." % (path, reason))
+                continue
+            for state, data in STATES:
+                try:
+                    result = profile_form(form_class, data, options["number"])
+                except Exception as e:
+                    failures.append("%s (%s): %r" % (path, state, e))
+                    continue
+
+                result = {"form": path, "state": state, **result}
+                results.append(result)
+                failures.extend(self.check_limits(result, options))
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+        elif results:
+            self.write_table(results)
+
+        for message in skipped:
+            self.stderr.write(message, style_func=self.style.WARNING)
+
+        if failures:
+            for failure in failures:
+                self.stderr.write(failure)
+            raise CommandError("%d checks failed." % len(failures))
+
+    def check_limits(self, result, options):
+        failures = []
+        label = "%s (%s)" % (result["form"], result["state"])
+        if options["max_time"] is not None:
+            if result["time"] > options["max_time"]:
+                failures.append(
+                    "%s: took %.2fms, the maximum is %.2fms."
+                    % (label, result["time"], options["max_time"])
+                )
+        if options["max_queries"] is not None:
+            if result["queries"] > options["max_queries"]:
+                failures.append(
+                    "%s: ran %d queries, the maximum is %d."
+                    % (label, result["queries"], options["max_queries"])
+                )
+        return failures
+
+    def write_table(self, results):
+        width = max([len(result["form"]) for result in results] + [4])
+        row = "%-" + str(width) + "s  %-7s  %9s  %9s  %9s  %7s"
+        self.stdout.write(
+            row
+            % ("Form", "State", "Time (ms)", "Bytes", "Templates", "Queries")
+        )
+        for result in results:
+            self.stdout.write(
+                row
+                % (
+                    result["form"],
+                    result["state"],
+                    "%.2f" % result["time"],
+                    result["bytes"],
+                    result["templates"],
+                    result["queries"],
+                )
+            )
@@ -0,0 +1,17 @@
+from tbxforms.choice_cache import choice_cache
+
+
+class ChoiceCacheMiddleware:
+    """
+    Cache the choices of model choice fields for the whole request, so
+    forms validated and rendered in the same request run each query once.
+
+    See ``tbxforms.choice_cache`` for details.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with choice_cache():
+            return self.get_response(request)
@@ -0,0 +1,78 @@
+"""
+A registry of the form classes which use tbxforms.
+
+Every subclass of ``TbxFormsMixin`` which is also a Django form is recorded
+when it is defined. The registry is used to warm up forms when Django starts
+and by the ``tbxforms_profile`` management command.
+
+Form classes are only recorded once the module defining them is imported.
+``autodiscover()`` imports the ``forms`` module of every installed app.
+The registry holds weak references, so form classes created on the fly,
+e.g. by ``BaseWagtailFormBuilder``, are removed once they are no longer
+used.
+"""
+
+import threading
+import weakref
+
+from django.utils.module_loading import autodiscover_modules
+
+_registry = weakref.WeakValueDictionary()
+_lock = threading.Lock()
+
+
+def get_form_path(form_class):
+    """
+    Return the dotted path used to identify a form class.
+    """
+    return "%s.%s" % (form_class.__module__, form_class.__qualname__)
+
+
+def register(form_class):
+    """
+    Add a form class to the registry. A class with the same dotted path
+    replaces the one already registered.
+    """
+    with _lock:
+        _registry[get_form_path(form_class)] = form_class
+    return form_class
+
+
+def unregister(form_class):
+    """
+    Remove a form class from the registry.
+    """
+    with _lock:
+        path = get_form_path(form_class)
+        if _registry.get(path) is form_class:
+            del _registry[path]
+
+
+def get_form_classes(prefixes=None):
+    """
+    Return the registered form classes, sorted by their dotted paths.
+
+    Args:
+        prefixes (iterable, optional): only return the form classes whose
+            dotted path starts with one of these.
+
+    Returns:
+        list: the form classes.
+
+    """
+    with _lock:
+        items = sorted(_registry.items())
+    if prefixes:
+        prefixes = tuple(prefixes)
+        items = [
+            (path, cls) for path, cls in items if path.startswith(prefixes)
+        ]
+    return [form_class for path, form_class in items]
+
+
+def autodiscover():
+    """
+    Import the ``forms`` module of every installed app so the form classes
+    they define are registered.
+    """
+    autodiscover_modules("forms")
@@ -0,0 +1,840 @@
+"""
+A compiled renderer for tbxforms layouts.
+
+Rendering a form with the template pack goes through ``field.html`` for every
+field, which in turn includes the templates for checkboxes, radios, help text
+and errors. The compiled renderer walks the ``Layout`` once, turning the
+``Field``, ``Div``, ``Fieldset``, ``Button`` and ``HTML`` objects into a list
+of render steps, and then produces the same markup as the templates directly
+from Python.
+
+The renderer is opt-in. Enable it on a form's helper: ::
+
+    self.helper.compiled_layout = True
+
+The render plan is cached per form class. It is reused for any ``Layout``
+with the same structure - the same types of layout objects with the same
+attributes - so forms which build their layout in ``__init__`` compile it
+once rather than for every instance. The steps keep the values they need
+from the layout objects when the plan is built.
+
+Any layout object the renderer does not know how to compile - a custom
+template, a third-party layout object or a subclass that overrides
+``render()`` - is rendered by calling its ``render()`` method as usual.
+"""
+
+import logging
+import sys
+import weakref
+
+from django.conf import settings
+from django.template import Template
+from django.template.base import render_value_in_context
+from django.template.defaultfilters import (
+    slugify,
+    stringformat,
+    wordcount,
+)
+from django.templatetags.l10n import unlocalize
+from django.utils.html import conditional_escape
+from django.utils.safestring import mark_safe
+from django.utils.translation import gettext
+
+from crispy_forms import layout as crispy_forms_layout
+from crispy_forms.utils import (
+    TEMPLATE_PACK,
+    flatatt,
+    list_difference,
+    render_field,
+)
+
+from tbxforms.choice_cache import get_choices
+from tbxforms.conditional import (
+    ConditionalRule,
+    get_conditional_context,
+)
+from tbxforms.layout import (
+    HTML,
+    Button,
+    Div,
+    Field,
+    Fieldset,
+    Layout,
+)
+from tbxforms.templatetags.tbxforms import (
+    CHECKBOX,
+    CHECKBOXES,
+    MULTIVALUE,
+    RADIOS,
+    aria_expanded,
+    error_messages,
+    fieldset_describedby,
+    get_field_kind,
+    render_field_widget,
+    selected_values,
+    show_as_required,
+)
+
+_plans = weakref.WeakKeyDictionary()
+
+
+def get_render_plan(form, layout):
+    """
+    Return the cached render plan for a form class and layout.
+
+    Args:
+        form (Form): the form being rendered.
+
+        layout (Layout): the layout from the form's helper.
+
+    Returns:
+        RenderPlan: the compiled layout.
+
+    """
+    # Instances share the layout objects but may have their own copy of the
+    # Layout, so the plan is matched on the contents rather than the Layout,
+    # and then on their structure when each instance builds its own layout.
+    fields = tuple(layout.fields)
+    cached = _plans.get(form.__class__)
+    if cached is not None and cached[0] == fields:
+        return cached[2]
+
+    signature = get_signature(fields)
+    if cached is not None and cached[1] == signature:
+        plan = cached[2]
+    else:
+        plan = RenderPlan(compile_steps(fields))
+    _plans[form.__class__] = (fields, signature, plan)
+    return plan
+
+
+def get_signature(fields):
+    """
+    Return a value which is equal for the contents of two layouts when they
+    compile to the same render plan.
+
+    Layout objects the renderer does not compile are matched by identity, as
+    they are rendered by calling their own ``render()`` method.
+    """
+    signature = []
+    for layout_object in fields:
+        if isinstance(layout_object, str):
+            signature.append(layout_object)
+        elif not is_compiled(layout_object):
+            signature.append(id(layout_object))
+        else:
+            signature.append(
+                (
+                    type(layout_object),
+                    repr(
+                        sorted(
+                            (name, value)
+                            for name, value in vars(layout_object).items()
+                            if name != "fields"
+                        )
+                    ),
+                    get_signature(getattr(layout_object, "fields", ())),
+                )
+            )
+    return tuple(signature)
+
+
+def is_compiled(layout_object):
+    """
+    Check whether the renderer compiles a layout object into its own step,
+    rather than calling its ``render()`` method.
+    """
+    if _is_default(layout_object, Field, "%s/field.html"):
+        # A Field can wrap other layout objects, e.g. after
+        # helper["name"].wrap(Div), which only its render() handles.
+        return all(isinstance(name, str) for name in layout_object.fields)
+    return (
+        _is_default(layout_object, Div, "%s/layout/div.html")
+        or _is_default(layout_object, Fieldset, "%s/layout/fieldset.html")
+        or _is_default(layout_object, Button, "%s/layout/button.html")
+        or type(layout_object)
+        in (HTML, crispy_forms_layout.HTML, Layout, crispy_forms_layout.Layout)
+    )
+
+
+def compile_steps(fields):
+    """
+    Convert the contents of a layout object into a list of render steps.
+    """
+    return [compile_step(field) for field in fields]
+
+
+def compile_step(layout_object):
+    """
+    Convert a single layout object into a render step.
+    """
+    if isinstance(layout_object, str):
+        return FieldStep((layout_object,))
+    if not is_compiled(layout_object):
+        return LayoutObjectStep(layout_object)
+    if isinstance(layout_object, Field):
+        return FieldStep(
+            layout_object.fields,
+            attrs=layout_object.attrs,
+            extra_context=layout_object.context,
+        )
+    if isinstance(layout_object, Div):
+        return DivStep(layout_object, compile_steps(layout_object.fields))
+    if isinstance(layout_object, Fieldset):
+        return FieldsetStep(layout_object, compile_steps(layout_object.fields))
+    if isinstance(layout_object, Button):
+        return ButtonStep(layout_object)
+    if type(layout_object) in (HTML, crispy_forms_layout.HTML):
+        return HTMLStep(layout_object)
+    return ContainerStep(compile_steps(layout_object.fields))
+
+
+def _is_default(layout_object, cls, template):
+    """
+    Check whether a layout object can be rendered by the compiled renderer,
+    i.e. it does not use a custom template or override ``render()``.
+    """
+    return (
+        isinstance(layout_object, cls)
+        and type(layout_object).render is cls.render
+        and layout_object.template == template
+    )
+
+
+class RenderForm:
+    """
+    A form as seen by one render of its layout.
+
+    django-crispy-forms records the fields rendered so far, and the field
+    template, on the form. Rendering the same form from several threads at
+    once would then mix up their fields. A ``RenderForm`` holds them for one
+    render and passes everything else through to the form.
+    """
+
+    __slots__ = ("form", "rendered_fields", "crispy_field_template")
+
+    def __init__(self, form):
+        object.__setattr__(self, "form", form)
+        object.__setattr__(self, "rendered_fields", set())
+        object.__setattr__(self, "crispy_field_template", None)
+
+    def __getattr__(self, name):
+        return getattr(self.form, name)
+
+    def __setattr__(self, name, value):
+        if name in RenderForm.__slots__:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.form, name, value)
+
+    def __getitem__(self, name):
+        return self.form[name]
+
+    def __iter__(self):
+        return iter(self.form)
+
+
+class RenderState:
+    """
+    The state shared by the steps while a form is being rendered.
+    """
+
+    def __init__(self, form, context, template_pack):
+        self.form = form
+        self.context = context
+        self.template_pack = template_pack
+        self.values = context.flatten()
+
+
+class RenderPlan:
+    """
+    The compiled form of a ``Layout``.
+    """
+
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+
+    def render(self, helper, form, context, template_pack=TEMPLATE_PACK):
+        """
+        Render the layout, and any unmentioned fields the helper asks for,
+        the same way ``FormHelper.render_layout`` does.
+        """
+        form.rendered_fields = set()
+        form.crispy_field_template = helper.field_template
+
+        state = RenderState(form, context, template_pack)
+        html = "".join(step.render(state) for step in self.steps)
+
+        if (
+            helper.render_unmentioned_fields
+            or helper.render_hidden_fields
+            or helper.render_required_fields
+        ):
+            fields = tuple(form.fields.keys())
+            for field in list_difference(fields, form.rendered_fields):
+                if (
+                    helper.render_unmentioned_fields
+                    or (
+                        helper.render_hidden_fields
+                        and form.fields[field].widget.is_hidden
+                    )
+                    or (
+                        helper.render_required_fields
+                        and form.fields[field].widget.is_required
+                    )
+                ):
+                    html += render_field(
+                        field, form, context, template_pack=template_pack
+                    )
+
+        return mark_safe(html)
+
+
+class ContainerStep:
+    """
+    Render the contents of a layout object with no markup of its own.
+    """
+
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+
+    def render(self, state):
+        return "".join(step.render(state) for step in self.steps)
+
+
+class LayoutObjectStep:
+    """
+    Render a layout object the compiled renderer does not support by calling
+    its ``render()`` method.
+    """
+
+    def __init__(self, layout_object):
+        self.layout_object = layout_object
+
+    def render(self, state):
+        return render_field(
+            self.layout_object,
+            state.form,
+            state.context,
+            template_pack=state.template_pack,
+        )
+
+
+class HTMLStep:
+    """
+    Render an ``HTML`` layout object, compiling its template only once.
+    """
+
+    def __init__(self, layout_object):
+        self.template = Template(str(layout_object.html))
+
+    def render(self, state):
+        return self.template.render(state.context)
+
+
+class ButtonStep:
+    """
+    Render a ``Button`` - the equivalent of ``layout/button.html``.
+    """
+
+    def __init__(self, button):
+        self.name = button.name
+        self.value = button.value
+        self.css_class = button.css_class
+        self.id = button.id
+        self.flat_attrs = button.flat_attrs
+        value = str(button.value)
+        if "{{" in value or "{%" in value:
+            self.value_template = Template(value)
+        else:
+            self.value_template = None
+
+    def render(self, state):
+        context = state.context
+
+        if self.value_template is not None:
+            value = self.value_template.render(context)
+        else:
+            value = self.value
+
+        if wordcount(self.name) > 1:
+            name = slugify(self.name)
+        else:
+            name = self.name
+
+        if self.css_class:
+            css_class = _v(self.css_class, context)
+        else:
+            css_class = "tbxforms-button tbxforms-button--primary"
+
+        if self.id:
+            css_id = _v(self.id, context)
+        else:
+            css_id = "id_%s" % slugify(self.name)
+
+        return '<button name="%s" class="%s" id="%s" %s>%s</button>' % (
+            _v(name, context),
+            css_class,
+            css_id,
+            self.flat_attrs,
+            _v(value, context),
+        )
+
+
+class DivStep:
+    """
+    Render a ``Div`` - the equivalent of ``layout/div.html``.
+    """
+
+    def __init__(self, div, steps):
+        self.css_id = div.css_id
+        self.css_class = div.css_class
+        self.conditional = getattr(div, "conditional", None)
+        self.flat_attrs = div.flat_attrs
+        self.steps = tuple(steps)
+
+    def render(self, state):
+        context = state.context
+        fields = "".join(step.render(state) for step in self.steps)
+
+        html = ["<div "]
+        if self.css_id:
+            html.append('id="%s"' % _v(self.css_id, context))
+        html.append(' class="tbxforms-form-group')
+        if self.css_class:
+            html.append(" %s" % _v(self.css_class, context))
+        html.append(_conditional(state.form, self.conditional))
+        html.append(" %s>%s</div>" % (self.flat_attrs, fields))
+        return "".join(html)
+
+
+class FieldsetStep:
+    """
+    Render a ``Fieldset`` - the equivalent of ``layout/fieldset.html``.
+    """
+
+    def __init__(self, fieldset, steps):
+        self.css_id = fieldset.css_id
+        self.css_class = fieldset.css_class
+        self.conditional = getattr(fieldset, "conditional", None)
+        self.flat_attrs = fieldset.flat_attrs
+        self.legend = fieldset.context.get("legend")
+        self.legend_size = fieldset.context.get("legend_size")
+        self.legend_tag = fieldset.context.get("legend_tag")
+        self.steps = tuple(steps)
+
+    def render(self, state):
+        context = state.context
+        fields = "".join(step.render(state) for step in self.steps)
+
+        html = ["<fieldset "]
+        if self.css_id:
+            html.append('id="%s"' % _v(self.css_id, context))
+        html.append(' class="tbxforms-form-group')
+        if self.css_class:
+            html.append(" %s" % _v(self.css_class, context))
+        html.append(_conditional(state.form, self.conditional))
+        html.append("\n    %s\n  >" % self.flat_attrs)
+        if self.legend:
+            html.append(
+                _legend(
+                    self.legend, self.legend_size, self.legend_tag, context
+                )
+            )
+        html.append("%s</fieldset>" % fields)
+        return "".join(html)
+
+
+class FieldStep:
+    """
+    Render one or more form fields - the equivalent of ``field.html``.
+    """
+
+    def __init__(self, names, attrs=None, extra_context=None):
+        self.names = tuple(names)
+        self.attrs = dict(attrs) if isinstance(attrs, dict) else attrs
+        self.extra_context = dict(extra_context or {})
+        self.flat_attrs = flatatt(attrs if isinstance(attrs, dict) else {})
+        # Fields changed to hidden inputs are given a new widget, as
+        # django-crispy-forms does. Other attributes are passed to
+        # render_field_widget() rather than added to the form's widgets.
+        self.hidden = isinstance(attrs, dict) and attrs.get("type") == "hidden"
+        self.conditional = ConditionalRule.from_attrs(attrs)
+
+    def render(self, state):
+        return "".join(self.render_field(state, name) for name in self.names)
+
+    def render_field(self, state, name):
+        form = state.form
+
+        conditional = get_conditional_context(form, self.conditional)
+
+        values = dict(state.values)
+        values["flat_attrs"] = self.flat_attrs
+        values.update(conditional)
+        values.update(self.extra_context)
+        if self.attrs is not None and not self.hidden:
+            values["widget_attrs"] = self.attrs
+
+        # The character count message is translated with {% blocktrans %}
+        # so the template is used to get exactly the same message ids.
+        if values.get("max_characters") or values.get("max_words"):
+            if self.hidden:
+                return render_field(
+                    name,
+                    form,
+                    state.context,
+                    attrs=self.attrs,
+                    template_pack=state.template_pack,
+                    extra_context={**conditional, **self.extra_context},
+                )
+            return render_field(
+                name,
+                form,
+                state.context,
+                template_pack=state.template_pack,
+                extra_context={
+                    "flat_attrs": self.flat_attrs,
+                    "widget_attrs": self.attrs,
+                    **conditional,
+                    **self.extra_context,
+                },
+            )
+
+        fail_silently = getattr(settings, "CRISPY_FAIL_SILENTLY", True)
+
+        try:
+            bound_field = form[name]
+        except KeyError:
+            if not fail_silently:
+                raise Exception("Could not resolve form field '%s'." % name)
+            logging.warning(
+                "Could not resolve form field '%s'." % name,
+                exc_info=sys.exc_info(),
+            )
+            return ""
+
+        if name in form.rendered_fields:
+            if not fail_silently:
+                raise Exception(
+                    "A field should only be rendered once: %s" % name
+                )
+            logging.warning(
+                "A field should only be rendered once: %s" % name,
+                exc_info=sys.exc_info(),
+            )
+        form.rendered_fields.add(name)
+
+        if self.hidden:
+            self.apply_attrs(bound_field)
+
+        return render_bound_field(bound_field, state, values)
+
+    def apply_attrs(self, bound_field):
+        """
+        Replace the widget(s) with hidden inputs, as django-crispy-forms
+        does before rendering the field template.
+        """
+        field_instance = bound_field.field
+        if hasattr(field_instance.widget, "widgets"):
+            widgets = field_instance.widget.widgets
+            for index in range(len(widgets)):
+                widgets[index] = field_instance.hidden_widget(self.attrs)
+        else:
+            field_instance.widget = field_instance.hidden_widget(self.attrs)
+
+
+def _conditional(form, rule):
+    """
+    The end of the class attribute of a conditional container, and the
+    ``hidden`` attribute if it is hidden.
+    """
+    conditional = get_conditional_context(form, rule)
+    if not conditional:
+        return '"'
+    if conditional["conditional_hidden"]:
+        return ' tbxforms-conditional" hidden'
+    return ' tbxforms-conditional"'
+
+
+def _v(value, context):
+    """
+    Render a value as the ``{{ value }}`` template syntax would.
+    """
+    return render_value_in_context(value, context)
+
+
+def _legend(label, legend_size, legend_tag, context, marker=""):
+    html = ['<legend class="tbxforms-fieldset__legend']
+    if legend_size:
+        html.append(" %s" % _v(legend_size, context))
+    html.append('">')
+    if legend_tag:
+        html.append(
+            '<%s class="tbxforms-fieldset__heading">' % _v(legend_tag, context)
+        )
+    html.append(_v(label, context))
+    html.append(marker)
+    if legend_tag:
+        html.append("</%s>" % _v(legend_tag, context))
+    html.append("</legend>")
+    return "".join(html)
+
+
+def _marker(field, values):
+    """
+    The "(optional)" or "*" marker displayed after a label or legend.
+    """
+    # The line break matches the templates, so the formatted markup is the
+    # same as theirs.
+    if values.get("highlight_required_fields"):
+        if show_as_required(field):
+            return (
+                '\n <span class="tbxforms-field_marker--required" '
+                'title="%s">*</span>'
+            ) % conditional_escape(gettext("(required)"))
+    elif not show_as_required(field):
+        return '\n <span class="tbxforms-field_marker--optional">%s</span>' % (
+            conditional_escape(gettext("(optional)"))
+        )
+    return ""
+
+
+def _help_text_and_errors(field, context):
+    """
+    The equivalent of ``layout/help_text_and_errors.html``.
+    """
+    html = []
+    auto_id = _v(field.auto_id, context)
+    if field.help_text:
+        html.append(
+            '<p id="%s_hint" class="tbxforms-hint">%s</p>'
+            % (auto_id, _v(field.help_text, context))
+        )
+    for error, error_id in error_messages(field):
+        html.append(
+            '<p id="%s" class="tbxforms-error-message">'
+            '<span class="tbxforms-visually-hidden">%s</span> %s</p>'
+            % (
+                _v(error_id, context),
+                conditional_escape(gettext("Error:")),
+                _v(error, context),
+            )
+        )
+    return "".join(html)
+
+
+def _widget(field, values):
+    return render_field_widget(
+        field,
+        html5_required=values.get("html5_required", False),
+        template_pack=values.get("template_pack", TEMPLATE_PACK),
+        widget_attrs=values.get("widget_attrs"),
+        expanded=values.get("conditional_expanded"),
+    )
+
+
+def render_bound_field(field, state, values):
+    """
+    Render a bound field - the equivalent of ``field.html``.
+    """
+    context = state.context
+
+    if field.is_hidden:
+        return _v(field, context)
+
+    tag = _v(values["tag"], context) if values.get("tag") else "div"
+
+    html = []
+
+    css_class = "tbxforms-form-group"
+    if field.errors:
+        css_class += " tbxforms-form-group--error"
+    if values.get("wrapper_class"):
+        css_class += " %s" % _v(values["wrapper_class"], context)
+    css_classes = field.css_classes()
+    if css_classes:
+        css_class += " %s" % _v(css_classes, context)
+    if values.get("conditional"):
+        css_class += " tbxforms-conditional"
+
+    html.append(
+        '<%s id="div_%s" class="%s"%s>'
+        % (
+            tag,
+            _v(field.auto_id, context),
+            css_class,
+            " hidden" if values.get("conditional_hidden") else "",
+        )
+    )
+
+    kind = get_field_kind(field.field.widget)
+    if kind == CHECKBOXES:
+        html.append(_render_choices(field, context, values, "checkboxes"))
+    elif kind == RADIOS:
+        html.append(_render_choices(field, context, values, "radios"))
+    elif kind == MULTIVALUE:
+        html.append(_render_multifield(field, context, values))
+    else:
+        checkbox = kind == CHECKBOX
+        form_show_labels = values.get("form_show_labels")
+
+        if field.label and not checkbox and form_show_labels:
+            html.append(_label(field, context, values))
+
+        if checkbox and form_show_labels:
+            html.append(_help_text_and_errors(field, context))
+            html.append('<div class="tbxforms-checkboxes')
+            if values.get("checkboxes_small"):
+                html.append(" tbxforms-checkboxes--small")
+            html.append('"><div class="tbxforms-checkboxes__item">')
+            html.append(_widget(field, values))
+            html.append(
+                '<label class="tbxforms-label tbxforms-checkboxes__label" '
+                'for="%s">%s</label></div></div>'
+                % (
+                    _v(field.id_for_label, context),
+                    _v(field.label, context),
+                )
+            )
+        else:
+            html.append(_help_text_and_errors(field, context))
+            html.append(_widget(field, values))
+
+    html.append("</%s>" % tag)
+    return "".join(html)
+
+
+def _label(field, context, values):
+    label_tag = values.get("label_tag")
+    label_size = values.get("label_size")
+
+    html = []
+    if label_tag:
+        html.append(
+            '<%s class="tbxforms-label-wrapper">' % _v(label_tag, context)
+        )
+    html.append(
+        '<label for="%s" class="tbxforms-label'
+        % _v(field.id_for_label, context)
+    )
+    if label_size:
+        html.append(" %s" % _v(label_size, context))
+    html.append(
+        '">%s%s</label>' % (_v(field.label, context), _marker(field, values))
+    )
+    if label_tag:
+        html.append("</%s>" % _v(label_tag, context))
+    return "".join(html)
+
+
+def _fieldset_start(field, context, values):
+    """
+    The opening <fieldset> and <legend> shared by ``layout/checkboxes.html``,
+    ``layout/radios.html`` and ``layout/multifield.html``.
+    """
+    # The line breaks match the templates, so the formatted markup is the
+    # same as theirs.
+    html = ['<fieldset\n    class="tbxforms-fieldset"\n    ']
+    if field.help_text or field.errors:
+        html.append(
+            '\n        aria-describedby="%s"\n    '
+            % _v(fieldset_describedby(field), context)
+        )
+    html.append("\n    %s\n>" % _v(values.get("flat_attrs", ""), context))
+
+    if field.label:
+        html.append(
+            _legend(
+                field.label,
+                values.get("legend_size"),
+                values.get("legend_tag"),
+                context,
+                marker=_marker(field, values),
+            )
+        )
+
+    html.append(_help_text_and_errors(field, context))
+    return "".join(html)
+
+
+def _render_multifield(field, context, values):
+    """
+    The equivalent of ``layout/multifield.html``.
+    """
+    return "%s%s</fieldset>" % (
+        _fieldset_start(field, context, values),
+        _widget(field, values),
+    )
+
+
+def _render_choices(field, context, values, kind):
+    """
+    The equivalent of ``layout/checkboxes.html`` and ``layout/radios.html``.
+    """
+    html = [_fieldset_start(field, context, values)]
+
+    if kind == "checkboxes":
+        input_type = "checkbox"
+        inline = values.get("inline")
+        small = values.get("checkboxes_small")
+    else:
+        input_type = "radio"
+        inline = values.get("radios_inline")
+        small = values.get("radios_small")
+
+    html.append('<div class="tbxforms-%s' % kind)
+    if inline:
+        html.append("--inline")
+    if small:
+        html.append(" tbxforms-%s--small" % kind)
+    html.append('">')
+
+    selected = selected_values(field)
+    expanded = aria_expanded(values.get("conditional_expanded"), field)
+    name = _v(field.html_name, context)
+
+    for counter, choice in enumerate(get_choices(field.field), start=1):
+        choice_id = "id_%s_%s" % (name, _v(counter, context))
+        hint = getattr(choice, "hint", None)
+        divider = getattr(choice, "divider", None)
+
+        checked = stringformat(choice[0], "s") in selected
+
+        html.append(
+            '<div class="tbxforms-%s__item"><input type="%s" name="%s" '
+            'class="tbxforms-%s__input" id="%s" value="%s"'
+            % (
+                kind,
+                input_type,
+                name,
+                kind,
+                choice_id,
+                _v(unlocalize(choice[0]), context),
+            )
+        )
+        if checked:
+            html.append(' checked="checked"')
+        if hint:
+            html.append(' aria-describedby="%s_hint"' % choice_id)
+        if expanded:
+            html.append(' aria-expanded="%s"' % expanded)
+        html.append(
+            ' /><label class="tbxforms-label tbxforms-%s__label" for="%s">'
+            "%s</label>"
+            % (kind, choice_id, _v(unlocalize(choice[1]), context))
+        )
+        if hint:
+            html.append(
+                '<p id="%s_hint" class="tbxforms-hint tbxforms-%s__hint">'
+                "%s</p>" % (choice_id, kind, _v(hint, context))
+            )
+        html.append("</div>")
+        if divider:
+            html.append(
+                '<div class="tbxforms-%s__divider">%s</div>'
+                % (kind, _v(divider, context))
+            )
+
+    html.append("</div></fieldset>")
+    return "".join(html)
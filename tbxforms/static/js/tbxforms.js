@@ -23,9 +23,10 @@ function updateVisibility(
   } else {
     // For single fields, check the value directly
     const field = drivingFieldNodeList.item(0);
+    const value = field.type === 'checkbox' ? field.checked : field.value;
     shouldShow =
-      conditionalValuesForElement.includes(field.value) ||
-      conditionalValuesForElement.includes(Number(field.value));
+      conditionalValuesForElement.includes(value) ||
+      conditionalValuesForElement.includes(Number(value));
   }
 
   // Update visibility and aria states
@@ -44,19 +45,30 @@ function TbxForms(form) {
   this.form = form; // Stash the TbxForms DOM element.
   const self = this; // Stash the TbxForms instance.
 
-  // Loop through all elements within the given form (e.g. inputs, divs, fieldsets).
-  form.querySelectorAll('*').forEach(function (formElement) {
-    // If this element has conditional logic...
-    if (
-      formElement.dataset.conditionalFieldName &&
-      formElement.dataset.conditionalFieldValues
-    ) {
+  // The initial visibility and aria states are rendered by the server, but
+  // the browser may restore other values into the fields on reload or back
+  // navigation without firing change events, so they are checked again when
+  // the form is set up and whenever the page is shown.
+  form
+    .querySelectorAll('[data-conditional-field-name]')
+    .forEach(function (formElement) {
+      if (!formElement.dataset.conditionalFieldValues) {
+        return;
+      }
+
       const container = formElement.closest('.tbxforms-form-group')
         ? formElement.closest('.tbxforms-form-group')
         : formElement;
       const drivingFieldNodeList = form.querySelectorAll(
         '[name="' + formElement.dataset.conditionalFieldName + '"]'
       );
+
+      // The server shows fields which depend on a field the form does not
+      // render, so leave them as they are.
+      if (!drivingFieldNodeList.length) {
+        return;
+      }
+
       let conditionalValuesForElement;
 
       try {
@@ -67,27 +79,23 @@ function TbxForms(form) {
         throw 'Invalid JSON: ' + e;
       }
 
-      container.classList.add('tbxforms-conditional');
+      const update = function () {
+        updateVisibility(
+          container,
+          drivingFieldNodeList,
+          conditionalValuesForElement
+        );
+      };
 
       // Set up change listeners
       drivingFieldNodeList.forEach(function (field) {
-        field.addEventListener('change', function () {
-          updateVisibility(
-            container,
-            drivingFieldNodeList,
-            conditionalValuesForElement
-          );
-        });
+        field.addEventListener('change', update);
       });
+      window.addEventListener('pageshow', update);
 
       // Check initial state
-      updateVisibility(
-        container,
-        drivingFieldNodeList,
-        conditionalValuesForElement
-      );
-    }
-  });
+      update();
+    });
 
   // Clear any values for fields that are conditionally hidden.
   // NB. We don't use `form.elements.('[hidden]')` to include divs.
@@ -1,13 +1,90 @@
+import copy
+
 from django import (
     forms,
     template,
 )
 from django.conf import settings
-
+from django.core.cache import (
+    DEFAULT_CACHE_ALIAS,
+    caches,
+)
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.forms.formsets import BaseFormSet
+from django.template.defaulttags import CsrfTokenNode
+from django.utils.safestring import mark_safe
+
+from crispy_forms.templatetags.crispy_forms_tags import (
+    CrispyFormNode,
+    do_uni_form,
+)
 from crispy_forms.utils import TEMPLATE_PACK
 
+from tbxforms import TEMPLATE_PACKS
+from tbxforms.choice_cache import (
+    get_choices,
+    widget_choices,
+)
+from tbxforms.errors import (
+    get_error_index,
+    get_field_errors,
+)
+
 register = template.Library()
 
+# The CSS classes added to widgets, indexed by the lower-case name of the
+# widget class. Entries can be added or replaced using the
+# CRISPY_CLASS_CONVERTERS setting.
+CLASS_CONVERTERS = {
+    "checkboxinput": "tbxforms-checkboxes__input",
+    "select": "tbxforms-select",
+    "lazyselect": "tbxforms-select",
+    "textarea": "tbxforms-textarea",
+    "clearablefileinput": "tbxforms-file-upload",
+    "textinput": "tbxforms-input tbxforms-input--text",
+    "urlinput": "tbxforms-input tbxforms-input--url",
+    "numberinput": "tbxforms-input tbxforms-input--number",
+    "emailinput": "tbxforms-input tbxforms-input--email",
+    "passwordinput": "tbxforms-input tbxforms-input--password",
+}
+
+_widget_classes = {}
+
+
+def get_widget_classes(widget_class):
+    """
+    Return the CSS classes added to widgets of a given class.
+
+    The classes are looked up in CLASS_CONVERTERS and the
+    CRISPY_CLASS_CONVERTERS setting the first time a widget class is seen.
+    The result is cached until the setting is changed.
+
+    Args:
+        widget_class (type): the class of the widget.
+
+    Returns:
+        tuple: the names of the CSS classes.
+
+    """
+    try:
+        return _widget_classes[widget_class]
+    except KeyError:
+        pass
+
+    converters = CLASS_CONVERTERS.copy()
+    converters.update(getattr(settings, "CRISPY_CLASS_CONVERTERS", {}))
+    class_name = widget_class.__name__.lower()
+    classes = tuple(converters.get(class_name, class_name).split())
+    _widget_classes[widget_class] = classes
+    return classes
+
+
+@receiver(setting_changed)
+def clear_widget_classes(*, setting, **kwargs):
+    if setting == "CRISPY_CLASS_CONVERTERS":
+        _widget_classes.clear()
+
 
 @register.filter
 def show_as_required(boundfield):
@@ -16,7 +93,14 @@ def show_as_required(boundfield):
     the HTML 'required' flag, as they become 'required' via the clean method
     due to another action, such as selecting "Other" on a series of radio
     buttons) as required.
+
+    Forms using TbxFormsMixin work out which fields are shown as required
+    once, so this is a set lookup.
     """
+    names = getattr(boundfield.form, "fields_shown_as_required", None)
+    if names is not None:
+        return boundfield.name in names
+
     if any(
         [
             boundfield.field.required,
@@ -36,6 +120,80 @@ def dict_pop(d, key):
     return d.pop(key)
 
 
+@register.filter
+def aria_expanded(expanded, bound_field):
+    """
+    Template filter that returns the ``aria-expanded`` state of a field
+    which conditional fields depend on: "true", "false" or "" if nothing
+    depends on it. ``expanded`` is the ``conditional_expanded`` dict, which
+    is not set when a layout is rendered without its helper.
+    """
+    if not expanded or bound_field.name not in expanded:
+        return ""
+    return "true" if expanded[bound_field.name] else "false"
+
+
+@register.filter
+def selected_values(bound_field):
+    """
+    Template filter that returns the set of selected values for a field, as
+    strings, so checking whether a choice is selected is a single lookup.
+    """
+    value = bound_field.value()
+    if value is None:
+        return frozenset()
+    if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__"):
+        value = [value]
+    return frozenset(str(item) for item in value)
+
+
+@register.filter
+def field_choices(bound_field):
+    """
+    Template filter that returns the choices for a field, using the cached
+    choices for model choice fields.
+    """
+    return get_choices(bound_field.field)
+
+
+@register.filter
+def error_summary(form):
+    """
+    Template filter that returns the (field errors, message) pairs listed in
+    the error summary for a form.
+    """
+    return get_error_index(form).summary
+
+
+@register.filter
+def fieldset_describedby(bound_field):
+    """
+    Template filter that returns the aria-describedby attribute for the
+    <fieldset> wrapping checkboxes, radio buttons and multi-value fields.
+    """
+    errors = get_field_errors(bound_field)
+    value = (
+        "".join("%s " % error_id for error_id in errors.error_ids)
+        if errors
+        else ""
+    )
+    if bound_field.help_text:
+        value += "%s_hint" % bound_field.auto_id
+    return value
+
+
+@register.filter
+def error_messages(bound_field):
+    """
+    Template filter that returns the (message, id) pairs for the errors
+    displayed with a field, from the form's error index.
+    """
+    errors = get_field_errors(bound_field)
+    if errors is None:
+        return ()
+    return zip(errors.messages, errors.error_ids)
+
+
 @register.filter
 def field_errors(bound_field):
     """
@@ -46,6 +204,8 @@ def field_errors(bound_field):
     the dict to get over a limitation in the template syntax.
 
     """
+    field_errors = get_field_errors(bound_field)
+    messages = field_errors.messages if field_errors else ()
     seen = []
     errors = {}
     if hasattr(bound_field.field, "fields"):
@@ -54,7 +214,7 @@ def field_errors(bound_field):
             subfield_errors = getattr(subfield.widget, "errors", [])
             errors[key] = subfield_errors
             seen.extend(subfield_errors)
-    for error in bound_field.errors:
+    for error in messages:
         if error not in seen:
             errors.setdefault(bound_field.auto_id, [])
             errors[bound_field.auto_id].append(error)
@@ -121,6 +281,61 @@ def is_multivalue(field):
     return isinstance(field.field.widget, forms.MultiWidget)
 
 
+# The kinds of field returned by the field_kind filter. Each one is rendered
+# differently by the field.html template.
+CHECKBOX = "checkbox"
+CHECKBOXES = "checkboxes"
+INPUT = "input"
+MULTIVALUE = "multivalue"
+RADIOS = "radios"
+
+_field_kinds = {}
+
+
+def get_field_kind(widget):
+    """
+    Return the kind of field a widget is rendered as.
+
+    The result is cached by widget class, and input type since that decides
+    whether a widget is rendered as a checkbox or radio button.
+
+    Args:
+        widget (Widget): the field's widget.
+
+    Returns:
+        str: one of CHECKBOX, CHECKBOXES, INPUT, MULTIVALUE or RADIOS.
+
+    """
+    key = (widget.__class__, getattr(widget, "input_type", None))
+    try:
+        return _field_kinds[key]
+    except KeyError:
+        pass
+
+    if isinstance(widget, forms.CheckboxSelectMultiple):
+        kind = CHECKBOXES
+    elif isinstance(widget, forms.RadioSelect) and key[1] == "radio":
+        kind = RADIOS
+    elif isinstance(widget, forms.MultiWidget):
+        kind = MULTIVALUE
+    elif isinstance(widget, forms.CheckboxInput) and key[1] == "checkbox":
+        kind = CHECKBOX
+    else:
+        kind = INPUT
+
+    _field_kinds[key] = kind
+    return kind
+
+
+@register.filter
+def field_kind(field):
+    """
+    Template filter that returns the kind of field, e.g. "checkboxes" or
+    "radios", so the template can decide how to render it.
+    """
+    return get_field_kind(field.field.widget)
+
+
 def pairwise(iterable):
     """
     Splits a list of items into pairs: s -> (s0,s1), (s2,s3), (s4, s5), ...
@@ -129,188 +344,246 @@ def pairwise(iterable):
     return zip(a, a)
 
 
-class CrispyGDSFieldNode(template.Node):
+def copy_widget(widget):
     """
-    The TemplateNode used for rendering a field from the template pack.
+    Return a shallow copy of a widget, and of any widgets it wraps, to be
+    changed while a field is rendered.
+
+    The copies share the attributes and choices of the original. Replace
+    them, rather than changing them in place, so the original widget is
+    never changed.
+
+    Returns:
+        tuple: the copy and a list of the widgets to add attributes to.
+
+    """
+    widget = copy.copy(widget)
+    # There are special django widgets that wrap actual widgets,
+    # such as forms.widgets.MultiWidget,
+    # admin.widgets.RelatedFieldWidgetWrapper
+    if hasattr(widget, "widgets"):
+        widget.widgets = [copy.copy(subwidget) for subwidget in widget.widgets]
+        return widget, widget.widgets
+    if hasattr(widget, "widget"):
+        widget.widget = copy.copy(widget.widget)
+        return widget, [widget.widget]
+    return widget, [widget]
+
+
+def render_field_widget(  # noqa: C901
+    field,
+    attrs=None,
+    html5_required=False,
+    template_pack=TEMPLATE_PACK,
+    widget_attrs=None,
+    expanded=None,
+):
     """
+    Render the widget for a bound field, adding the CSS classes, ARIA
+    attributes and HTML5 required attribute expected by the template pack.
 
-    def __init__(self, field, attrs):
-        self.field = field
-        self.attrs = attrs
-        self.html5_required = "html5_required"
-
-    def render(self, context):  # noqa: C901
-        # Nodes are not threadsafe so we must store and look up our instance
-        # variables in the current rendering context first
-        if self not in context.render_context:
-            context.render_context[self] = (
-                template.Variable(self.field),
-                self.attrs,
-                template.Variable(self.html5_required),
+    This is the rendering behind the ``crispy_tbx_field`` template tag. It is
+    also used directly by the compiled renderer so both produce the same
+    markup.
+
+    The attributes are added to shallow copies of the field's widget(s),
+    each given a new dict of attributes. The field, its widget and the
+    layout are never changed, so the same form can be rendered from several
+    threads at once.
+
+    Args:
+        field (BoundField): the field to render.
+
+        attrs (dict, optional): extra attributes for the widget(s). The values
+            are appended to any existing attribute with the same name.
+
+        html5_required (bool, optional): add the ``required`` attribute to
+            the widget(s) of required fields.
+
+        template_pack (str, optional): the template pack being rendered.
+
+        widget_attrs (dict, optional): the attributes of the layout's
+            ``Field``, which replace the widget's attributes with the same
+            name.
+
+        expanded (dict, optional): the ``aria-expanded`` state of the fields
+            which conditional fields depend on, indexed by field name.
+
+    Returns:
+        str: the rendered widget.
+
+    """
+    if attrs is None:
+        attrs = {}
+    if widget_attrs is None:
+        widget_attrs = {}
+
+    field_widget, widgets = copy_widget(field.field.widget)
+
+    multivalue = get_field_kind(field_widget) == MULTIVALUE
+    errors = get_field_errors(field)
+
+    if template_pack in TEMPLATE_PACKS:
+        if multivalue:
+            error_widgets = [field.widget for field in field.field.fields]
+            error_count = sum(
+                len(getattr(widget, "errors", [])) for widget in error_widgets
             )
+        else:
+            error_widgets = None
+            error_count = 0
+
+    if isinstance(attrs, dict):
+        attrs = [attrs] * len(widgets)
+    layout_attrs = widget_attrs
+    if isinstance(layout_attrs, dict):
+        layout_attrs = [layout_attrs] * len(widgets)
+
+    for widget_idx, (widget, attr, layout_attr) in enumerate(
+        zip(widgets, attrs, layout_attrs)
+    ):
+        widget_attrs = {**widget.attrs, **layout_attr}
 
-        field, attrs, html5_required = context.render_context[self]
-        field = field.resolve(context)
-        try:
-            html5_required = html5_required.resolve(context)
-        except template.VariableDoesNotExist:
-            html5_required = False
+        css_class = list(get_widget_classes(widget.__class__))
 
-        # Pick up the template pack if it has been overridden in FormHelper
-        template_pack = context.get("template_pack", TEMPLATE_PACK)
+        for attr_css_class in widget_attrs.get("class", "").split():
+            if attr_css_class not in css_class:
+                css_class.append(attr_css_class)
 
-        # There are special django widgets that wrap actual widgets,
-        # such as forms.widgets.MultiWidget,
-        # admin.widgets.RelatedFieldWidgetWrapper
-        widgets = getattr(
-            field.field.widget,
-            "widgets",
-            [getattr(field.field.widget, "widget", field.field.widget)],
-        )
+        css_class = " ".join(css_class)
 
-        if template_pack == "tbxforms":
-            if is_multivalue(field):
-                error_widgets = [field.widget for field in field.field.fields]
-                error_count = sum(
-                    len(getattr(widget, "errors", []))
-                    for widget in error_widgets
-                )
-            else:
-                error_widgets = None
-                error_count = 0
-
-        if isinstance(attrs, dict):
-            attrs = [attrs] * len(widgets)
-
-        converters = {
-            "checkboxinput": "tbxforms-checkboxes__input",
-            "select": "tbxforms-select",
-            "lazyselect": "tbxforms-select",
-            "textarea": "tbxforms-textarea",
-            "clearablefileinput": "tbxforms-file-upload",
-            "textinput": "tbxforms-input tbxforms-input--text",
-            "urlinput": "tbxforms-input tbxforms-input--url",
-            "numberinput": "tbxforms-input tbxforms-input--number",
-            "emailinput": "tbxforms-input tbxforms-input--email",
-            "passwordinput": "tbxforms-input tbxforms-input--password",
-        }
-        converters.update(getattr(settings, "CRISPY_CLASS_CONVERTERS", {}))
-
-        for widget_idx, (widget, attr) in enumerate(zip(widgets, attrs)):
-            class_name = widget.__class__.__name__.lower()
-            class_name = converters.get(class_name, class_name)
-
-            if class_name:
-                css_class = class_name.split()
-            else:
-                css_class = []
-
-            for attr_css_class in widget.attrs.get("class", "").split():
-                if attr_css_class not in css_class:
-                    css_class.append(attr_css_class)
-
-            css_class = " ".join(css_class)
-
-            if template_pack == "tbxforms":
-                # The ability to override input_type was added to
-                # avoid having to create new widgets. However, as a
-                # result, the browser validates the field and displays
-                # a red border with no feedback to the user.  That is
-                # at odds with with the way the Design System reports
-                # errors.  However this is being left in for now until
-                # the "conflict" is better understood - it might be
-                # useful to somebody at some point.
-
-                if (
-                    hasattr(widget, "input_type")
-                    and "input_type" in widget.attrs
-                ):
-                    widget.input_type = widget.attrs.pop("input_type")
-
-                aria_describedby = []
-
-                if field.errors:
-                    widget_class_name = widget.__class__.__name__
-
-                    if widget_class_name in [
-                        "Select",
-                        "TextInput",
-                        "Textarea",
-                    ]:
-                        if is_multivalue(field):
-                            if error_count == 0:
-                                css_class += " tbxforms-input--error"
-                            elif getattr(
-                                error_widgets[widget_idx], "errors", None
-                            ):
-                                css_class += " tbxforms-input--error"
-                        else:
-                            css_class += " tbxforms-input--error"
-                    elif widget_class_name in [
-                        "FileInput",
-                        "ClearableFileInput",
-                    ]:
-                        css_class += " tbxforms-file-upload--error"
-
-                    for error_idx, error in enumerate(field.errors, start=1):
-                        css_error_class = "%s_%d_error" % (
-                            field.auto_id,
-                            error_idx,
-                        )
-
-                        if is_multivalue(field):
-                            if getattr(
-                                error_widgets[widget_idx], "errors", None
-                            ):
-                                if error in error_widgets[widget_idx].errors:
-                                    aria_describedby.append(css_error_class)
-                        else:
-                            aria_describedby.append(css_error_class)
-
-                if field.help_text and not is_multivalue(field):
-                    aria_describedby.append(f"{field.auto_id}_hint")
-
-                if (
-                    "class" in widget.attrs
-                    and "tbxforms-js-character-count" in widget.attrs["class"]
-                ):
+        if template_pack in TEMPLATE_PACKS:
+            # The ability to override input_type was added to
+            # avoid having to create new widgets. However, as a
+            # result, the browser validates the field and displays
+            # a red border with no feedback to the user.  That is
+            # at odds with with the way the Design System reports
+            # errors.  However this is being left in for now until
+            # the "conflict" is better understood - it might be
+            # useful to somebody at some point.
 
-                    # The javascript that updates the span containing
-                    # character count as the user types expects the id
-                    # to end in '-info'. Anything else won't work.
-                    aria_describedby.append(f"{field.auto_id}-info")
+            if hasattr(widget, "input_type") and "input_type" in widget_attrs:
+                widget.input_type = widget_attrs.pop("input_type")
 
-                if aria_describedby:
-                    widget.attrs["aria-describedby"] = " ".join(
-                        aria_describedby
-                    )
+            aria_describedby = []
 
-            widget.attrs["class"] = css_class
+            if errors:
+                widget_class_name = widget.__class__.__name__
+
+                if widget_class_name in [
+                    "Select",
+                    "TextInput",
+                    "Textarea",
+                ]:
+                    if multivalue:
+                        if error_count == 0:
+                            css_class += " tbxforms-input--error"
+                        elif getattr(
+                            error_widgets[widget_idx], "errors", None
+                        ):
+                            css_class += " tbxforms-input--error"
+                    else:
+                        css_class += " tbxforms-input--error"
+                elif widget_class_name in [
+                    "FileInput",
+                    "ClearableFileInput",
+                ]:
+                    css_class += " tbxforms-file-upload--error"
+
+                for error, css_error_class in zip(
+                    errors.messages, errors.error_ids
+                ):
+                    if multivalue:
+                        if getattr(error_widgets[widget_idx], "errors", None):
+                            if error in error_widgets[widget_idx].errors:
+                                aria_describedby.append(css_error_class)
+                    else:
+                        aria_describedby.append(css_error_class)
+
+            if field.help_text and not multivalue:
+                aria_describedby.append(f"{field.auto_id}_hint")
 
-            # HTML5 required attribute
             if (
-                html5_required
-                and field.field.required
-                and "required" not in widget.attrs
+                "class" in widget_attrs
+                and "tbxforms-js-character-count" in widget_attrs["class"]
             ):
-                if field.field.widget.__class__.__name__ != "RadioSelect":
-                    widget.attrs["required"] = "required"
 
-            for attribute_name, attribute in attr.items():
-                attribute_name = template.Variable(attribute_name).resolve(
-                    context
-                )
+                # The javascript that updates the span containing
+                # character count as the user types expects the id
+                # to end in '-info'. Anything else won't work.
+                aria_describedby.append(f"{field.auto_id}-info")
+
+            if aria_describedby:
+                widget_attrs["aria-describedby"] = " ".join(aria_describedby)
+
+        widget_attrs["class"] = css_class
+
+        state = aria_expanded(expanded, field)
+        if state:
+            widget_attrs["aria-expanded"] = state
+
+        # HTML5 required attribute
+        if (
+            html5_required
+            and field.field.required
+            and "required" not in widget_attrs
+        ):
+            if field_widget.__class__.__name__ != "RadioSelect":
+                widget_attrs["required"] = "required"
+
+        for attribute_name, attribute in attr.items():
+            if attribute_name in widget_attrs:
+                widget_attrs[attribute_name] += " " + attribute
+            else:
+                widget_attrs[attribute_name] = attribute
+
+        widget.attrs = widget_attrs
+
+    with widget_choices(field.field, field_widget):
+        html = field.as_widget(widget=field_widget)
+    if field.field.show_hidden_initial:
+        html += field.as_hidden(only_initial=True)
+    return html
+
+
+class CrispyGDSFieldNode(template.Node):
+    """
+    The TemplateNode used for rendering a field from the template pack.
+
+    The field and attribute expressions are compiled when the template is
+    parsed. They are not changed when the node is rendered so the node is
+    thread-safe. The attributes of the layout's ``Field`` are passed in the
+    ``widget_attrs`` context variable rather than added to the widget.
+    """
+
+    def __init__(self, field, attrs, html5_required):
+        self.field = field
+        self.attrs = attrs
+        self.html5_required = html5_required
+
+    def render(self, context):
+        field = self.field.resolve(context)
+        html5_required = self.html5_required.resolve(
+            context, ignore_failures=True
+        )
 
-                if attribute_name in widget.attrs:
-                    widget.attrs[attribute_name] += " " + template.Variable(
-                        attribute
-                    ).resolve(context)
-                else:
-                    widget.attrs[attribute_name] = template.Variable(
-                        attribute
-                    ).resolve(context)
+        # Pick up the template pack if it has been overridden in FormHelper
+        template_pack = context.get("template_pack", TEMPLATE_PACK)
+
+        resolved_attrs = {}
+        for attribute_name, attribute in self.attrs:
+            resolved_attrs[attribute_name.resolve(context)] = (
+                attribute.resolve(context)
+            )
 
-        return str(field)
+        return render_field_widget(
+            field,
+            attrs=resolved_attrs,
+            html5_required=bool(html5_required),
+            template_pack=template_pack,
+            widget_attrs=context.get("widget_attrs"),
+            expanded=context.get("conditional_expanded"),
+        )
 
 
 @register.tag(name="crispy_tbx_field")
@@ -332,12 +605,110 @@ def crispy_tbx_field(parser, token):
 
     """
     token = token.split_contents()
-    field = token.pop(1)
-    attrs = {}
+    field = parser.compile_filter(token.pop(1))
+    attrs = []
 
     # We need to pop tag name, or pairwise would fail
     token.pop(0)
     for attribute_name, value in pairwise(token):
-        attrs[attribute_name] = value
+        attrs.append(
+            (
+                parser.compile_filter(attribute_name),
+                parser.compile_filter(value),
+            )
+        )
+
+    return CrispyGDSFieldNode(
+        field, attrs, parser.compile_filter("html5_required")
+    )
 
-    return CrispyGDSFieldNode(field, attrs)
+
+# Marks where the CSRF token is added to the HTML of cached forms.
+CSRF_PLACEHOLDER = mark_safe("<!-- tbxforms:csrf_token -->")
+
+
+class CachedCrispyFormNode(CrispyFormNode):
+    """
+    The TemplateNode used for rendering a form, caching the HTML of unbound
+    forms when the helper's ``cache_unbound`` attribute is set.
+
+    The CSRF token is different for each visitor so the HTML is cached with a
+    placeholder which is replaced by the token each time the form is
+    rendered.
+
+    Forms and formsets with a tbxforms ``FormHelper`` are rendered by the
+    helper's ``render_form()`` and ``render_formset()``, which keep the
+    state of each render out of the node and the form, so the node is
+    thread-safe. Formsets are not cached. When the helper's
+    ``render_threads`` attribute is set their forms are rendered in
+    parallel.
+    """
+
+    def render(self, context):
+        form = template.Variable(self.form).resolve(context)
+        if self.helper is not None:
+            helper = template.Variable(self.helper).resolve(context)
+        else:
+            helper = getattr(form, "helper", None)
+
+        # Helpers from django-crispy-forms, and helpers with their own
+        # template, are rendered by the {% crispy %} tag.
+        render_form = getattr(helper, "render_form", None)
+        if render_form is None or getattr(helper, "template", None):
+            return super().render(context)
+
+        template_pack = (
+            getattr(helper, "template_pack", None) or self.template_pack
+        )
+
+        if isinstance(form, BaseFormSet):
+            return mark_safe(
+                helper.render_formset(
+                    form, context, template_pack=template_pack
+                )
+            )
+
+        key = helper.get_cache_key(form, template_pack=template_pack)
+        if key is None:
+            return mark_safe(
+                render_form(form, context, template_pack=template_pack)
+            )
+
+        cache = caches[
+            getattr(settings, "TBXFORMS_FORM_CACHE", DEFAULT_CACHE_ALIAS)
+        ]
+        html = cache.get(key)
+        if html is None:
+            with context.push(csrf_placeholder=CSRF_PLACEHOLDER):
+                html = render_form(form, context, template_pack=template_pack)
+            cache.set(key, html)
+
+        if CSRF_PLACEHOLDER in html:
+            html = html.replace(
+                CSRF_PLACEHOLDER, CsrfTokenNode().render(context)
+            )
+        return mark_safe(html)
+
+
+@register.tag(name="crispy_tbx")
+def crispy_tbx(parser, token):
+    """
+    The template tag used to render a form, with the same arguments as the
+    ``{% crispy %}`` tag from ``django-crispy-forms``.
+
+    Examples: ::
+
+        {% crispy_tbx form %}
+        {% crispy_tbx form form.helper %}
+
+    The HTML for unbound forms is cached when the helper's ``cache_unbound``
+    attribute is set. See ``FormHelper.get_cache_key()`` for the forms which
+    are cached. The cache used is set by the ``TBXFORMS_FORM_CACHE``
+    setting, which defaults to "default". The forms of a formset are
+    rendered in parallel when the helper's ``render_threads`` attribute is
+    set.
+    """
+    node = do_uni_form(parser, token)
+    return CachedCrispyFormNode(
+        node.form, node.helper, template_pack=node.template_pack
+    )
@@ -0,0 +1,221 @@
+"""
+Load the tbxforms templates before the first request.
+
+The first time a form is rendered each template used is read from disk and
+compiled, and the ``tbxforms`` template tag library is imported. When
+``TBXFORMS_WARM_UP = True`` this is done when Django starts, in
+``TbxFormsConfig.ready()``, so it is not added to the first request handled
+by each worker. If the application is loaded before the server forks its
+workers, e.g. ``gunicorn --preload``, the workers share the compiled
+templates.
+
+The forms listed in ``TBXFORMS_WARM_UP_FORMS``, as dotted paths, are also
+rendered once, which loads any other templates they use and builds their
+helpers and layouts. Set it to ``"__all__"`` to render every form in the
+registry, after importing the ``forms`` module of each app.
+
+``ready()`` runs for every management command, including ``migrate`` on an
+empty database, so the database is not queried: forms with a field whose
+choices come from a queryset are skipped, unless ``TBXFORMS_WARM_UP_QUERIES
+= True``, and any other query fails. A form which fails to render is logged
+and skipped.
+"""
+
+import logging
+import os
+
+from contextlib import (
+    ExitStack,
+    contextmanager,
+)
+
+from django.conf import settings
+from django.db import connections
+from django.forms.renderers import get_default_renderer
+from django.template.loader import get_template
+from django.utils.module_loading import import_string
+
+from crispy_forms.utils import render_crispy_form
+
+from tbxforms import TEMPLATE_PACKS
+from tbxforms.registry import (
+    autodiscover,
+    get_form_classes,
+)
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = os.path.join(os.path.dirname(__file__), "templates")
+
+# The templates for the widgets are rendered by the form renderer rather than
+# the template engine.
+WIDGET_TEMPLATES = ("tbxforms/widgets/date.html",)
+
+
+def get_template_names(template_pack):
+    """
+    Return the names of all the templates in a template pack.
+    """
+    pack_dir = os.path.join(TEMPLATES_DIR, template_pack)
+    names = []
+    for root, dirs, files in os.walk(pack_dir):
+        dirs.sort()
+        for filename in sorted(files):
+            if filename.endswith(".html"):
+                path = os.path.relpath(os.path.join(root, filename), pack_dir)
+                names.append(
+                    "%s/%s" % (template_pack, path.replace(os.sep, "/"))
+                )
+    return names
+
+
+def get_template_packs():
+    """
+    Return the template packs to load: the active template pack, if it is
+    one of ours, otherwise all of them.
+    """
+    template_pack = getattr(settings, "CRISPY_TEMPLATE_PACK", None)
+    if template_pack in TEMPLATE_PACKS:
+        return (template_pack,)
+    return TEMPLATE_PACKS
+
+
+def warm_templates(template_packs=None):
+    """
+    Load and compile the templates in the template packs, and the widget
+    templates, so they are cached by the template loaders.
+
+    Returns:
+        list: the names of the templates loaded.
+
+    """
+    if template_packs is None:
+        template_packs = get_template_packs()
+
+    names = []
+    for template_pack in template_packs:
+        for name in get_template_names(template_pack):
+            get_template(name)
+            names.append(name)
+
+    renderer = get_default_renderer()
+    for name in WIDGET_TEMPLATES:
+        renderer.get_template(name)
+        names.append(name)
+
+    return names
+
+
+class QueryBlocked(Exception):
+    """
+    Raised when a form queries the database while it is warmed up.
+    """
+
+
+def block_query(execute, sql, params, many, context):
+    raise QueryBlocked(
+        "The database is not queried while forms are warmed up. Set "
+        "TBXFORMS_WARM_UP_QUERIES = True to allow it."
+    )
+
+
+@contextmanager
+def block_queries():
+    """
+    Make every query in the block fail with ``QueryBlocked``.
+    """
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(block_query))
+        yield
+
+
+@contextmanager
+def close_new_connections():
+    """
+    Close the database connections opened in the block, so they are not
+    shared by the processes forked from this one.
+    """
+    opened = {
+        connection.alias
+        for connection in connections.all()
+        if connection.connection is not None
+    }
+    try:
+        yield
+    finally:
+        for connection in connections.all():
+            if connection.alias not in opened:
+                connection.close()
+
+
+def uses_queryset(form_class):
+    """
+    Return whether any of the fields of a form class gets its choices from
+    a queryset.
+    """
+    return any(
+        getattr(field, "queryset", None) is not None
+        for field in getattr(form_class, "base_fields", {}).values()
+    )
+
+
+def warm_forms(form_classes, queries=False):
+    """
+    Render an unbound instance of each form class.
+
+    Forms which raise an exception are logged and skipped.
+
+    Args:
+        form_classes (iterable): form classes, or their dotted paths.
+
+        queries (bool, optional): allow the database to be queried. If
+            False, the default, forms with a field whose choices come from a
+            queryset are skipped and any other query fails.
+
+    Returns:
+        list: the form classes rendered.
+
+    """
+    rendered = []
+    with close_new_connections(), ExitStack() as stack:
+        if not queries:
+            stack.enter_context(block_queries())
+        for form_class in form_classes:
+            try:
+                if isinstance(form_class, str):
+                    form_class = import_string(form_class)
+                if not queries and uses_queryset(form_class):
+                    logger.debug(
+                        "Skipped warming up %s: its choices come from a "
+                        "queryset.",
+                        form_class,
+                    )
+                    continue
+                render_crispy_form(form_class())
+            except Exception:
+                logger.warning(
+                    "Could not warm up %s.", form_class, exc_info=True
+                )
+                continue
+            rendered.append(form_class)
+    return rendered
+
+
+def warm_up():
+    """
+    Load the templates, and render the forms in TBXFORMS_WARM_UP_FORMS, if
+    TBXFORMS_WARM_UP is set.
+    """
+    if not getattr(settings, "TBXFORMS_WARM_UP", False):
+        return
+    warm_templates()
+
+    form_classes = getattr(settings, "TBXFORMS_WARM_UP_FORMS", ())
+    if form_classes == "__all__":
+        autodiscover()
+        form_classes = get_form_classes()
+    warm_forms(
+        form_classes,
+        queries=getattr(settings, "TBXFORMS_WARM_UP_QUERIES", False),
+    )
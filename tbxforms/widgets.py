@@ -1,6 +1,53 @@
 from django import forms
 from django.utils.translation import gettext_lazy as _
 
+DATE_INPUT_ATTRS = (
+    {
+        "class": (
+            "tbxforms-input tbxforms-date-input__input "
+            "tbxforms-input--width-2"
+        ),
+        "label": _("Day"),
+        "pattern": "[0-9]*",
+        "inputmode": "numeric",
+    },
+    {
+        "class": (
+            "tbxforms-input tbxforms-date-input__input "
+            "tbxforms-input--width-2"
+        ),
+        "label": _("Month"),
+        "pattern": "[0-9]*",
+        "inputmode": "numeric",
+    },
+    {
+        "class": (
+            "tbxforms-input tbxforms-date-input__input "
+            "tbxforms-input--width-4"
+        ),
+        "label": _("Year"),
+        "pattern": "[0-9]*",
+        "inputmode": "numeric",
+    },
+)
+
+
+class SubwidgetAttrs(dict):
+    """
+    The attributes of one of the fields of a DateInputWidget, without the
+    label. ``pop("label")`` still returns it so templates which extract the
+    label with the ``dict_pop`` filter keep working.
+    """
+
+    def __init__(self, attrs, label):
+        super().__init__(attrs)
+        self.label = label
+
+    def pop(self, key, *args):
+        if key == "label" and key not in self:
+            return self.label
+        return super().pop(key, *args)
+
 
 class DateInputWidget(forms.MultiWidget):
     """
@@ -13,51 +60,27 @@ class DateInputWidget(forms.MultiWidget):
     System requires labels for the individual fields. That's not
     supported out of the box by a MultiValueField so the labels are
     added as a custom attribute and rendered with the correct markup
-    in the template. The template also pops the label from the widget
-    so it does not also get added as an attribute.
+    in the template. ``get_context()`` moves the label out of the attributes
+    of each field so it is not also added as an attribute.
 
     """
 
     template_name = "tbxforms/widgets/date.html"
 
     def __init__(self, *args, **kwargs):
-        widgets = [
-            forms.TextInput(
-                attrs={
-                    "class": (
-                        "tbxforms-input tbxforms-date-input__input "
-                        "tbxforms-input--width-2"
-                    ),
-                    "label": _("Day"),
-                    "pattern": "[0-9]*",
-                    "inputmode": "numeric",
-                }
-            ),
-            forms.TextInput(
-                attrs={
-                    "class": (
-                        "tbxforms-input tbxforms-date-input__input "
-                        "tbxforms-input--width-2"
-                    ),
-                    "label": _("Month"),
-                    "pattern": "[0-9]*",
-                    "inputmode": "numeric",
-                }
-            ),
-            forms.TextInput(
-                attrs={
-                    "class": (
-                        "tbxforms-input tbxforms-date-input__input "
-                        "tbxforms-input--width-4"
-                    ),
-                    "label": _("Year"),
-                    "pattern": "[0-9]*",
-                    "inputmode": "numeric",
-                }
-            ),
-        ]
+        # Each TextInput copies its attrs so the shared dicts are not changed.
+        widgets = [forms.TextInput(attrs=attrs) for attrs in DATE_INPUT_ATTRS]
         super().__init__(widgets, **kwargs)
 
+    def get_context(self, name, value, attrs):
+        context = super().get_context(name, value, attrs)
+        for subwidget in context["widget"]["subwidgets"]:
+            # The attrs are built for each render so they can be changed.
+            attrs = subwidget["attrs"]
+            subwidget["label"] = attrs.pop("label", None)
+            subwidget["attrs"] = SubwidgetAttrs(attrs, subwidget["label"])
+        return context
+
     def decompress(self, value):
         """
         Convert a ``date`` into values for the day, month and year so it can be
@@ -1,3 +1,5 @@
+import copy
+
 from tbxforms.choices import Choice
 
 
@@ -33,3 +35,24 @@ def test_iterator_object():
     )
     for item in choices:
         assert isinstance(item, Choice)
+
+
+def test_default_attributes():
+    """Verify a Choice without a hint or divider displays neither."""
+    item = Choice("email", "Email")
+    assert item.hint is None
+    assert item.divider is None
+
+
+def test_extra_attributes():
+    """Verify attributes other than the hint and divider are supported."""
+    item = Choice("email", "Email", hint="Your email address", icon="mail")
+    assert item.hint == "Your email address"
+    assert item.icon == "mail"
+
+
+def test_copy_is_shared():
+    """Verify copying a Choice, as forms do, returns the same object."""
+    item = Choice("email", "Email")
+    assert copy.copy(item) is item
+    assert copy.deepcopy([item])[0] is item
@@ -0,0 +1,173 @@
+"""
+Tests to verify the choices of model choice fields are cached.
+"""
+
+from django import forms
+from django.db import connection
+from django.template import Context
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from tbxforms.choice_cache import (
+    choice_cache,
+    clear_choice_cache,
+    get_choices,
+)
+from tbxforms.layout import (
+    Field,
+    Layout,
+)
+from tbxforms.middleware import ChoiceCacheMiddleware
+from tests.forms import BaseTestForm
+from tests.models import Authority
+from tests.utils import render_form
+
+VERSION = {"value": 1}
+
+
+def choices_version(queryset):
+    return VERSION["value"]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def authorities():
+    with connection.schema_editor() as editor:
+        editor.create_model(Authority)
+    for name in ("Bristol", "Cardiff", "Leeds"):
+        Authority.objects.create(name=name)
+    yield
+    with connection.schema_editor() as editor:
+        editor.delete_model(Authority)
+
+
+@pytest.fixture(autouse=True)
+def process_cache():
+    yield
+    clear_choice_cache()
+
+
+class AuthorityForm(BaseTestForm):
+    home = forms.ModelChoiceField(
+        Authority.objects.all(), widget=forms.RadioSelect
+    )
+    work = forms.ModelChoiceField(
+        Authority.objects.all(), widget=forms.RadioSelect
+    )
+    nearest = forms.ModelChoiceField(Authority.objects.all(), required=False)
+    other = forms.ModelChoiceField(
+        Authority.objects.filter(name="Leeds"), widget=forms.RadioSelect
+    )
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            Field.radios("home"),
+            Field.radios("work"),
+            Field.select("nearest"),
+        )
+
+
+def count_queries(function, *args):
+    with CaptureQueriesContext(connection) as queries:
+        result = function(*args)
+    return len(queries), result
+
+
+def test_render_runs_each_query_once():
+    count, html = count_queries(render_form, AuthorityForm())
+    assert count == 1
+    assert html.count("Cardiff") == 3
+
+
+def test_render_without_cache():
+    """Verify the number of queries run when the choices are not cached."""
+    form = AuthorityForm()
+    count, html = count_queries(
+        form.helper.layout.render, form, Context({"form": form})
+    )
+    assert count == 5
+
+
+def test_rendered_choices_are_unchanged():
+    form = AuthorityForm(data={"home": "2", "work": "1"})
+    assert not form.is_valid()
+    html = render_form(form)
+    assert html.count('checked="checked"') == 2
+    assert '<option value="" selected>---------</option>' in html
+
+
+def test_different_querysets_are_cached_separately():
+    form = AuthorityForm()
+    with choice_cache():
+        home = get_choices(form.fields["home"])
+        other = get_choices(form.fields["other"])
+    assert len(home) == 3
+    assert [label for value, label in other] == ["Leeds"]
+
+
+def test_empty_label():
+    form = AuthorityForm()
+    with choice_cache():
+        assert len(get_choices(form.fields["home"])) == 3
+        assert get_choices(form.fields["nearest"])[0] == ("", "---------")
+
+
+def test_choices_not_cached_outside_scope():
+    form = AuthorityForm()
+    count, choices = count_queries(get_choices, form.fields["home"])
+    assert count == 0
+    assert choices is not get_choices(form.fields["home"])
+
+
+def test_nested_scopes_share_cache():
+    form = AuthorityForm()
+    with choice_cache():
+        choices = get_choices(form.fields["home"])
+        with choice_cache():
+            count, cached = count_queries(get_choices, form.fields["work"])
+    assert count == 0
+    assert [choice[0].instance for choice in cached] == [
+        choice[0].instance for choice in choices
+    ]
+
+
+def test_middleware_caches_for_request():
+    def view(request):
+        AuthorityForm(data={"home": "1"}).is_valid()
+        render_form(AuthorityForm())
+        return render_form(AuthorityForm())
+
+    middleware = ChoiceCacheMiddleware(view)
+    count, html = count_queries(middleware, None)
+    # One query to validate "home" and one for the choices.
+    assert count == 2
+
+
+@override_settings(TBXFORMS_CACHE_CHOICES=True)
+def test_process_cache():
+    render_form(AuthorityForm())
+    count, html = count_queries(render_form, AuthorityForm())
+    assert count == 0
+    assert "Cardiff" in html
+
+
+@override_settings(
+    TBXFORMS_CACHE_CHOICES=True,
+    TBXFORMS_CHOICES_VERSION=f"{__name__}.choices_version",
+)
+def test_process_cache_version():
+    render_form(AuthorityForm())
+    assert count_queries(render_form, AuthorityForm())[0] == 0
+
+    VERSION["value"] += 1
+    assert count_queries(render_form, AuthorityForm())[0] == 1
+    assert count_queries(render_form, AuthorityForm())[0] == 0
+
+
+@override_settings(TBXFORMS_CACHE_CHOICES=True)
+def test_clear_process_cache():
+    render_form(AuthorityForm())
+    clear_choice_cache()
+    assert count_queries(render_form, AuthorityForm())[0] == 1
@@ -0,0 +1,93 @@
+"""
+Tests to verify choices can be looked up by value in a ChoiceList.
+"""
+
+import copy
+
+from django import VERSION as DJANGO_VERSION
+from django import forms
+
+from tbxforms.choices import (
+    Choice,
+    ChoiceList,
+)
+from tests.forms import BaseTestForm
+from tests.utils import render_form
+
+METHODS = ChoiceList(
+    (
+        Choice("email", "Email"),
+        Choice("phone", "Phone", hint="Select this if you have a phone."),
+        Choice(1, "One"),
+        ("text", "Text message"),
+    )
+)
+
+
+class MethodForm(BaseTestForm):
+    method = forms.ChoiceField(
+        choices=METHODS, widget=forms.RadioSelect, label="Method"
+    )
+
+
+def test_sequence():
+    assert len(METHODS) == 4
+    assert METHODS[0].value == "email"
+    assert [value for value, label in METHODS] == ["email", "phone", 1, "text"]
+
+
+def test_get():
+    assert METHODS.get("phone").hint == "Select this if you have a phone."
+    assert METHODS.get("text") == ("text", "Text message")
+    assert METHODS.get("1").label == "One"
+    assert METHODS.get(1).label == "One"
+    assert METHODS.get("fax") is None
+    assert METHODS.get("fax", "default") == "default"
+
+
+def test_has_value():
+    assert METHODS.has_value("email")
+    assert METHODS.has_value(1)
+    assert not METHODS.has_value("fax")
+
+
+def test_positions():
+    assert METHODS.positions == {"email": 0, "phone": 1, "1": 2, "text": 3}
+
+
+def test_grouped_choices():
+    choices = ChoiceList(
+        (
+            ("Digital", (Choice("email", "Email"), Choice("text", "Text"))),
+            Choice("post", "Post"),
+        )
+    )
+    assert choices.get("text").label == "Text"
+    assert choices.get("post").label == "Post"
+    assert not choices.has_value("Digital")
+
+
+def test_copy_is_shared():
+    assert copy.copy(METHODS) is METHODS
+    assert copy.deepcopy(METHODS) is METHODS
+
+
+def test_choices_shared_by_forms():
+    """
+    Verify the choices are shared by every form instance, and the list too
+    on Django 5.0+, which does not convert the choices to a list.
+    """
+    first = MethodForm()
+    second = MethodForm()
+    if DJANGO_VERSION >= (5, 0):
+        assert first.fields["method"].choices is METHODS
+    else:
+        assert type(first.fields["method"].choices) is list
+    assert first.fields["method"].choices[1] is METHODS[1]
+    assert second.fields["method"].choices[1] is METHODS[1]
+
+
+def test_render():
+    html = render_form(MethodForm(data={"method": "phone"}))
+    assert "Select this if you have a phone." in html
+    assert 'value="phone"' in html
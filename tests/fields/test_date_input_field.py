@@ -9,6 +9,7 @@ from django.core.exceptions import ValidationError
 import pytest
 
 from tbxforms.fields import DateInputField
+from tbxforms.validators import StringMinValueValidator
 
 
 def test_compress_invalid_fields():
@@ -221,3 +222,189 @@ def test_invalid_date_on_30_day_month():
         "'31' is not a valid day for April 2007 - "
         "please enter a value between 1 and 30."
     )
+
+
+def test_fields_are_not_shared():
+    """
+    Verify each DateInputField has its own sub-fields and widgets but shares
+    the validators.
+    """
+    first = DateInputField()
+    second = DateInputField(require_all_fields=False)
+    for a, b in zip(first.fields, second.fields):
+        assert a is not b
+        assert a.widget is not b.widget
+        assert a.validators is not b.validators
+        assert a.validators == b.validators
+    assert first.fields[0].required is False
+    assert second.fields[0].required is True
+
+
+def test_widget_attrs_are_not_shared():
+    """Verify changing the attrs of one widget does not change another."""
+    first = DateInputField()
+    second = DateInputField()
+    first.widget.widgets[0].attrs["class"] += " extra"
+    assert "extra" not in second.widget.widgets[0].attrs["class"]
+
+
+def test_errors_are_not_shared():
+    """Verify errors on one field are not reported on another."""
+    first = DateInputField(require_all_fields=False)
+    second = DateInputField(require_all_fields=False)
+    with pytest.raises(ValidationError):
+        first.clean(["", "1", "2021"])
+    assert first.fields[0].widget.errors
+    assert not getattr(second.fields[0].widget, "errors", None)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ["1", "2", "2021"],
+        ["01", "02", "0001"],
+        ["31", "12", "9999"],
+        ["29", "2", "2020"],
+        ["29", "2", "2021"],
+        ["31", "4", "2021"],
+        ["0", "1", "2021"],
+        ["001", "1", "2021"],
+        ["1", "012", "2021"],
+        ["1", "13", "2021"],
+        ["1", "1", "0"],
+        ["1", "1", "10000"],
+        [" 1", "1", "2021"],
+        ["1\n", "1", "2021"],
+        ["١", "1", "2021"],
+        ["a", "b", "c"],
+        ["", "1", "2021"],
+        ["1", "1"],
+        [1, 1, 2021],
+    ],
+)
+@pytest.mark.parametrize("require_all_fields", [True, False])
+def test_parse_date_matches_full_validation(value, require_all_fields):
+    """
+    Verify the fast path returns the same date, or raises the same errors,
+    as the full validation.
+    """
+
+    class FullDateInputField(DateInputField):
+        def parse_date(self, value):
+            return None
+
+    def clean(field):
+        try:
+            result = field.clean(value)
+        except ValidationError as e:
+            result = e.messages
+        return result, [
+            getattr(field.widget, "errors", None) for field in field.fields
+        ]
+
+    fast = DateInputField(require_all_fields=require_all_fields)
+    full = FullDateInputField(require_all_fields=require_all_fields)
+    assert clean(fast) == clean(full)
+
+
+def test_parse_date():
+    field = DateInputField()
+    assert field.parse_date(["1", "2", "2021"]) == datetime.date(2021, 2, 1)
+    assert field.parse_date(["30", "2", "2021"]) is None
+    assert field.parse_date(["1", "2", "x"]) is None
+    assert field.parse_date(None) is None
+
+
+def test_parse_date_custom_validators():
+    """Verify the fast path is not used if the validators are changed."""
+    field = DateInputField()
+    field.fields[2].validators.append(
+        StringMinValueValidator(2000, "Year must be 2000 or more.")
+    )
+    assert field.parse_date(["1", "2", "1999"]) is None
+    with pytest.raises(ValidationError, match="Year must be 2000 or more."):
+        field.clean(["1", "2", "1999"])
+
+
+def test_clean_many():
+    """Verify clean_many returns the same dates and errors as clean."""
+    rows = [
+        ("1", "2", "2021"),
+        ("30", "2", "2021"),
+        ("", "", ""),
+        ("x", "13", "2021"),
+        ("", "1", "2021"),
+    ]
+    field = DateInputField(required=False, require_all_fields=False)
+    dates, errors = field.clean_many(rows)
+
+    expected_dates = []
+    expected_errors = []
+    for row in rows:
+        try:
+            expected_dates.append(field.clean(list(row)))
+            expected_errors.append([])
+        except ValidationError as e:
+            expected_dates.append(None)
+            expected_errors.append(e.messages)
+
+    assert dates == expected_dates
+    assert errors == expected_errors
+    assert dates[0] == datetime.date(2021, 2, 1)
+    assert errors[0] == []
+    assert errors[1]
+    assert errors[2] == []
+
+
+def test_clean_many_columns():
+    """Verify clean_many accepts columns of values zipped together."""
+    field = DateInputField()
+    dates, errors = field.clean_many(
+        zip(["1", "31"], ["1", "12"], ["2000", "1999"])
+    )
+    assert dates == [datetime.date(2000, 1, 1), datetime.date(1999, 12, 31)]
+    assert errors == [[], []]
+
+
+def test_clean_many_runs_field_validators():
+    """Verify the validators on the DateInputField are run for every row."""
+
+    def not_in_future(value):
+        if value > datetime.date(2020, 1, 1):
+            raise ValidationError("Enter a date in the past.")
+
+    field = DateInputField(validators=[not_in_future])
+    dates, errors = field.clean_many([("1", "1", "2019"), ("1", "1", "2021")])
+    assert dates == [datetime.date(2019, 1, 1), None]
+    assert errors == [[], ["Enter a date in the past."]]
+
+
+class PastDateField(DateInputField):
+    def validate(self, value):
+        super().validate(value)
+        if value and value > datetime.date(2020, 1, 1):
+            raise ValidationError("Enter a date in the past.")
+
+
+class MidMonthDateField(DateInputField):
+    def clean(self, value):
+        return super().clean(value).replace(day=15)
+
+
+def test_overridden_validate_is_run():
+    """Verify a subclass's validate() is used by clean() and clean_many()."""
+    field = PastDateField()
+    assert not field.has_default_validation()
+    with pytest.raises(ValidationError, match="Enter a date in the past."):
+        field.clean(["1", "1", "2030"])
+    dates, errors = field.clean_many([("1", "1", "2019"), ("1", "1", "2030")])
+    assert dates == [datetime.date(2019, 1, 1), None]
+    assert errors == [[], ["Enter a date in the past."]]
+
+
+def test_overridden_clean_is_used():
+    field = MidMonthDateField()
+    assert not field.has_default_validation()
+    dates, errors = field.clean_many([("1", "1", "2019")])
+    assert dates == [datetime.date(2019, 1, 15)]
+    assert errors == [[]]
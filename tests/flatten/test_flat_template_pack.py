@@ -0,0 +1,91 @@
+"""
+Tests to verify the tbxforms_flat template pack is up to date and renders
+the same output as the tbxforms template pack.
+"""
+
+import os
+
+from django import forms
+from django.test import override_settings
+
+import pytest
+
+from crispy_forms.utils import render_crispy_form
+
+from tbxforms.flatten import (
+    INCLUDE_RE,
+    TARGET_PACK,
+    TEMPLATES_DIR,
+    flatten_template,
+    get_template_names,
+)
+from tbxforms.layout import (
+    Button,
+    Fieldset,
+    Layout,
+)
+from tests import forms as test_forms
+
+
+class LayoutForm(test_forms.BaseTestForm):
+    name = forms.CharField(label="Name", help_text="Your full name")
+    method = forms.ChoiceField(
+        choices=(("email", "Email"), ("phone", "Phone")),
+        widget=forms.RadioSelect,
+        label="Method",
+    )
+
+    @classmethod
+    def build_layout(cls):
+        return Layout(
+            Fieldset("name", "method", legend="Contact"),
+            Button.primary("submit", "Submit"),
+        )
+
+
+FORM_CLASSES = [
+    value
+    for value in vars(test_forms).values()
+    if isinstance(value, type)
+    and issubclass(value, test_forms.BaseTestForm)
+    and value is not test_forms.BaseTestForm
+] + [LayoutForm]
+
+
+def render(form, template_pack):
+    with override_settings(CRISPY_TEMPLATE_PACK=template_pack):
+        return render_crispy_form(form)
+
+
+@pytest.mark.parametrize("name", get_template_names())
+def test_template_is_up_to_date(name):
+    """
+    The flattened templates must be rebuilt, with ``python -m
+    tbxforms.flatten``, whenever the tbxforms templates change.
+    """
+    path = os.path.join(TEMPLATES_DIR, TARGET_PACK, name)
+    with open(path, encoding="utf-8") as fp:
+        assert fp.read() == flatten_template(name)
+
+
+@pytest.mark.parametrize("name", get_template_names())
+def test_template_has_no_includes(name):
+    assert not INCLUDE_RE.search(flatten_template(name))
+
+
+@pytest.mark.parametrize("form_class", FORM_CLASSES)
+@pytest.mark.parametrize("data", [None, {}])
+def test_form_output_is_the_same(form_class, data):
+    assert render(form_class(data=data), "tbxforms_flat") == render(
+        form_class(data=data), "tbxforms"
+    )
+
+
+@pytest.mark.parametrize("data", [None, {"form-TOTAL_FORMS": "2"}])
+def test_formset_output_is_the_same(data):
+    formset_class = forms.formset_factory(LayoutForm, extra=2)
+    if data:
+        data.update({"form-INITIAL_FORMS": "0"})
+    assert render(formset_class(data=data), "tbxforms_flat") == render(
+        formset_class(data=data), "tbxforms"
+    )
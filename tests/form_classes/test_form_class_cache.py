@@ -0,0 +1,145 @@
+"""
+Tests to verify the form classes built by BaseWagtailFormBuilder are cached.
+"""
+
+from types import SimpleNamespace
+
+from django import forms
+from django.test import override_settings
+
+import pytest
+
+from tbxforms import forms as tbxforms_forms
+from tbxforms.forms import (
+    clear_form_class_cache,
+    get_cached_form_class,
+    get_form_class_cache_key,
+)
+from tests.models import FormField
+
+ATTRIBUTES = ("clean_name", "label", "required")
+
+
+class Builder:
+    pass
+
+
+class OtherBuilder:
+    pass
+
+
+def field(name, **kwargs):
+    return SimpleNamespace(clean_name=name, label=name.title(), **kwargs)
+
+
+def create(name):
+    return lambda: type(name, (forms.Form,), {})
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    clear_form_class_cache()
+    yield
+    clear_form_class_cache()
+
+
+def test_cache_key():
+    fields = [field("name", required=True), field("email", required=False)]
+    key = get_form_class_cache_key(Builder, fields, ATTRIBUTES)
+    assert key.startswith("%s.Builder:" % Builder.__module__)
+    assert get_form_class_cache_key(Builder, list(fields), ATTRIBUTES) == key
+
+
+def test_cache_key_changes_with_definitions():
+    fields = [field("name", required=True)]
+    key = get_form_class_cache_key(Builder, fields, ATTRIBUTES)
+    assert key != get_form_class_cache_key(
+        Builder, [field("name", required=False)], ATTRIBUTES
+    )
+    assert key != get_form_class_cache_key(
+        Builder, [field("other", required=True)], ATTRIBUTES
+    )
+    assert key != get_form_class_cache_key(OtherBuilder, fields, ATTRIBUTES)
+
+
+def test_cache_key_ignores_other_attributes():
+    key = get_form_class_cache_key(Builder, [field("name")], ATTRIBUTES)
+    assert key == get_form_class_cache_key(
+        Builder, [field("name", id=7)], ATTRIBUTES
+    )
+
+
+def test_cache_key_uses_every_model_field():
+    fields = [FormField(clean_name="name", label="Name", placeholder="")]
+    key = get_form_class_cache_key(Builder, fields, ATTRIBUTES)
+
+    # A column which is not one of the attributes changes the key.
+    assert key != get_form_class_cache_key(
+        Builder,
+        [FormField(clean_name="name", label="Name", placeholder="Jo")],
+        ATTRIBUTES,
+    )
+
+
+def test_cache_key_ignores_page_and_sort_order():
+    fields = [FormField(clean_name="name", label="Name")]
+    key = get_form_class_cache_key(Builder, fields, ATTRIBUTES)
+    assert key == get_form_class_cache_key(
+        Builder,
+        [
+            FormField(
+                id=7, page_id=3, sort_order=2, clean_name="name", label="Name"
+            )
+        ],
+        ATTRIBUTES,
+    )
+
+
+def test_form_class_is_cached():
+    form_class = get_cached_form_class("a", create("A"))
+    assert get_cached_form_class("a", create("Other")) is form_class
+    assert get_cached_form_class("b", create("B")) is not form_class
+
+
+@override_settings(TBXFORMS_FORM_CLASS_CACHE_SIZE=2)
+def test_least_recently_used_is_evicted():
+    first = get_cached_form_class("a", create("A"))
+    get_cached_form_class("b", create("B"))
+    assert get_cached_form_class("a", create("Other")) is first
+
+    get_cached_form_class("c", create("C"))
+    assert get_cached_form_class("a", create("Other")) is first
+    assert get_cached_form_class("b", create("Other")).__name__ == "Other"
+
+
+def test_setting_changed_clears_cache():
+    form_class = get_cached_form_class("a", create("A"))
+    with override_settings(TBXFORMS_FORM_CLASS_CACHE_SIZE=10):
+        assert get_cached_form_class("a", create("Other")) is not form_class
+
+
+@pytest.mark.skipif(
+    not hasattr(tbxforms_forms, "BaseWagtailFormBuilder"),
+    reason="Wagtail is not installed",
+)
+def test_wagtail_form_builder():
+    class FormBuilder(tbxforms_forms.BaseWagtailFormBuilder):
+        def create_form_class(self):
+            return type("WagtailForm", (forms.Form,), self.formfields)
+
+    fields = [
+        SimpleNamespace(
+            clean_name="name",
+            field_type="singleline",
+            label="Name",
+            help_text="",
+            required=True,
+            choices="",
+            default_value="",
+        )
+    ]
+    form_class = FormBuilder(fields).get_form_class()
+    assert FormBuilder(fields).get_form_class() is form_class
+
+    FormBuilder.cache_form_class = False
+    assert FormBuilder(fields).get_form_class() is not form_class
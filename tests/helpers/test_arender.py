@@ -0,0 +1,113 @@
+"""
+Tests to verify forms and formsets can be rendered from async views.
+"""
+
+from unittest import mock
+
+from django import forms
+from django.db import (
+    connection,
+    connections,
+)
+from django.test.html import parse_html
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from asgiref.sync import async_to_sync
+
+from tbxforms.helper import FormHelper
+from tbxforms.layout import (
+    Button,
+    Field,
+    Layout,
+)
+from tests.forms import (
+    BaseTestForm,
+    TextInputForm,
+)
+from tests.models import Authority
+from tests.utils import render_form
+
+TextInputFormSet = forms.formset_factory(TextInputForm, extra=3)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def authorities():
+    with connection.schema_editor() as editor:
+        editor.create_model(Authority)
+    for name in ("Bristol", "Cardiff", "Leeds"):
+        Authority.objects.create(name=name)
+    yield
+    with connection.schema_editor() as editor:
+        editor.delete_model(Authority)
+
+
+class AuthorityForm(BaseTestForm):
+    home = forms.ModelChoiceField(
+        Authority.objects.all(), widget=forms.RadioSelect
+    )
+    work = forms.ModelChoiceField(Authority.objects.all())
+
+
+def get_helper(layout=None):
+    helper = FormHelper()
+    helper.layout = layout
+    helper.add_input(Button.primary("submit", "Submit"))
+    return helper
+
+
+def arender(helper, form, context=None):
+    return async_to_sync(helper.arender)(form, context)
+
+
+def test_form_same_as_crispy_tag():
+    form = TextInputForm()
+    expected = render_form(form)
+    html = arender(form.helper, TextInputForm())
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_formset_same_as_render_iter():
+    helper = get_helper(Layout(Field.text("name")))
+    context = {"csrf_token": "token"}
+    expected = "".join(helper.render_iter(TextInputFormSet(), context))
+    html = arender(helper, TextInputFormSet(), context)
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_formset_without_layout():
+    helper = get_helper()
+    expected = "".join(helper.render_iter(TextInputFormSet()))
+    html = arender(helper, TextInputFormSet())
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_formset_forms_are_in_order():
+    helper = get_helper(Layout(Field.text("name")))
+    html = arender(helper, TextInputFormSet())
+    positions = [html.index('name="form-%d-name"' % i) for i in range(3)]
+    assert positions == sorted(positions)
+
+
+def test_choices_are_fetched_once():
+    form = AuthorityForm()
+    expected = render_form(form)
+    with CaptureQueriesContext(connection) as queries:
+        html = arender(form.helper, AuthorityForm())
+    assert len(queries) == 1
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_form_render_closes_connections():
+    form = TextInputForm()
+    with mock.patch.object(connections, "close_all") as close_all:
+        arender(form.helper, form)
+    assert close_all.call_count == 1
+
+
+def test_formset_renders_close_connections():
+    helper = get_helper(Layout(Field.text("name")))
+    with mock.patch.object(connections, "close_all") as close_all:
+        arender(helper, TextInputFormSet())
+    assert close_all.call_count == 3
@@ -0,0 +1,122 @@
+"""
+Tests to verify the FormHelper is shared between instances of a form class.
+"""
+
+from django import forms
+
+from tbxforms.layout import (
+    Button,
+    Div,
+    Field,
+    Layout,
+    Size,
+)
+from tests.forms import BaseTestForm
+from tests.utils import render_form
+
+
+class SharedLayoutForm(BaseTestForm):
+    name = forms.CharField(label="Name")
+
+    @classmethod
+    def build_layout(cls):
+        return Layout(Field.text("name"))
+
+
+def test_helper_is_built_once_per_class():
+    prototype = SharedLayoutForm.get_helper_prototype()
+    assert SharedLayoutForm().helper is not prototype
+    assert SharedLayoutForm.get_helper_prototype() is prototype
+
+
+def test_subclasses_have_their_own_prototype():
+    class OtherForm(SharedLayoutForm):
+        @classmethod
+        def build_layout(cls):
+            return Layout("name")
+
+    assert (
+        OtherForm.get_helper_prototype()
+        is not SharedLayoutForm.get_helper_prototype()
+    )
+    assert OtherForm().helper.layout.fields == ["name"]
+
+
+def test_layout_objects_are_shared():
+    form1 = SharedLayoutForm()
+    form2 = SharedLayoutForm()
+    assert form1.helper.layout is not form2.helper.layout
+    assert form1.helper.layout.fields[0] is form2.helper.layout.fields[0]
+
+
+def test_instance_changes_are_not_shared():
+    form = SharedLayoutForm()
+    form.helper.layout.append(Button.primary("submit", "Submit"))
+    form.helper.label_size = ""
+    form.helper.attrs["novalidate"] = ""
+
+    other = SharedLayoutForm()
+    assert len(other.helper.layout.fields) == 1
+    assert other.helper.label_size == Size.MEDIUM
+    assert other.helper.attrs == {}
+
+
+def test_helper_form():
+    form = SharedLayoutForm()
+    assert form.helper.form is form
+
+
+def test_default_layout_uses_instance_fields():
+    class DefaultLayoutForm(BaseTestForm):
+        name = forms.CharField()
+
+    assert DefaultLayoutForm.get_helper_prototype().layout is None
+
+    form = DefaultLayoutForm()
+    assert form.helper.layout.fields == ["name"]
+    assert DefaultLayoutForm().helper.layout is not form.helper.layout
+
+
+def test_shared_layout_renders():
+    assert render_form(SharedLayoutForm()) == render_form(SharedLayoutForm())
+
+
+def test_layout_is_copied_when_changed():
+    """
+    Verify changing the layout objects through the helper only changes the
+    instance's layout.
+    """
+    form = SharedLayoutForm()
+    shared = form.helper.layout.fields[0]
+    form.helper["name"].wrap(Div, css_class="wrapper")
+
+    other = SharedLayoutForm()
+    assert other.helper.layout.fields[0] is shared
+    assert isinstance(shared, Field)
+    assert "wrapper" not in render_form(other)
+    assert "wrapper" in render_form(form)
+
+
+def test_update_attributes_is_not_shared():
+    form = SharedLayoutForm()
+    form.helper.all().update_attributes(placeholder="Your name")
+    assert "placeholder" in render_form(form)
+    assert "placeholder" not in render_form(SharedLayoutForm())
+
+
+def test_helper_attribute_lookup_shares_layout():
+    form = SharedLayoutForm()
+    assert form.helper["label_size"] == Size.MEDIUM
+    assert (
+        form.helper.layout.fields[0]
+        is SharedLayoutForm().helper.layout.fields[0]
+    )
+
+
+def test_replaced_layout_is_not_copied():
+    form = SharedLayoutForm()
+    layout = Layout(Field.text("name"))
+    form.helper.layout = layout
+    field = layout.fields[0]
+    form.helper.all()
+    assert form.helper.layout.fields[0] is field
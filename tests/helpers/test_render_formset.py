@@ -0,0 +1,174 @@
+"""
+Tests to verify the forms of a formset can be rendered in parallel.
+"""
+
+import threading
+
+from unittest import mock
+
+from django import forms
+from django.db import (
+    connection,
+    connections,
+)
+from django.template import (
+    Context,
+    Template,
+)
+from django.test.html import parse_html
+from django.test.utils import CaptureQueriesContext
+
+import pytest
+
+from tbxforms.helper import FormHelper
+from tbxforms.layout import (
+    Button,
+    Field,
+    Layout,
+)
+from tests.forms import (
+    BaseTestForm,
+    TextInputForm,
+)
+from tests.models import Authority
+
+TextInputFormSet = forms.formset_factory(TextInputForm, extra=5)
+
+
+class AuthorityForm(BaseTestForm):
+    home = forms.ModelChoiceField(
+        Authority.objects.all(), widget=forms.RadioSelect
+    )
+    work = forms.ModelChoiceField(Authority.objects.all())
+
+
+AuthorityFormSet = forms.formset_factory(AuthorityForm, extra=3)
+
+
+@pytest.fixture
+def authorities():
+    with connection.schema_editor() as editor:
+        editor.create_model(Authority)
+    for name in ("Bristol", "Cardiff", "Leeds"):
+        Authority.objects.create(name=name)
+    yield
+    with connection.schema_editor() as editor:
+        editor.delete_model(Authority)
+
+
+def render_tag(tag, formset, helper):
+    template = Template(
+        "{%% load crispy_forms_tags tbxforms %%}{%% %s formset helper %%}"
+        % tag
+    )
+    context = Context(
+        {"formset": formset, "helper": helper, "csrf_token": "token"}
+    )
+    return template.render(context)
+
+
+def get_helper(layout=None, render_threads=None):
+    helper = FormHelper()
+    helper.layout = layout
+    helper.render_threads = render_threads
+    helper.add_input(Button.primary("submit", "Submit"))
+    return helper
+
+
+def test_same_as_crispy_tag():
+    helper = get_helper(Layout(Field.text("name")), render_threads=4)
+    expected = render_tag("crispy", TextInputFormSet(), helper)
+    html = helper.render_formset(TextInputFormSet(), {"csrf_token": "token"})
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_same_as_crispy_tag_without_layout():
+    helper = get_helper(render_threads=4)
+    expected = render_tag("crispy", TextInputFormSet(), helper)
+    html = helper.render_formset(TextInputFormSet(), {"csrf_token": "token"})
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_same_without_threads():
+    helper = get_helper(Layout(Field.text("name")))
+    expected = helper.render_formset(TextInputFormSet())
+    helper.render_threads = 2
+    assert helper.render_formset(TextInputFormSet()) == expected
+
+
+def test_bound_formset():
+    data = {
+        "form-TOTAL_FORMS": "3",
+        "form-INITIAL_FORMS": "0",
+        "form-0-name": "Homer",
+        "form-1-name": "",
+        "form-2-name": "Marge",
+    }
+    helper = get_helper(Layout(Field.text("name")), render_threads=3)
+    formset = TextInputFormSet(data=data)
+    formset.is_valid()
+    expected = render_tag("crispy", formset, helper)
+
+    formset = TextInputFormSet(data=data)
+    formset.is_valid()
+    html = helper.render_formset(formset, {"csrf_token": "token"})
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_forms_are_in_order():
+    helper = get_helper(Layout(Field.text("name")), render_threads=4)
+    html = helper.render_formset(TextInputFormSet())
+    positions = [html.index('name="form-%d-name"' % i) for i in range(5)]
+    assert positions == sorted(positions)
+
+
+def test_forms_are_rendered_in_threads():
+    threads = set()
+    helper = get_helper(Layout(Field.text("name")), render_threads=2)
+    render_formset_form = helper.render_formset_form
+
+    def record_thread(*args):
+        threads.add(threading.current_thread().name)
+        return render_formset_form(*args)
+
+    helper.render_formset_form = record_thread
+    helper.render_formset(TextInputFormSet())
+    assert threads
+    assert all(name.startswith("tbxforms") for name in threads)
+
+
+def test_crispy_tbx_tag_renders_in_parallel():
+    helper = get_helper(Layout(Field.text("name")), render_threads=4)
+    expected = render_tag("crispy", TextInputFormSet(), helper)
+    html = render_tag("crispy_tbx", TextInputFormSet(), helper)
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_choices_are_fetched_by_calling_thread(authorities):
+    """
+    Verify the choices are fetched on the calling thread's connection, so
+    the pool threads run no queries.
+    """
+    queries = []
+    helper = get_helper(render_threads=3)
+    render_formset_form = helper.render_formset_form
+
+    def record_queries(*args):
+        with CaptureQueriesContext(connection) as context:
+            html = render_formset_form(*args)
+        queries.extend(context.captured_queries)
+        return html
+
+    helper.render_formset_form = record_queries
+    with CaptureQueriesContext(connection) as context:
+        html = helper.render_formset(AuthorityFormSet())
+    assert len(context.captured_queries) == 1
+    assert queries == []
+    assert html.count("Cardiff") == 6
+
+
+def test_pool_threads_close_connections():
+    helper = get_helper(Layout(Field.text("name")), render_threads=2)
+    with mock.patch.object(connections, "close_all") as close_all:
+        helper.render_formset(TextInputFormSet())
+    assert close_all.call_count == 5
@@ -0,0 +1,92 @@
+"""
+Tests to verify formsets can be rendered one form at a time.
+"""
+
+from django import forms
+from django.template import (
+    Context,
+    Template,
+)
+from django.test.html import parse_html
+
+from tbxforms.helper import FormHelper
+from tbxforms.layout import (
+    Button,
+    Field,
+    Layout,
+)
+from tests.forms import TextInputForm
+
+TextInputFormSet = forms.formset_factory(TextInputForm, extra=3)
+
+
+def render_tag(formset, helper):
+    template = Template(
+        "{% load crispy_forms_tags %}{% crispy formset helper %}"
+    )
+    context = Context(
+        {"formset": formset, "helper": helper, "csrf_token": "token"}
+    )
+    return template.render(context)
+
+
+def get_helper(layout=None):
+    helper = FormHelper()
+    helper.layout = layout
+    helper.add_input(Button.primary("submit", "Submit"))
+    return helper
+
+
+def test_same_as_crispy_tag():
+    helper = get_helper(Layout(Field.text("name")))
+    expected = render_tag(TextInputFormSet(), helper)
+    html = "".join(
+        helper.render_iter(TextInputFormSet(), {"csrf_token": "token"})
+    )
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_same_as_crispy_tag_without_layout():
+    helper = get_helper()
+    expected = render_tag(TextInputFormSet(), helper)
+    html = "".join(
+        helper.render_iter(TextInputFormSet(), {"csrf_token": "token"})
+    )
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_bound_formset():
+    data = {
+        "form-TOTAL_FORMS": "2",
+        "form-INITIAL_FORMS": "0",
+        "form-0-name": "Homer",
+        "form-1-name": "",
+    }
+    helper = get_helper(Layout(Field.text("name")))
+    formset = TextInputFormSet(data=data)
+    formset.is_valid()
+    expected = render_tag(formset, helper)
+
+    formset = TextInputFormSet(data=data)
+    formset.is_valid()
+    html = "".join(helper.render_iter(formset, {"csrf_token": "token"}))
+    assert parse_html(html) == parse_html(expected)
+
+
+def test_yields_each_form():
+    helper = get_helper(Layout(Field.text("name")))
+    formset = TextInputFormSet()
+    parts = list(helper.render_iter(formset))
+
+    assert len(parts) == len(formset.forms) + 2
+    assert 'name="form-TOTAL_FORMS"' in parts[0]
+    for index, part in enumerate(parts[1:-1]):
+        assert 'name="form-%d-name"' % index in part
+    assert "</form>" in parts[-1]
+
+
+def test_form_html_is_not_kept():
+    helper = get_helper(Layout(Field.text("name")))
+    formset = TextInputFormSet()
+    list(helper.render_iter(formset))
+    assert not any(hasattr(form, "form_html") for form in formset)
@@ -0,0 +1,122 @@
+"""
+Tests to verify the same form can be rendered from many threads at once.
+"""
+
+import threading
+
+from django import forms
+from django.template import (
+    Context,
+    Template,
+)
+from django.test.html import parse_html
+
+import pytest
+
+from crispy_forms.utils import render_crispy_form
+
+from tbxforms.fields import DateInputField
+from tbxforms.layout import (
+    Field,
+    Fieldset,
+    Layout,
+)
+from tests.forms import BaseTestForm
+
+THREADS = 32
+RENDERS = 5
+
+
+class StressForm(BaseTestForm):
+    name = forms.CharField(help_text="Your full name")
+    contact = forms.ChoiceField(
+        choices=(("email", "Email"), ("phone", "Phone")),
+        widget=forms.RadioSelect,
+    )
+    email = forms.EmailField(required=False)
+    date = DateInputField()
+    notes = forms.CharField(widget=forms.HiddenInput, required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            Fieldset(
+                Field("name", css_class="extra", autocomplete="name"),
+                Field.radios("contact"),
+                Field.text(
+                    "email",
+                    data_conditional={
+                        "field_name": "contact",
+                        "values": ["email"],
+                    },
+                ),
+            ),
+            Field("date"),
+        )
+
+
+def render_tag(form):
+    template = Template("{% load tbxforms %}{% crispy_tbx form %}")
+    return template.render(Context({"form": form, "csrf_token": "token"}))
+
+
+def render_in_threads(render):
+    """
+    Call render from THREADS threads at once and return every result.
+    """
+    barrier = threading.Barrier(THREADS)
+    results = []
+    errors = []
+
+    def run():
+        try:
+            barrier.wait()
+            for index in range(RENDERS):
+                results.append(render())
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for index in range(THREADS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    return results
+
+
+@pytest.fixture(params=[False, True], ids=["templates", "compiled"])
+def form(request):
+    form = StressForm(data={"contact": "email", "date_0": "32"})
+    form.is_valid()
+    form.helper.compiled_layout = request.param
+    return form
+
+
+def test_render_tag_from_threads(form):
+    expected = render_crispy_form(form, context={"csrf_token": "token"})
+    results = render_in_threads(lambda: render_tag(form))
+    assert len(results) == THREADS * RENDERS
+    assert len(set(results)) == 1
+    assert parse_html(results[0]) == parse_html(expected)
+
+
+def test_render_form_from_threads(form):
+    expected = form.helper.render_form(form)
+    results = render_in_threads(lambda: form.helper.render_form(form))
+    assert set(results) == {expected}
+
+
+def test_form_is_not_changed(form):
+    widgets = {
+        name: (field.widget, dict(field.widget.attrs))
+        for name, field in form.fields.items()
+    }
+    render_in_threads(lambda: render_tag(form))
+    for name, field in form.fields.items():
+        widget, attrs = widgets[name]
+        assert field.widget is widget
+        assert field.widget.attrs == attrs
+    assert not hasattr(form, "rendered_fields")
+    assert not hasattr(form, "form_html")
@@ -0,0 +1,189 @@
+"""
+Tests to verify fields hidden by their conditional rules are not cleaned and
+their values are dropped.
+"""
+
+from django import forms
+
+from tbxforms.choices import Choice
+from tbxforms.conditional import (
+    ConditionalRules,
+    get_conditional_rules,
+)
+from tbxforms.fields import DateInputField
+from tbxforms.layout import (
+    Div,
+    Field,
+    Layout,
+)
+from tests.forms import BaseTestForm
+
+CHOICES = (
+    Choice("email", "Email"),
+    Choice("phone", "Phone"),
+)
+
+
+def when(field_name, *values):
+    return {"field_name": field_name, "values": list(values)}
+
+
+class ContactForm(BaseTestForm):
+    method = forms.ChoiceField(
+        choices=CHOICES, widget=forms.RadioSelect, required=False
+    )
+    email = forms.EmailField(required=False)
+    confirm = forms.BooleanField(required=False)
+    confirm_email = forms.EmailField(required=False)
+    phone = forms.CharField(required=False, max_length=5)
+    call_date = DateInputField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            Field.radios("method"),
+            Field.text("email", data_conditional=when("method", "email")),
+            Field.checkbox(
+                "confirm", data_conditional=when("method", "email")
+            ),
+            Field.text(
+                "confirm_email", data_conditional=when("confirm", True)
+            ),
+            Div(
+                Field.text("phone"),
+                Field("call_date"),
+                data_conditional=when("method", "phone"),
+            ),
+        )
+
+    def clean_phone(self):
+        raise forms.ValidationError("Phone was cleaned.")
+
+
+def test_hidden_fields_are_not_cleaned():
+    form = ContactForm(
+        data={
+            "method": "email",
+            "email": "homer@example.com",
+            "phone": "not a phone number",
+            "call_date_0": "99",
+        }
+    )
+    assert form.is_valid(), form.errors
+    assert form.inactive_fields == {"confirm_email", "phone", "call_date"}
+    assert form.cleaned_data == {
+        "method": "email",
+        "email": "homer@example.com",
+        "confirm": False,
+        "confirm_email": "",
+        "phone": "",
+        "call_date": None,
+    }
+
+
+def test_hidden_values_are_dropped():
+    form = ContactForm(
+        data={"method": "email", "phone": "12", "call_date_0": "1"}
+    )
+    form.is_valid()
+    assert "phone" not in form.data
+    assert "call_date_0" not in form.data
+    assert form["phone"].value() is None
+
+
+def test_visible_fields_are_cleaned():
+    form = ContactForm(
+        data={"method": "phone", "email": "homer", "phone": "1"}
+    )
+    assert not form.is_valid()
+    assert form.errors == {"phone": ["Phone was cleaned."]}
+    assert form.cleaned_data["email"] == ""
+
+
+def test_chained_rules():
+    """
+    Verify a field is inactive when the field it depends on is inactive,
+    even if the submitted value of that field meets the rule.
+    """
+    data = {"confirm": "on", "confirm_email": "homer"}
+    form = ContactForm(data={"method": "email", **data})
+    assert not form.is_valid()
+    assert list(form.errors) == ["confirm_email"]
+
+    form = ContactForm(data={"method": "phone", "phone": "1", **data})
+    form.is_valid()
+    assert {"confirm", "confirm_email"} <= form.inactive_fields
+    assert "confirm_email" not in form.errors
+
+
+def test_cycle_of_rules():
+    class CycleForm(BaseTestForm):
+        first = forms.CharField(required=False)
+        second = forms.CharField(required=False)
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout(
+                Field.text("first", data_conditional=when("second", "b")),
+                Field.text("second", data_conditional=when("first", "a")),
+            )
+
+    form = CycleForm(data={"first": "a", "second": "b"})
+    form.is_valid()
+    assert form.inactive_fields == frozenset()
+
+    form = CycleForm(data={"first": "x", "second": "b"})
+    form.is_valid()
+    assert form.inactive_fields == {"first", "second"}
+
+
+def test_unbound_form():
+    form = ContactForm()
+    assert not form.is_valid()
+    assert form.inactive_fields == frozenset()
+
+
+def test_rules_are_cached_per_layout():
+    form = ContactForm()
+    rules = get_conditional_rules(form, form.helper.layout)
+    assert isinstance(rules, ConditionalRules)
+    assert get_conditional_rules(ContactForm(), form.helper.layout) is rules
+    assert set(rules.rules) == {
+        "email",
+        "confirm",
+        "confirm_email",
+        "phone",
+        "call_date",
+    }
+
+
+def test_numbers_are_not_matched_for_radios():
+    """
+    Verify the inactive fields are the ones tbxforms.js hides, so a number
+    does not match the value of a radio button.
+    """
+
+    class NumberForm(BaseTestForm):
+        method = forms.ChoiceField(
+            choices=(("1", "One"), ("2", "Two")), widget=forms.RadioSelect
+        )
+        count = forms.CharField(required=False)
+        detail = forms.CharField()
+        more = forms.CharField()
+
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout(
+                Field.radios("method"),
+                Field.text("count"),
+                Field.text("detail", data_conditional=when("method", 1)),
+                Field.text("more", data_conditional=when("count", 0)),
+            )
+
+    form = NumberForm(data={"method": "1", "count": "3"})
+    assert form.is_valid(), form.errors
+    assert form.inactive_fields == {"detail", "more"}
+
+    form = NumberForm(data={"method": "1", "count": ""})
+    assert not form.is_valid()
+    assert list(form.errors) == ["more"]
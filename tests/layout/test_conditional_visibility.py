@@ -0,0 +1,290 @@
+"""
+Tests to verify conditional fields and containers are rendered hidden, and
+their triggers with aria-expanded, according to the form's values.
+"""
+
+from django import forms
+from django.test.html import parse_html
+
+from tbxforms.choices import Choice
+from tbxforms.conditional import (
+    ConditionalRule,
+    get_expanded,
+    get_values,
+    matches,
+    to_number,
+)
+from tbxforms.layout import (
+    Div,
+    Field,
+    Fieldset,
+    Layout,
+)
+from tests.forms import BaseTestForm
+from tests.utils import render_form
+
+CHOICES = (
+    Choice("email", "Email"),
+    Choice("phone", "Phone"),
+)
+
+
+class ContactForm(BaseTestForm):
+    method = forms.ChoiceField(
+        choices=CHOICES, widget=forms.RadioSelect, required=False
+    )
+    email = forms.EmailField(required=False)
+    phone = forms.CharField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            Field.radios("method"),
+            Field.text(
+                "email",
+                data_conditional={"field_name": "method", "values": ["email"]},
+            ),
+            Div(
+                Field.text("phone"),
+                data_conditional={"field_name": "method", "values": ["phone"]},
+            ),
+        )
+
+
+class SelectForm(BaseTestForm):
+    method = forms.ChoiceField(choices=CHOICES, required=False)
+    email = forms.EmailField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            Field.select("method"),
+            Fieldset(
+                Field.text("email"),
+                legend="Email",
+                data_conditional={"field_name": "method", "values": ["email"]},
+            ),
+        )
+
+
+class CheckboxForm(BaseTestForm):
+    subscribe = forms.BooleanField(required=False)
+    email = forms.EmailField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            Field.checkbox("subscribe"),
+            Field.text(
+                "email",
+                data_conditional={"field_name": "subscribe", "values": [True]},
+            ),
+        )
+
+
+def get_element(html, **attrs):
+    """
+    Return the first element in the rendered html with the given attributes.
+    """
+    elements = [parse_html(html)]
+    while elements:
+        element = elements.pop(0)
+        if isinstance(element, str):
+            continue
+        element_attrs = dict(element.attributes)
+        if all(element_attrs.get(k) == v for k, v in attrs.items()):
+            return element_attrs
+        elements.extend(element.children)
+    raise AssertionError("No element with %r" % attrs)
+
+
+def is_hidden(html, element_id):
+    return "hidden" in get_element(html, id=element_id)
+
+
+def test_unbound_form_hides_all_fields():
+    html = render_form(ContactForm())
+    assert is_hidden(html, "div_id_email")
+    assert get_element(html, id="id_phone")
+    assert (
+        "tbxforms-conditional" in get_element(html, id="div_id_email")["class"]
+    )
+    assert get_element(html, id="id_method_1")["aria-expanded"] == "false"
+
+
+def test_initial_value_shows_field():
+    html = render_form(ContactForm(initial={"method": "email"}))
+    assert not is_hidden(html, "div_id_email")
+    assert get_element(html, id="id_method_1")["aria-expanded"] == "true"
+    assert get_element(html, id="id_method_2")["aria-expanded"] == "true"
+
+
+def test_bound_value_shows_container():
+    form = ContactForm(data={"method": "phone"})
+    html = render_form(form)
+    assert is_hidden(html, "div_id_email")
+    container = get_element(html, **{"data-conditional-field-name": "method"})
+    assert "hidden" not in container
+    assert get_element(html, id="id_method_1")["aria-expanded"] == "true"
+
+
+def test_select_shows_first_option():
+    """
+    Verify a select with no value is treated as having its first option
+    selected, as the browser does.
+    """
+    html = render_form(SelectForm())
+    fieldset = get_element(html, **{"data-conditional-field-name": "method"})
+    assert "hidden" not in fieldset
+    assert get_element(html, id="id_method")["aria-expanded"] == "true"
+
+    html = render_form(SelectForm(initial={"method": "phone"}))
+    fieldset = get_element(html, **{"data-conditional-field-name": "method"})
+    assert "hidden" in fieldset
+    assert get_element(html, id="id_method")["aria-expanded"] == "false"
+
+
+def test_checkbox():
+    assert is_hidden(render_form(CheckboxForm()), "div_id_email")
+    html = render_form(CheckboxForm(data={"subscribe": "on"}))
+    assert not is_hidden(html, "div_id_email")
+    assert get_element(html, id="id_subscribe")["aria-expanded"] == "true"
+
+
+def test_missing_trigger_is_shown():
+    class MissingForm(ContactForm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout(
+                Field.text(
+                    "email",
+                    data_conditional={"field_name": "other", "values": ["x"]},
+                ),
+            )
+
+    assert not is_hidden(render_form(MissingForm()), "div_id_email")
+
+
+def test_prefixed_trigger():
+    class PrefixedForm(ContactForm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, prefix="contact", **kwargs)
+            self.helper.layout = Layout(
+                Field.radios("method"),
+                Field.text(
+                    "email",
+                    data_conditional={
+                        "field_name": "contact-method",
+                        "values": ["email"],
+                    },
+                ),
+            )
+
+    form = PrefixedForm(data={"contact-method": "email"})
+    assert not is_hidden(render_form(form), "div_id_contact-email")
+
+
+def test_get_expanded():
+    form = ContactForm(data={"method": "phone"})
+    assert get_expanded(form, form.helper.layout) == {"method": True}
+
+
+def test_rule_from_attrs():
+    field = Field.text(
+        "email", data_conditional={"field_name": "method", "values": [1]}
+    )
+    assert field.conditional.field_name == "method"
+    assert field.conditional.values == (1,)
+    assert ConditionalRule.from_attrs({}) is None
+
+
+class NumberForm(BaseTestForm):
+    method = forms.ChoiceField(
+        choices=(("1", "One"), ("2", "Two")),
+        widget=forms.RadioSelect,
+        required=False,
+    )
+    size = forms.ChoiceField(choices=(("1", "One"), ("2", "Two")))
+    count = forms.CharField(required=False)
+    detail = forms.CharField(required=False)
+    other = forms.CharField(required=False)
+    more = forms.CharField(required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            Field.radios("method"),
+            Field.select("size"),
+            Field.text("count"),
+            Field.text(
+                "detail",
+                data_conditional={"field_name": "method", "values": [1]},
+            ),
+            Field.text(
+                "other",
+                data_conditional={"field_name": "size", "values": [1]},
+            ),
+            Field.text(
+                "more",
+                data_conditional={"field_name": "count", "values": [0]},
+            ),
+        )
+
+
+def test_numbers_are_not_matched_for_radios():
+    """
+    Verify a number only matches the string value of a single input, as
+    tbxforms.js compares the values of radio buttons as strings.
+    """
+    html = render_form(NumberForm(data={"method": "1", "size": "1"}))
+    assert is_hidden(html, "div_id_detail")
+    assert get_element(html, id="id_method_1")["aria-expanded"] == "false"
+    assert not is_hidden(html, "div_id_other")
+    assert get_element(html, id="id_size")["aria-expanded"] == "true"
+
+
+def test_empty_value_matches_zero():
+    assert not is_hidden(render_form(NumberForm()), "div_id_more")
+    html = render_form(NumberForm(data={"count": "2"}))
+    assert is_hidden(html, "div_id_more")
+    assert not is_hidden(
+        render_form(NumberForm(data={"count": " 0x0 "})), "div_id_more"
+    )
+
+
+def test_get_values():
+    form = NumberForm(data={"method": "2", "size": "3", "count": "4"})
+    assert get_values(form["method"]) == (["2"], True)
+    assert get_values(form["size"]) == (["1"], False)
+    assert get_values(form["count"]) == (["4"], False)
+    assert get_values(NumberForm()["method"]) == ([], True)
+    assert get_values(CheckboxForm()["subscribe"]) == ([False], False)
+
+
+def test_matches():
+    assert matches("email", "email")
+    assert matches("1", 1)
+    assert matches("1.0", 1)
+    assert matches("", 0)
+    assert matches(True, True)
+    assert matches(True, 1)
+    assert matches(False, 0)
+    assert not matches("True", True)
+    assert not matches(None, "None")
+    assert not matches("a", 1)
+    assert not matches("1", True)
+    assert matches("1", "1", multiple=True)
+    assert not matches("1", 1, multiple=True)
+
+
+def test_to_number():
+    assert to_number("") == 0
+    assert to_number(" 12 ") == 12
+    assert to_number("1e3") == 1000
+    assert to_number(".5") == 0.5
+    assert to_number("0x10") == 16
+    assert to_number("-Infinity") == float("-inf")
+    assert to_number(True) == 1
+    assert to_number("1_000") is None
+    assert to_number("nan") is None
+    assert to_number("a") is None
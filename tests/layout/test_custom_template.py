@@ -0,0 +1,46 @@
+"""
+Tests to verify the attributes of a layout Field are added to the widget
+when the field is rendered with a template outside the template pack.
+"""
+
+from django.test.html import parse_html
+
+import pytest
+
+from tbxforms.layout import (
+    Field,
+    Layout,
+)
+from tests.forms import TextInputForm
+from tests.utils import render_form
+
+
+@pytest.mark.parametrize(
+    "template", ("tests/field.html", "tests/crispy_field.html")
+)
+def test_custom_template(template):
+    class CustomForm(TextInputForm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout(
+                Field(
+                    "name",
+                    template=template,
+                    css_class="wide",
+                    placeholder="Your name",
+                )
+            )
+
+    form = CustomForm()
+    widget = form.fields["name"].widget
+    attrs = widget.attrs.copy()
+
+    html = render_form(form)
+    element = parse_html(html).children[0].children[0]
+    assert element.name == "input"
+    assert ("placeholder", "Your name") in element.attributes
+    assert "wide" in dict(element.attributes)["class"]
+
+    assert render_form(form) == html
+    assert form.fields["name"].widget is widget
+    assert widget.attrs == attrs
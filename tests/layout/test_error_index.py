@@ -0,0 +1,124 @@
+"""
+Tests to verify the error index used to render validation errors.
+"""
+
+from django import forms
+
+import pytest
+
+from tbxforms.errors import (
+    ErrorIndex,
+    get_error_index,
+)
+from tbxforms.templatetags.tbxforms import (
+    error_messages,
+    field_errors,
+)
+from tests.forms import BaseTestForm
+from tests.utils import render_form
+
+
+class ContactForm(BaseTestForm):
+    name = forms.CharField(label="Name")
+    token = forms.CharField(widget=forms.HiddenInput)
+    email = forms.EmailField(label="<b>Email</b>")
+
+
+def test_no_errors():
+    index = ContactForm().error_index
+    assert index.fields == {}
+    assert index.summary == []
+
+
+def test_field_errors():
+    form = ContactForm(data={"email": "invalid"})
+    index = form.error_index
+
+    assert list(index.fields) == ["name", "token", "email"]
+    name = index.get("name")
+    assert name.anchor == "div_id_name"
+    assert name.label == "Name"
+    assert list(name.messages) == ["This field is required."]
+    assert name.error_ids == ("id_name_1_error",)
+    assert index.get("missing") is None
+
+
+def test_summary_excludes_hidden_fields():
+    form = ContactForm(data={"email": "invalid"})
+    summary = [
+        (field_errors.name, message)
+        for field_errors, message in form.error_index.summary
+    ]
+    assert summary == [
+        ("name", "This field is required."),
+        ("email", "Enter a valid email address."),
+    ]
+
+
+def test_prefix():
+    form = ContactForm(data={}, prefix="contact")
+    name = form.error_index.get("name")
+    assert name.anchor == "div_id_contact-name"
+    assert name.error_ids == ("id_contact-name_1_error",)
+
+
+def test_index_is_cached():
+    form = ContactForm(data={})
+    assert form.error_index is form.error_index
+
+
+def test_add_error_updates_index():
+    form = ContactForm(data={"name": "Homer", "token": "x"})
+    assert form.error_index.get("name") is None
+
+    form.add_error("name", "Name is taken.")
+    assert form.error_index.get("name").error_ids == ("id_name_1_error",)
+
+    form.add_error("name", "Name is too short.")
+    assert len(form.error_index.get("name").error_ids) == 2
+
+
+def test_full_clean_updates_index():
+    form = ContactForm(data={})
+    assert form.error_index.get("name")
+
+    form.data = {"name": "Homer", "token": "x", "email": "a@example.com"}
+    form.full_clean()
+    assert form.error_index.fields == {}
+
+
+def test_forms_without_mixin():
+    class PlainForm(forms.Form):
+        name = forms.CharField()
+
+    form = PlainForm(data={})
+    assert isinstance(get_error_index(form), ErrorIndex)
+    assert get_error_index(form).get("name").anchor == "div_id_name"
+
+
+def test_summary_rendered():
+    html = render_form(ContactForm(data={"email": "invalid"}))
+    assert '<a href="#div_id_name"' in html
+    assert '<a href="#div_id_token"' not in html
+    assert "Email: Enter a valid email address." in html
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_field_errors_rendered_from_index(compiled):
+    form = ContactForm(data={"email": "invalid"})
+    form.helper.compiled_layout = compiled
+    form.error_index.get("name").error_ids = ("name_error",)
+    html = render_form(form)
+    assert '<p id="name_error" class="tbxforms-error-message">' in html
+    assert 'aria-describedby="name_error"' in html
+    assert "id_name_1_error" not in html
+
+
+def test_field_errors_filter():
+    form = ContactForm(data={"email": "invalid"})
+    assert list(error_messages(form["email"])) == [
+        ("Enter a valid email address.", "id_email_1_error")
+    ]
+    assert list(error_messages(ContactForm()["email"])) == []
+    form.error_index.get("email").messages = ["Changed."]
+    assert list(field_errors(form["email"])) == [("id_email", ["Changed."])]
@@ -0,0 +1,68 @@
+"""
+Tests to verify rendering a form does not change it, so rendering it again
+gives the same result.
+"""
+
+from django import forms
+
+import pytest
+
+from tbxforms.layout import (
+    Field,
+    Layout,
+)
+from tests.forms import (
+    BaseTestForm,
+    CheckboxesForm,
+    DateInputForm,
+    FileUploadForm,
+    RadiosForm,
+    SelectForm,
+    TextareaForm,
+    TextInputForm,
+)
+from tests.utils import render_form
+
+
+class AttrsForm(BaseTestForm):
+    name = forms.CharField(label="Name", help_text="Your full name")
+    description = forms.CharField(
+        label="Description", widget=forms.Textarea, max_length=100
+    )
+
+    @classmethod
+    def build_layout(cls):
+        return Layout(
+            Field.text("name", autocomplete="name"),
+            Field.textarea("description", max_characters=100),
+        )
+
+
+@pytest.mark.parametrize(
+    "form_class",
+    [
+        AttrsForm,
+        CheckboxesForm,
+        DateInputForm,
+        FileUploadForm,
+        RadiosForm,
+        SelectForm,
+        TextareaForm,
+        TextInputForm,
+    ],
+)
+@pytest.mark.parametrize("data", [None, {}, {"date_0": "x", "date_2": "1"}])
+def test_render_twice(form_class, data):
+    form = form_class(data=data)
+    assert render_form(form) == render_form(form)
+
+
+def test_widget_attrs_unchanged():
+    form = DateInputForm(data={"date_0": "x"})
+    widget = form.fields["date"].widget
+    attrs = [subwidget.attrs.copy() for subwidget in widget.widgets]
+    html = render_form(form)
+
+    assert [subwidget.attrs for subwidget in widget.widgets] == attrs
+    assert "Day" in html
+    assert 'label="Day"' not in html
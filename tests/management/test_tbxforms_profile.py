@@ -0,0 +1,150 @@
+"""
+Tests to verify the tbxforms_profile management command.
+"""
+
+import io
+import json
+
+from django import forms
+from django.core.management import (
+    CommandError,
+    call_command,
+)
+from django.db import connection
+
+import pytest
+
+from tbxforms.forms import TbxFormsMixin
+from tbxforms.registry import (
+    get_form_path,
+    unregister,
+)
+from tests.models import Authority
+
+
+def profile(*args, **kwargs):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    try:
+        call_command(
+            "tbxforms_profile", *args, stdout=stdout, stderr=stderr, **kwargs
+        )
+    finally:
+        stdout.seek(0)
+        stderr.seek(0)
+    return stdout.getvalue(), stderr.getvalue()
+
+
+def test_table():
+    stdout, stderr = profile("tests.forms.TextInputForm", number=1)
+    lines = stdout.splitlines()
+    assert lines[0].split() == [
+        "Form",
+        "State",
+        "Time",
+        "(ms)",
+        "Bytes",
+        "Templates",
+        "Queries",
+    ]
+    assert lines[1].split()[:2] == ["tests.forms.TextInputForm", "unbound"]
+    assert lines[2].split()[:2] == ["tests.forms.TextInputForm", "errors"]
+    assert stderr == ""
+
+
+def test_json():
+    stdout, stderr = profile("tests.forms.TextInputForm", number=1, json=True)
+    unbound, errors = json.loads(stdout)
+    assert unbound["form"] == "tests.forms.TextInputForm"
+    assert unbound["state"] == "unbound"
+    assert errors["state"] == "errors"
+    assert errors["bytes"] > unbound["bytes"]
+    assert unbound["templates"] > 0
+    assert unbound["queries"] == 0
+    assert unbound["time"] > 0
+
+
+def test_no_forms():
+    with pytest.raises(CommandError, match="No forms found."):
+        profile("tests.forms.Missing")
+
+
+def test_max_time():
+    with pytest.raises(CommandError, match="2 checks failed."):
+        profile("tests.forms.TextInputForm", number=1, max_time=0)
+
+
+@pytest.fixture()
+def authorities():
+    with connection.schema_editor() as editor:
+        editor.create_model(Authority)
+    Authority.objects.create(name="One")
+    yield
+    with connection.schema_editor() as editor:
+        editor.delete_model(Authority)
+
+
+class AuthorityForm(TbxFormsMixin, forms.Form):
+    authority = forms.ModelChoiceField(
+        queryset=Authority.objects.all(), widget=forms.RadioSelect
+    )
+
+
+def test_max_queries(authorities):
+    path = get_form_path(AuthorityForm)
+    stdout, stderr = profile(path, number=1, json=True, max_queries=1)
+    assert [result["queries"] for result in json.loads(stdout)] == [1, 1]
+
+    with pytest.raises(CommandError, match="2 checks failed."):
+        profile(path, number=1, max_queries=0)
+
+
+def test_errors_are_reported():
+    class BrokenForm(TbxFormsMixin, forms.Form):
+        def __init__(self, *args, **kwargs):
+            raise ValueError("Broken")
+
+    try:
+        with pytest.raises(CommandError, match="2 checks failed."):
+            profile(get_form_path(BrokenForm))
+    finally:
+        unregister(BrokenForm)
+
+
+def test_forms_needing_arguments_are_skipped():
+    class UserForm(TbxFormsMixin, forms.Form):
+        def __init__(self, user, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+
+    class AbstractForm(TbxFormsMixin, forms.ModelForm):
+        pass
+
+    try:
+        stdout, stderr = profile(
+            get_form_path(UserForm), get_form_path(AbstractForm)
+        )
+    finally:
+        unregister(UserForm)
+        unregister(AbstractForm)
+    assert stdout == ""
+    assert "Skipped %s: it needs arguments" % get_form_path(UserForm) in stderr
+    assert "Skipped %s: it is a model form" % get_form_path(AbstractForm) in (
+        stderr
+    )
+
+
+def test_exclude():
+    stdout, stderr = profile(
+        "tests.forms.TextInput",
+        "tests.forms.Textarea",
+        exclude=["tests.forms.TextInput"],
+        number=1,
+        json=True,
+    )
+    assert [result["form"] for result in json.loads(stdout)] == [
+        "tests.forms.TextareaForm",
+        "tests.forms.TextareaForm",
+    ]
+
+    with pytest.raises(CommandError, match="No forms found."):
+        profile("tests.forms.TextInputForm", exclude=["tests.forms."])
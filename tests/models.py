@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class Authority(models.Model):
+    name = models.CharField(max_length=100)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class FormField(models.Model):
+    """
+    A form field definition like Wagtail's ``AbstractFormField``, with an
+    extra column.
+    """
+
+    sort_order = models.IntegerField(default=0)
+    page = models.ForeignKey(
+        Authority,
+        null=True,
+        on_delete=models.CASCADE,
+        related_name="form_fields",
+    )
+    clean_name = models.CharField(max_length=255)
+    label = models.CharField(max_length=255)
+    required = models.BooleanField(default=True)
+    placeholder = models.CharField(max_length=255, blank=True)
@@ -0,0 +1,74 @@
+"""
+Tests to verify form classes using tbxforms are registered.
+"""
+
+import gc
+
+from django import forms
+
+from tbxforms.forms import TbxFormsMixin
+from tbxforms.registry import (
+    get_form_classes,
+    get_form_path,
+    register,
+    unregister,
+)
+from tests.forms import (
+    BaseTestForm,
+    RadiosForm,
+    TextInputForm,
+)
+
+
+def test_forms_are_registered():
+    form_classes = get_form_classes()
+    assert TextInputForm in form_classes
+    assert RadiosForm in form_classes
+    assert BaseTestForm in form_classes
+    assert TbxFormsMixin not in form_classes
+
+
+def test_mixins_are_not_registered():
+    class ExtraMixin(TbxFormsMixin):
+        pass
+
+    assert ExtraMixin not in get_form_classes()
+
+
+def test_get_form_path():
+    assert get_form_path(TextInputForm) == "tests.forms.TextInputForm"
+
+
+def test_prefixes():
+    form_classes = get_form_classes(["tests.forms.Text"])
+    assert TextInputForm in form_classes
+    assert RadiosForm not in form_classes
+    assert get_form_classes(["tests.forms.Missing"]) == []
+
+
+def test_sorted_by_path():
+    paths = [get_form_path(form_class) for form_class in get_form_classes()]
+    assert paths == sorted(paths)
+
+
+def test_unregister():
+    class ExampleForm(TbxFormsMixin, forms.Form):
+        pass
+
+    assert ExampleForm in get_form_classes()
+    unregister(ExampleForm)
+    assert ExampleForm not in get_form_classes()
+    register(ExampleForm)
+    assert ExampleForm in get_form_classes()
+
+
+def test_classes_are_not_kept_alive():
+    def create():
+        class TemporaryForm(TbxFormsMixin, forms.Form):
+            pass
+
+        return get_form_path(TemporaryForm)
+
+    path = create()
+    gc.collect()
+    assert path not in [get_form_path(cls) for cls in get_form_classes()]
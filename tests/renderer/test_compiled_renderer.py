@@ -0,0 +1,277 @@
+"""
+Tests to verify the compiled renderer produces the same markup as the
+templates.
+"""
+
+from django import forms
+from django.test import override_settings
+from django.test.html import parse_html
+
+import pytest
+
+from tbxforms.layout import (
+    HTML,
+    Button,
+    Div,
+    Field,
+    Fieldset,
+    Layout,
+    Size,
+)
+from tbxforms.renderer import (
+    ContainerStep,
+    FieldStep,
+    LayoutObjectStep,
+    compile_step,
+    get_render_plan,
+)
+from tests.forms import (
+    BaseTestForm,
+    CheckboxesChoiceForm,
+    CheckboxesForm,
+    CheckboxForm,
+    DateInputForm,
+    FieldsetForm,
+    FileUploadForm,
+    RadiosChoiceForm,
+    RadiosForm,
+    SelectForm,
+    TextareaForm,
+    TextInputForm,
+)
+from tests.utils import render_form
+
+FORMS = (
+    CheckboxForm,
+    CheckboxesForm,
+    CheckboxesChoiceForm,
+    DateInputForm,
+    FieldsetForm,
+    FileUploadForm,
+    RadiosForm,
+    RadiosChoiceForm,
+    SelectForm,
+    TextInputForm,
+    TextareaForm,
+)
+
+
+class ContactForm(BaseTestForm):
+    name = forms.CharField(label="Name", help_text="Your full name")
+    email = forms.EmailField(label="Email", required=False)
+    method = forms.ChoiceField(
+        choices=(("email", "Email"), ("phone", "Phone")),
+        widget=forms.RadioSelect,
+        label="Method",
+    )
+    token = forms.CharField(widget=forms.HiddenInput, required=False)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.helper.layout = Layout(
+            HTML("<h2>{{ title }}</h2>"),
+            Fieldset(
+                Field.text("name", label_size=Size.MEDIUM),
+                Div("email", css_class="extra", css_id="contact"),
+                legend="Contact",
+                legend_size=Size.LARGE,
+                legend_tag="h1",
+            ),
+            Field.radios("method", inline=True, data_test="value"),
+            Button.primary("submit", "Send {{ title }}"),
+            Button.secondary("cancel", "Cancel", css_id="cancel_id"),
+        )
+
+
+def render(form_class, compiled, **kwargs):
+    data = kwargs.pop("data", None)
+    initial = kwargs.pop("initial", None)
+    form = form_class(data=data, initial=initial)
+    form.helper.compiled_layout = compiled
+    for name, value in kwargs.items():
+        setattr(form.helper, name, value)
+    if data is not None:
+        form.is_valid()
+    return parse_html(render_form(form, title="Contact us"))
+
+
+def assert_same(form_class, **kwargs):
+    expected = render(form_class, False, **dict(kwargs))
+    assert render(form_class, True, **dict(kwargs)) == expected
+    # Render again to check the cached plan gives the same result.
+    assert render(form_class, True, **dict(kwargs)) == expected
+
+
+@pytest.mark.parametrize("form_class", FORMS + (ContactForm,))
+class TestEquivalence:
+    def test_unbound(self, form_class):
+        assert_same(form_class)
+
+    def test_errors(self, form_class):
+        assert_same(form_class, data={})
+
+    def test_highlight_required_fields(self, form_class):
+        assert_same(form_class, highlight_required_fields=True)
+
+    def test_sizes(self, form_class):
+        assert_same(form_class, label_size=Size.SMALL, legend_size=Size.MEDIUM)
+
+    @override_settings(TBXFORMS_HIGHLIGHT_REQUIRED_FIELDS=True)
+    def test_highlight_required_fields_setting(self, form_class):
+        assert_same(form_class, data={})
+
+
+def test_initial_values():
+    """Verify selected choices and field values match."""
+    assert_same(CheckboxesChoiceForm, initial={"method": ["phone", "none"]})
+    assert_same(RadiosChoiceForm, initial={"method": "phone"})
+    assert_same(SelectForm, initial={"method": "text"})
+    assert_same(TextInputForm, initial={"name": "<b>Homer</b>"})
+
+
+def test_bound_values():
+    assert_same(ContactForm, data={"name": "Homer", "method": "phone"})
+    assert_same(
+        DateInputForm,
+        data={"date_0": "1", "date_1": "13", "date_2": "2007"},
+    )
+
+
+def test_character_count():
+    class CountForm(TextareaForm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout(
+                Field.textarea("description", max_words=10, threshold=50)
+            )
+
+    assert_same(CountForm)
+    assert_same(CountForm, data={})
+
+
+def test_unmentioned_fields():
+    class PartialForm(ContactForm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout("name")
+
+    assert_same(PartialForm)
+    assert_same(PartialForm, render_hidden_fields=True)
+    assert_same(PartialForm, render_unmentioned_fields=True)
+
+
+def test_plan_is_cached_per_layout():
+    form = ContactForm()
+    plan = get_render_plan(form, form.helper.layout)
+    assert get_render_plan(ContactForm(), form.helper.layout) is plan
+
+    form.helper.layout = Layout("name")
+    assert get_render_plan(form, form.helper.layout) is not plan
+
+
+def test_plan_is_shared_by_layouts_built_per_instance():
+    """
+    Verify forms building an identical layout in __init__ share the plan,
+    including the compiled HTML and Button templates.
+    """
+    form = ContactForm()
+    plan = get_render_plan(form, form.helper.layout)
+    other = ContactForm()
+    assert other.helper.layout.fields[0] is not form.helper.layout.fields[0]
+    assert get_render_plan(other, other.helper.layout) is plan
+
+
+def test_plan_is_rebuilt_when_structure_changes():
+    form = ContactForm()
+    plan = get_render_plan(form, form.helper.layout)
+
+    other = ContactForm()
+    other.helper.layout[1].css_class = "changed"
+    assert get_render_plan(other, other.helper.layout) is not plan
+
+    other = ContactForm()
+    other.helper.layout[0] = HTML("<h3>{{ title }}</h3>")
+    assert get_render_plan(other, other.helper.layout) is not plan
+
+
+def test_plan_does_not_use_changed_layout_objects():
+    form = ContactForm()
+    form.helper.compiled_layout = True
+    expected = render_form(form, title="Contact us")
+    form.helper.layout[1].fields[1].css_class = "changed"
+    form.helper.layout[3].value = "Changed"
+    other = ContactForm()
+    other.helper.compiled_layout = True
+    assert render_form(other, title="Contact us") == expected
+
+
+def test_uncompiled_objects_are_matched_by_identity():
+    class CustomForm(ContactForm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout(
+                Field("name", template="tests/field.html")
+            )
+
+    form = CustomForm()
+    plan = get_render_plan(form, form.helper.layout)
+    other = CustomForm()
+    assert get_render_plan(other, other.helper.layout) is not plan
+
+
+def test_compile_step():
+    assert isinstance(compile_step("name"), FieldStep)
+    assert isinstance(compile_step(Field.text("name")), FieldStep)
+    assert isinstance(compile_step(Layout("name")), ContainerStep)
+
+
+def test_custom_template_is_not_compiled():
+    field = Field("name", template="custom/field.html")
+    assert isinstance(compile_step(field), LayoutObjectStep)
+
+
+def test_field_wrapping_layout_objects_is_not_compiled():
+    field = Field(Div("name"))
+    assert isinstance(compile_step(field), LayoutObjectStep)
+
+
+def test_overridden_render_is_not_compiled():
+    class CustomDiv(Div):
+        def render(self, *args, **kwargs):
+            return "custom"
+
+    assert isinstance(compile_step(CustomDiv("name")), LayoutObjectStep)
+
+
+def test_conditional_fields():
+    class ConditionalForm(ContactForm):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.helper.layout = Layout(
+                Field.radios("method"),
+                Field.text(
+                    "email",
+                    data_conditional={
+                        "field_name": "method",
+                        "values": ["email"],
+                    },
+                ),
+                Fieldset(
+                    Div(
+                        "name",
+                        data_conditional={
+                            "field_name": "method",
+                            "values": ["phone"],
+                        },
+                    ),
+                    legend="Name",
+                    data_conditional={
+                        "field_name": "method",
+                        "values": ["email", "phone"],
+                    },
+                ),
+            )
+
+    assert_same(ConditionalForm)
+    assert_same(ConditionalForm, data={"method": "email"})
+    assert_same(ConditionalForm, data={"method": "phone"})
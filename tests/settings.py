@@ -2,9 +2,21 @@
 MVS (Minimalist Viable Settings) for running the tests.
 """
 
+import os
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    },
+}
+
+DEFAULT_AUTO_FIELD = "django.db.models.AutoField"
+
 INSTALLED_APPS = (
     "crispy_forms",
     "tbxforms",
+    "tests",
 )
 
 ROOT_URLCONF = "tests.urls"
@@ -18,8 +30,8 @@ TEMPLATES = [
     },
 ]
 
-CRISPY_ALLOWED_TEMPLATE_PACKS = ("tbxforms",)
+CRISPY_ALLOWED_TEMPLATE_PACKS = ("tbxforms", "tbxforms_flat")
 
-CRISPY_TEMPLATE_PACK = "tbxforms"
+CRISPY_TEMPLATE_PACK = os.environ.get("TBXFORMS_TEMPLATE_PACK", "tbxforms")
 
 CRISPY_FAIL_SILENTLY = False
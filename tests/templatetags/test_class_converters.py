@@ -0,0 +1,51 @@
+"""
+Tests to verify the CSS classes added to widgets are looked up correctly.
+"""
+
+from django import forms
+from django.test import override_settings
+
+from tbxforms.templatetags.tbxforms import get_widget_classes
+from tests.forms import TextInputForm
+from tests.utils import render_form
+
+
+def test_default_classes():
+    assert get_widget_classes(forms.TextInput) == (
+        "tbxforms-input",
+        "tbxforms-input--text",
+    )
+    assert get_widget_classes(forms.Select) == ("tbxforms-select",)
+
+
+def test_unknown_widget_uses_class_name():
+    class ColourInput(forms.TextInput):
+        pass
+
+    assert get_widget_classes(ColourInput) == ("colourinput",)
+
+
+def test_classes_are_cached():
+    assert get_widget_classes(forms.Textarea) is get_widget_classes(
+        forms.Textarea
+    )
+
+
+def test_setting_changes_classes():
+    assert get_widget_classes(forms.TextInput)[0] == "tbxforms-input"
+
+    with override_settings(
+        CRISPY_CLASS_CONVERTERS={"textinput": "custom-input extra"}
+    ):
+        assert get_widget_classes(forms.TextInput) == (
+            "custom-input",
+            "extra",
+        )
+        assert 'class="custom-input extra"' in render_form(TextInputForm())
+
+    assert get_widget_classes(forms.TextInput)[0] == "tbxforms-input"
+
+
+@override_settings(CRISPY_CLASS_CONVERTERS={"textinput": ""})
+def test_setting_removes_classes():
+    assert get_widget_classes(forms.TextInput) == ()
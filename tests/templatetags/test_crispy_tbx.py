@@ -0,0 +1,149 @@
+"""
+Tests to verify the crispy_tbx tag caches the HTML of unbound forms.
+"""
+
+from unittest import mock
+
+from django.core.cache import (
+    cache,
+    caches,
+)
+from django.template import (
+    Context,
+    Template,
+)
+from django.test import override_settings
+from django.utils import translation
+
+import pytest
+
+from tbxforms.helper import FormHelper
+from tests.forms import TextInputForm
+
+TEMPLATE = Template("{% load tbxforms %}{% crispy_tbx form %}")
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "tbxforms-tests",
+    }
+}
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    with override_settings(CACHES=CACHES):
+        cache.clear()
+        yield
+
+
+def render(form, csrf_token="token"):
+    return TEMPLATE.render(Context({"form": form, "csrf_token": csrf_token}))
+
+
+def cached_form(*args, **kwargs):
+    form = TextInputForm(*args, **kwargs)
+    form.helper.cache_unbound = True
+    return form
+
+
+def count_renders(*forms):
+    with mock.patch.object(
+        FormHelper, "render_layout", autospec=True, return_value=""
+    ) as render_layout:
+        for form in forms:
+            render(form)
+    return render_layout.call_count
+
+
+def test_same_as_crispy_tag():
+    expected = Template("{% load crispy_forms_tags %}{% crispy form %}")
+    context = Context({"form": TextInputForm(), "csrf_token": "token"})
+    assert render(cached_form()) == expected.render(context)
+    assert render(cached_form()) == expected.render(context)
+
+
+def test_unbound_form_is_cached():
+    assert count_renders(cached_form(), cached_form(), cached_form()) == 1
+
+
+def test_not_cached_by_default():
+    assert count_renders(TextInputForm(), TextInputForm()) == 2
+
+
+def test_bound_form_is_not_cached():
+    forms = (cached_form(data={}), cached_form(data={}))
+    assert count_renders(*forms) == 2
+
+
+def test_form_with_initial_values_is_not_cached():
+    forms = (
+        cached_form(initial={"name": "Homer"}),
+        cached_form(initial={"name": "Marge"}),
+    )
+    assert count_renders(*forms) == 2
+
+
+def test_csrf_token_is_added_to_cached_form():
+    render(cached_form(), csrf_token="first")
+    html = render(cached_form(), csrf_token="second")
+    assert 'name="csrfmiddlewaretoken" value="second"' in html
+    assert "first" not in html
+    assert "tbxforms:csrf_token" not in html
+
+
+def test_csrf_disabled():
+    form = cached_form()
+    form.helper.disable_csrf = True
+    html = render(form)
+    assert "csrfmiddlewaretoken" not in html
+    assert "csrfmiddlewaretoken" not in render(form)
+
+
+def test_cache_key_includes_language():
+    form = cached_form()
+    with translation.override("en"):
+        english = form.helper.get_cache_key(form)
+    with translation.override("fr"):
+        french = form.helper.get_cache_key(form)
+    assert english != french
+
+
+def test_cache_key_includes_helper_attributes():
+    form = cached_form()
+    key = form.helper.get_cache_key(form)
+    assert cached_form().helper.get_cache_key(form) == key
+
+    form.helper.label_size = "l"
+    assert form.helper.get_cache_key(form) != key
+
+
+def test_cache_key_includes_prefix_and_auto_id():
+    key = cached_form().helper.get_cache_key(cached_form())
+    for kwargs in ({"prefix": "other"}, {"auto_id": "field_%s"}):
+        form = cached_form(**kwargs)
+        assert form.helper.get_cache_key(form) != key
+
+
+def test_prefixed_forms_are_cached_separately():
+    render(cached_form())
+    html = render(cached_form(prefix="other", auto_id="field_%s"))
+    assert 'name="other-name"' in html
+    assert 'id="field_other-name"' in html
+
+
+@override_settings(
+    CACHES={
+        **CACHES,
+        "forms": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "tbxforms-forms",
+        },
+    },
+    TBXFORMS_FORM_CACHE="forms",
+)
+def test_cache_setting():
+    form = cached_form()
+    render(form)
+    assert caches["forms"].get(form.helper.get_cache_key(form)) is not None
+    assert cache.get(form.helper.get_cache_key(form)) is None
@@ -0,0 +1,53 @@
+"""
+Tests to verify the crispy_tbx_field tag resolves its arguments correctly.
+"""
+
+from django.template import Template
+
+from tests.forms import TextInputForm
+from tests.utils import render_template
+
+
+def test_attributes():
+    html = render_template(
+        '{% load tbxforms %}{% crispy_tbx_field field "data-test" value %}',
+        field=TextInputForm()["name"],
+        value="example",
+    )
+    assert 'data-test="example"' in html
+
+
+def test_attribute_filters():
+    html = render_template(
+        "{% load tbxforms %}"
+        '{% crispy_tbx_field field "data-test" value|upper %}',
+        field=TextInputForm()["name"],
+        value="example",
+    )
+    assert 'data-test="EXAMPLE"' in html
+
+
+def get_field():
+    form = TextInputForm()
+    form.use_required_attribute = False
+    return form["name"]
+
+
+def test_html5_required():
+    template = "{% load tbxforms %}{% crispy_tbx_field field %}"
+    html = render_template(template, field=get_field())
+    assert "required" not in html
+
+    html = render_template(template, field=get_field(), html5_required=True)
+    assert 'required="required"' in html
+
+
+def test_expressions_are_compiled_when_parsed():
+    template = Template(
+        '{% load tbxforms %}{% crispy_tbx_field field "data-test" value %}'
+    )
+    node = template.nodelist[-1]
+    assert node.field.var.var == "field"
+    assert [(name.token, value.token) for name, value in node.attrs] == [
+        ('"data-test"', "value")
+    ]
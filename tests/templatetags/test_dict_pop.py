@@ -0,0 +1,34 @@
+"""
+Tests to verify date widget templates which extract the labels of the fields
+with the dict_pop filter, as the original template did, still work.
+"""
+
+from django.forms.renderers import get_default_renderer
+
+from tbxforms.widgets import DateInputWidget
+
+TEMPLATE = """{% load tbxforms %}
+{% for subwidget in widget.subwidgets %}
+<label for="{{ subwidget.attrs.id }}">{{ subwidget.attrs|dict_pop:"label" }}</label>
+{% include subwidget.template_name with widget=subwidget %}
+{% endfor %}"""  # noqa: E501
+
+
+def test_dict_pop_returns_the_extracted_label():
+    widget = DateInputWidget()
+    context = widget.get_context("date", None, {"id": "id_date"})
+    template = get_default_renderer().engine.from_string(TEMPLATE)
+    html = template.render(context)
+
+    for label in ("Day", "Month", "Year"):
+        assert f">{label}</label>" in html
+    assert " label=" not in html
+
+
+def test_dict_pop_still_removes_other_keys():
+    widget = DateInputWidget()
+    context = widget.get_context("date", None, {"id": "id_date"})
+    attrs = context["widget"]["subwidgets"][0]["attrs"]
+
+    assert attrs.pop("pattern") == "[0-9]*"
+    assert "pattern" not in attrs
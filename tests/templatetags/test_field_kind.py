@@ -0,0 +1,48 @@
+"""
+Tests to verify fields are classified correctly for rendering.
+"""
+
+from django import forms
+
+import pytest
+
+from tbxforms.fields import DateInputField
+from tbxforms.templatetags.tbxforms import (
+    CHECKBOX,
+    CHECKBOXES,
+    INPUT,
+    MULTIVALUE,
+    RADIOS,
+    field_kind,
+    get_field_kind,
+)
+
+
+@pytest.mark.parametrize(
+    ("widget", "kind"),
+    (
+        (forms.CheckboxInput(), CHECKBOX),
+        (forms.CheckboxSelectMultiple(), CHECKBOXES),
+        (forms.RadioSelect(), RADIOS),
+        (forms.Select(), INPUT),
+        (forms.TextInput(), INPUT),
+        (forms.Textarea(), INPUT),
+        (forms.SplitDateTimeWidget(), MULTIVALUE),
+    ),
+)
+def test_widget_kind(widget, kind):
+    assert get_field_kind(widget) == kind
+
+
+def test_input_type_changes_kind():
+    widget = forms.RadioSelect()
+    widget.input_type = "text"
+    assert get_field_kind(widget) == INPUT
+    assert get_field_kind(forms.RadioSelect()) == RADIOS
+
+
+def test_field_kind_filter():
+    class ExampleForm(forms.Form):
+        date = DateInputField()
+
+    assert field_kind(ExampleForm()["date"]) == MULTIVALUE
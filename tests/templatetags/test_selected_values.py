@@ -0,0 +1,60 @@
+"""
+Tests to verify the selected values of a field are normalised correctly.
+"""
+
+import re
+
+from django import forms
+
+import pytest
+
+from tbxforms.templatetags.tbxforms import selected_values
+from tests.forms import (
+    BaseTestForm,
+    CheckboxesForm,
+    RadiosForm,
+)
+from tests.utils import render_form
+
+
+class NumbersForm(BaseTestForm):
+    numbers = forms.TypedMultipleChoiceField(
+        choices=[(number, str(number)) for number in range(1, 21)],
+        coerce=int,
+        widget=forms.CheckboxSelectMultiple,
+    )
+
+
+@pytest.mark.parametrize(
+    ("initial", "expected"),
+    (
+        (None, frozenset()),
+        ("email", frozenset({"email"})),
+        (["email", "text"], frozenset({"email", "text"})),
+        ([1, 2], frozenset({"1", "2"})),
+        (3, frozenset({"3"})),
+    ),
+)
+def test_selected_values(initial, expected):
+    form = CheckboxesForm(initial={"method": initial})
+    assert selected_values(form["method"]) == expected
+
+
+def test_checkboxes_checked():
+    form = NumbersForm(initial={"numbers": [2, 11]})
+    html = render_form(form)
+    checked = re.findall(r'value="(\d+)"\s+checked="checked"', html)
+    assert checked == ["2", "11"]
+
+
+def test_checkboxes_substring_not_checked():
+    """Verify a choice is not checked because it is part of the value."""
+    form = CheckboxesForm(initial={"method": "phone"})
+    form.fields["method"].choices = [("phone", "Phone"), ("one", "One")]
+    assert render_form(form).count('checked="checked"') == 1
+
+
+def test_radios_checked():
+    form = RadiosForm(data={"method": "text"})
+    html = render_form(form)
+    assert html.count('checked="checked"') == 1
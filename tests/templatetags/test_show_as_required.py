@@ -0,0 +1,76 @@
+"""
+Tests to verify the fields shown as required are worked out once per form.
+"""
+
+from django import forms
+
+from tbxforms.templatetags.tbxforms import show_as_required
+from tests.forms import BaseTestForm
+from tests.utils import render_form
+
+
+class StaticForm(BaseTestForm):
+    name = forms.CharField(label="Name")
+    email = forms.CharField(label="Email", required=False)
+    phone = forms.CharField(label="Phone", required=False)
+
+    calls = 0
+
+    @staticmethod
+    def conditional_fields_to_show_as_required():
+        StaticForm.calls += 1
+        return ["phone"]
+
+
+class DynamicForm(BaseTestForm):
+    name = forms.CharField(label="Name")
+    email = forms.CharField(label="Email", required=False)
+    phone = forms.CharField(label="Phone", required=False)
+
+    def __init__(self, *args, conditional=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.conditional = conditional
+        self.calls = 0
+
+    def conditional_fields_to_show_as_required(self):
+        self.calls += 1
+        return self.conditional
+
+
+def test_fields_shown_as_required():
+    form = StaticForm()
+    assert form.fields_shown_as_required == frozenset({"name", "phone"})
+    assert show_as_required(form["name"])
+    assert not show_as_required(form["email"])
+    assert show_as_required(form["phone"])
+
+
+def test_static_method_called_once_per_class():
+    StaticForm.calls = 0
+    render_form(StaticForm())
+    render_form(StaticForm())
+    assert StaticForm.calls <= 1
+
+
+def test_method_called_once_per_instance():
+    form = DynamicForm(conditional=["email"])
+    html = render_form(form)
+    assert form.calls == 1
+    assert form.fields_shown_as_required == frozenset({"name", "email"})
+    assert html.count("(optional)") == 1
+
+    other = DynamicForm(conditional=["phone"])
+    assert other.fields_shown_as_required == frozenset({"name", "phone"})
+
+
+def test_forms_without_mixin():
+    class PlainForm(forms.Form):
+        name = forms.CharField()
+        email = forms.CharField(required=False)
+
+        def conditional_fields_to_show_as_required(self):
+            return ["email"]
+
+    form = PlainForm()
+    assert show_as_required(form["name"])
+    assert show_as_required(form["email"])
@@ -1,5 +1,6 @@
 import io
 import os
+import re
 
 import django
 
@@ -47,22 +48,39 @@ def parse_contents(*args):
     return parse_html(get_contents(*args))
 
 
+# Django 5.0+ adds aria-invalid="true" to the widgets of fields with errors.
+# It is removed so the snapshots are the same for every version of Django.
+ARIA_INVALID = re.compile(r'\s+aria-invalid="true"')
+
+
+def format_html(html):
+    """
+    Format rendered HTML the same way for every version of Django.
+    """
+    if django.VERSION >= (5, 0):
+        html = ARIA_INVALID.sub("", html)
+    return djlint.reformat.formatter(DJLINT_CONF, html)
+
+
 def render_template(template, **kwargs):
     """
     Render a Django Template
     """
-    return djlint.reformat.formatter(
-        DJLINT_CONF, Template(template).render(Context(kwargs))
-    )
+    return format_html(Template(template).render(Context(kwargs)))
+
+
+# Set TBXFORMS_COMPILED_LAYOUT to render every form with the compiled
+# renderer, so it is checked against the same snapshots as the templates.
+COMPILED_LAYOUT = bool(os.environ.get("TBXFORMS_COMPILED_LAYOUT"))
 
 
 def render_form(form, **kwargs):
     """
     Render a form as the `crispy' template tag does
     """
-    return djlint.reformat.formatter(
-        DJLINT_CONF, render_crispy_form(form, context=kwargs)
-    )
+    if COMPILED_LAYOUT and hasattr(form, "helper"):
+        form.helper.compiled_layout = True
+    return format_html(render_crispy_form(form, context=kwargs))
 
 
 class SingleHTMLFileExtension(SingleFileSnapshotExtension):
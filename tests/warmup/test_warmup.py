@@ -0,0 +1,161 @@
+"""
+Tests to verify the templates and forms are loaded when Django starts.
+"""
+
+import logging
+
+from django import forms
+from django.apps import apps
+from django.conf import settings
+from django.template import engines
+from django.test import override_settings
+
+import pytest
+
+from tbxforms.warmup import (
+    QueryBlocked,
+    get_template_names,
+    get_template_packs,
+    uses_queryset,
+    warm_forms,
+    warm_templates,
+    warm_up,
+)
+from tests.forms import (
+    BaseTestForm,
+    RadiosForm,
+    TextInputForm,
+)
+from tests.models import Authority
+
+
+class AuthorityForm(BaseTestForm):
+    authority = forms.ModelChoiceField(Authority.objects.all())
+
+
+class QueryForm(BaseTestForm):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        list(Authority.objects.all())
+
+
+class BrokenForm(BaseTestForm):
+    def __init__(self, *args, **kwargs):
+        raise ValueError("Broken")
+
+
+@pytest.fixture()
+def template_cache():
+    """
+    Empty the cache of the template loader and return it.
+    """
+    loader = engines["django"].engine.template_loaders[0]
+    loader.reset()
+    yield loader.get_template_cache
+    loader.reset()
+
+
+def test_get_template_names():
+    names = get_template_names("tbxforms")
+    assert "tbxforms/whole_uni_form.html" in names
+    assert "tbxforms/layout/radios.html" in names
+    assert "tbxforms_flat/field.html" in get_template_names("tbxforms_flat")
+
+
+def test_get_template_packs():
+    with override_settings(CRISPY_TEMPLATE_PACK="tbxforms_flat"):
+        assert get_template_packs() == ("tbxforms_flat",)
+    with override_settings(CRISPY_TEMPLATE_PACK="bootstrap5"):
+        assert get_template_packs() == ("tbxforms", "tbxforms_flat")
+
+
+def test_warm_templates(template_cache):
+    names = warm_templates(["tbxforms"])
+    assert "tbxforms/field.html" in names
+    assert "tbxforms/widgets/date.html" in names
+    assert "tbxforms/field.html" in template_cache
+    assert "tbxforms/layout/help_text.html" in template_cache
+    assert "tbxforms_flat/field.html" not in template_cache
+
+
+def test_warm_forms():
+    assert warm_forms(["tests.forms.TextInputForm", RadiosForm]) == [
+        TextInputForm,
+        RadiosForm,
+    ]
+    assert TextInputForm._helper_prototype is not None
+
+
+def test_uses_queryset():
+    assert uses_queryset(AuthorityForm)
+    assert not uses_queryset(TextInputForm)
+
+
+def test_warm_forms_skips_querysets():
+    """
+    Verify forms with choices from the database are not rendered, as the
+    tables may not exist yet, e.g. when running ``migrate``.
+    """
+    assert warm_forms([AuthorityForm, TextInputForm]) == [TextInputForm]
+
+
+def test_warm_forms_blocks_queries(caplog):
+    with caplog.at_level(logging.WARNING, logger="tbxforms.warmup"):
+        assert warm_forms([QueryForm, TextInputForm]) == [TextInputForm]
+    assert caplog.records[0].exc_info[0] is QueryBlocked
+
+
+def test_warm_forms_with_queries(caplog):
+    """
+    Verify a form which fails, here because its table does not exist, is
+    logged rather than stopping Django from starting.
+    """
+    with caplog.at_level(logging.WARNING, logger="tbxforms.warmup"):
+        assert warm_forms([AuthorityForm], queries=True) == []
+    assert "AuthorityForm" in caplog.records[0].getMessage()
+
+
+def test_warm_forms_logs_errors(caplog):
+    with caplog.at_level(logging.WARNING, logger="tbxforms.warmup"):
+        warmed = warm_forms(["tests.forms.Missing", BrokenForm, RadiosForm])
+    assert warmed == [RadiosForm]
+    assert len(caplog.records) == 2
+
+
+def test_warm_up_disabled(template_cache):
+    warm_up()
+    assert not template_cache
+
+
+@override_settings(
+    TBXFORMS_WARM_UP=True,
+    TBXFORMS_WARM_UP_FORMS=["tests.forms.TextInputForm"],
+)
+def test_warm_up_on_ready(template_cache):
+    apps.get_app_config("tbxforms").ready()
+    template_pack = settings.CRISPY_TEMPLATE_PACK
+    assert "%s/whole_uni_form.html" % template_pack in template_cache
+    assert "%s/layout/radios.html" % template_pack in template_cache
+
+
+@override_settings(
+    TBXFORMS_WARM_UP=True,
+    TBXFORMS_WARM_UP_FORMS=[AuthorityForm, QueryForm, BrokenForm],
+)
+def test_warm_up_on_ready_without_tables():
+    """
+    Verify Django starts when the forms cannot be rendered, e.g. before the
+    database tables are created.
+    """
+    apps.get_app_config("tbxforms").ready()
+
+
+@override_settings(TBXFORMS_WARM_UP=True, TBXFORMS_WARM_UP_FORMS="__all__")
+def test_warm_up_all_forms(template_cache):
+    """
+    Verify every registered form is warmed up, including the forms defined
+    by other test modules whose tables do not exist.
+    """
+    TextInputForm._helper_prototype = None
+    warm_up()
+    assert TextInputForm._helper_prototype is not None